@@ -3,25 +3,46 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
-from flask import Flask, abort, send_from_directory
+from flask import Flask, abort, request, send_from_directory
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 
+from .assets import AssetPipeline
 from .config import Settings
 from .routes import api_bp
+from .warmup import start_warm_up
 
 
 load_dotenv()
 
+FRONTEND_FILES = (
+    "index.html",
+    "chat.html",
+    "dashboard.html",
+    "about.html",
+    "style.css",
+    "chat.js",
+    "dashboard.js",
+)
 
-def create_app(settings: Settings | None = None) -> Flask:
-    """Configure and return a Flask app instance."""
+
+def create_app(settings: Settings | None = None, warm_up: bool | None = None) -> Flask:
+    """Configure and return a Flask app instance.
+
+    With ``warm_up`` (default: the ``WARM_UP`` setting) the heavy provider
+    SDKs and datasets are preloaded on a background thread after start-up.
+    """
     config = settings or Settings()
 
     frontend_root = Path(__file__).resolve().parents[2]
     app = Flask(__name__)
     app.config.update(config.to_flask_config())
+    if config.trusted_proxies > 0:
+        # Behind a load balancer (e.g. Render) ``remote_addr`` is the proxy; take the client from X-Forwarded-For.
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=config.trusted_proxies, x_proto=config.trusted_proxies)
 
     CORS(
         app,
@@ -31,27 +52,44 @@ def create_app(settings: Settings | None = None) -> Flask:
 
     app.register_blueprint(api_bp, url_prefix="/api")
 
+    # Without the pipeline files are read from disk on every hit, which picks up edits during development.
+    assets = AssetPipeline(frontend_root, FRONTEND_FILES).build() if config.static_pipeline_enabled else None
+    app.extensions["assets"] = assets
+
     @app.route("/")
-    def index() -> str:
+    def index():
         """Serve the landing page for the integrated frontend."""
-        return send_from_directory(frontend_root, "index.html")
+        return frontend_assets("index.html")
 
     @app.route("/<path:filename>")
     def frontend_assets(filename: str):
         """Serve whitelisted frontend assets located at the project root."""
-        allowed_files = {
-            "index.html",
-            "chat.html",
-            "dashboard.html",
-            "about.html",
-            "style.css",
-            "chat.js",
-            "dashboard.js",
-        }
-
-        if filename in allowed_files:
+        if assets is not None:
+            response = assets.respond(filename, request.headers.get("Accept-Encoding", ""), request.if_none_match)
+            if response is not None:
+                return response
+        elif filename in FRONTEND_FILES:
             return send_from_directory(frontend_root, filename)
 
         abort(404)
 
+    if config.warm_up if warm_up is None else warm_up:
+        start_warm_up(app)
+
     return app
+
+
+def start_background_tasks(app: Flask) -> None:
+    """Start the dataset refresh loop when ``SYNC_ENABLED`` is set.
+
+    Call this once from the serving process (``run.py`` or the ASGI
+    lifespan); ``create_app`` itself never starts threads.
+    """
+    if app.config.get("SYNC_ENABLED", True):
+        app.extensions["sync_scheduler"].start()
+
+
+def stop_background_tasks(app: Flask, timeout: Optional[float] = 1.0) -> None:
+    """Stop the refresh loop and flush any queued feedback."""
+    app.extensions["sync_scheduler"].stop(timeout=timeout)
+    app.extensions["feedback"].stop()
@@ -0,0 +1,212 @@
+"""ASGI entry point serving ``/api/chat`` natively on asyncio.
+
+Every other route is delegated to the Flask application through asgiref's
+WSGI adapter, so one process can hold many in-flight chats while they wait
+on translation, Gemini and health APIs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import nullcontext
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Tuple
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+
+from . import create_app, start_background_tasks, stop_background_tasks
+from .async_chat import async_chat_with_bot
+from .routes import _check_client, _open_conversation, _resolve_chat_language
+from .services.admission import AdmissionRejected
+from .services.async_clients import (
+    AsyncGeminiClient,
+    AsyncHealthDataService,
+    AsyncTranslationService,
+    BlockingCallRunner,
+)
+from .services.health_data import HealthDataError
+from .services.llm import GeminiClientError
+from .services.translation import TranslationServiceError
+from .utils.metrics import collect_timings, stage_span
+
+logger = logging.getLogger(__name__)
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+MAX_BODY_BYTES = 64 * 1024
+
+
+class NirogiASGI:
+    """ASGI application wrapping a configured Flask app."""
+
+    def __init__(self, flask_app: Flask) -> None:
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        extensions = flask_app.extensions
+        self.runner = BlockingCallRunner(max_workers=flask_app.config.get("ASYNC_IO_THREADS", 64))
+        self.translation_service = AsyncTranslationService(extensions["translation_service"], self.runner)
+        self.health_service = AsyncHealthDataService(extensions["health_data_service"], self.runner)
+        self.llm_service = AsyncGeminiClient(extensions["gemini_client"], self.runner)
+        self.trusted_proxies = int(flask_app.config.get("TRUSTED_PROXIES", 0))
+        origins = str(flask_app.config.get("CORS_ORIGINS", "*"))
+        self.allowed_origins = {origin.strip() for origin in origins.split(",") if origin.strip()}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http" and scope["path"] == "/api/chat" and scope["method"] == "POST":
+            await self._chat(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                start_background_tasks(self.flask_app)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                stop_background_tasks(self.flask_app)
+                self.runner.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _chat(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive)
+        if body is None:
+            await self._respond(scope, send, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "request body is too large"})
+            return
+
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        status, payload = await self.handle_chat(data, client_id=_client_address(scope, self.trusted_proxies))
+        await self._respond(scope, send, status, payload)
+
+    async def handle_chat(self, data: Dict[str, Any], client_id: Optional[str] = None) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        """Validate a ``/api/chat`` payload and run the async pipeline, mirroring ``routes.chat``."""
+        message = (data.get("message") or "").strip()
+        if not message:
+            return HTTPStatus.BAD_REQUEST, {"error": "message is required"}
+
+        requested_language = (data.get("language") or "").strip().lower()
+
+        try:
+            language_guess = _resolve_chat_language(message, requested_language)
+        except ValueError:
+            invalid_lang = requested_language or "auto-detected"
+            return HTTPStatus.BAD_REQUEST, {"error": f"Language '{invalid_lang}' is not supported yet."}
+
+        extensions = self.flask_app.extensions
+        try:
+            _check_client(extensions.get("admission"), client_id)
+        except AdmissionRejected as exc:
+            return HTTPStatus.TOO_MANY_REQUESTS, {"error": str(exc), "retry_after": exc.retry_after}
+
+        conversation, context_token = _open_conversation(extensions.get("session_store"), data)
+        try:
+            with collect_timings() if data.get("timings") else nullcontext() as timings, stage_span("chat"):
+                result = await async_chat_with_bot(
+                    message=message,
+                    language=language_guess.language,
+                    translation_service=self.translation_service,
+                    health_service=self.health_service,
+                    llm_service=self.llm_service,
+                    context=context_token,
+                    answer_cache=extensions.get("answer_cache"),
+                    intent_router=extensions.get("intent_router"),
+                    render_modes=extensions.get("tool_render_modes"),
+                    compactor=extensions.get("payload_compactor"),
+                    conversation=conversation,
+                    pipeline_modes=extensions.get("pipeline_modes"),
+                )
+        except TranslationServiceError as exc:
+            logger.exception("Translation failed.")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+        except HealthDataError as exc:
+            logger.exception("Health data retrieval failed.")
+            return HTTPStatus.BAD_GATEWAY, {"error": str(exc)}
+        except GeminiClientError as exc:
+            logger.exception("Gemini request failed.")
+            return HTTPStatus.BAD_GATEWAY, {"error": str(exc)}
+        except AdmissionRejected as exc:
+            logger.warning("Chat request shed: %s", exc.reason)
+            return HTTPStatus.TOO_MANY_REQUESTS, {"error": str(exc), "retry_after": exc.retry_after}
+
+        result["metadata"]["language_detection"] = language_guess.to_metadata()
+        if conversation is not None:
+            result["session_id"] = conversation.session_id
+        if timings is not None:
+            result["metadata"]["timings_ms"] = timings
+        return HTTPStatus.OK, result
+
+    async def _respond(self, scope: Scope, send: Send, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ]
+        if status == HTTPStatus.TOO_MANY_REQUESTS and "retry_after" in payload:
+            headers.append((b"retry-after", str(payload["retry_after"]).encode("ascii")))
+        origin = _header(scope, b"origin")
+        if origin and ("*" in self.allowed_origins or origin in self.allowed_origins):
+            # Mirror Flask-CORS with ``supports_credentials=True``.
+            headers += [
+                (b"access-control-allow-origin", origin.encode("latin-1")),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+        await send({"type": "http.response.start", "status": int(status), "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive: Receive) -> Optional[bytes]:
+    """Read the request body, returning ``None`` when it exceeds ``MAX_BODY_BYTES``."""
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+def _client_address(scope: Scope, trusted_proxies: int) -> Optional[str]:
+    """Return the caller's address, read from X-Forwarded-For behind ``trusted_proxies`` proxies like ``ProxyFix``."""
+    client = scope.get("client")
+    address = client[0] if client else None
+    forwarded_for = _header(scope, b"x-forwarded-for") if trusted_proxies > 0 else None
+    if forwarded_for:
+        hops = forwarded_for.split(",")
+        if len(hops) >= trusted_proxies:
+            address = hops[-trusted_proxies].strip() or address
+    return address
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def create_asgi_app(flask_app: Optional[Flask] = None) -> NirogiASGI:
+    """Wrap ``flask_app`` (or a newly created one) in the async entry point."""
+    if flask_app is None:
+        flask_app = create_app()
+    return NirogiASGI(flask_app)
@@ -0,0 +1,160 @@
+"""Fingerprinted, precompressed frontend assets served from memory."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from flask import Response
+from werkzeug.datastructures import ETags
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available.
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Preferred encoding first when the client accepts several at the same quality.
+_ENCODINGS = ("br", "gzip")
+_COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml")
+_REFERENCE = re.compile(r'(?P<attr>href|src)="(?P<name>[^"/:]+)"')
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    """One file's bytes in every encoding worth sending, plus its content hash."""
+
+    name: str
+    mimetype: str
+    digest: str
+    variants: Dict[str, bytes]
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """Return ``name`` with the short content hash before its extension, e.g. ``style.3f2a9c1b0d4e.css``."""
+    stem, dot, extension = name.rpartition(".")
+    return f"{stem}.{digest}.{extension}" if dot else f"{name}.{digest}"
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    """Pick the best encoding in ``available`` for an ``Accept-Encoding`` header, or ``identity``."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = "identity", 0.0
+    for coding in _ENCODINGS:
+        if coding not in available:
+            continue
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def _compress(body: bytes, mimetype: str) -> Dict[str, bytes]:
+    variants = {"identity": body}
+    if not mimetype.startswith(_COMPRESSIBLE):
+        return variants
+    candidates = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        candidates["br"] = brotli.compress(body, quality=11)
+    # Only keep encodings that actually save bytes.
+    variants.update({coding: data for coding, data in candidates.items() if len(data) < len(body)})
+    return variants
+
+
+class AssetPipeline:
+    """Load whitelisted files once, fingerprint them and serve the best precompressed variant.
+
+    Stylesheets and scripts are also published under a content-hashed name
+    (``style.<hash>.css``) with a one-year immutable ``Cache-Control``, and
+    HTML pages are rewritten to reference those names. Pages and the plain
+    names keep ``no-cache`` so browsers revalidate them with the ETag and get
+    a 304 while nothing has changed. Everything is held in memory, so
+    serving an asset never touches the disk.
+    """
+
+    def __init__(self, root: Path, files: Iterable[str]) -> None:
+        self.root = Path(root)
+        self.files = sorted(set(files))
+        self._routes: Dict[str, Tuple[Asset, str]] = {}
+        self.urls: Dict[str, str] = {}
+
+    def build(self) -> "AssetPipeline":
+        """Read, fingerprint and compress every file; pages are processed after what they reference."""
+        pages = [name for name in self.files if name.endswith(".html")]
+        for name in [name for name in self.files if name not in pages] + pages:
+            path = self.root / name
+            try:
+                body = path.read_bytes()
+            except OSError:
+                logger.warning("Frontend asset %s is missing; it will return 404.", name)
+                continue
+            if name in pages:
+                body = self._rewrite_references(body)
+            self._add(name, body)
+        logger.info("Prepared %d frontend assets (brotli %s).", len(self.urls), "on" if brotli else "off")
+        return self
+
+    def _rewrite_references(self, body: bytes) -> bytes:
+        def replace(match: "re.Match[str]") -> str:
+            url = self.urls.get(match.group("name"))
+            return f'{match.group("attr")}="{url}"' if url and not url.endswith(".html") else match.group(0)
+
+        return _REFERENCE.sub(replace, body.decode("utf-8")).encode("utf-8")
+
+    def _add(self, name: str, body: bytes) -> None:
+        mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if mimetype.startswith("text/") or mimetype == "application/javascript":
+            mimetype += "; charset=utf-8"
+        asset = Asset(name, mimetype, hashlib.sha256(body).hexdigest()[:12], _compress(body, mimetype))
+        self._routes[name] = (asset, REVALIDATE)
+        self.urls[name] = name
+        if not name.endswith(".html"):
+            hashed = fingerprinted_name(name, asset.digest)
+            self._routes[hashed] = (asset, IMMUTABLE)
+            self.urls[name] = hashed
+
+    def respond(self, path: str, accept_encoding: str, if_none_match: Optional[ETags] = None) -> Optional[Response]:
+        """Return the response for ``path``, or ``None`` if it is not a known asset."""
+        route = self._routes.get(path)
+        if route is None:
+            return None
+        asset, cache_control = route
+        encoding = choose_encoding(accept_encoding, asset.variants)
+        etag = asset.digest if encoding == "identity" else f"{asset.digest}-{encoding}"
+        headers = {"ETag": f'"{etag}"', "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if if_none_match is not None and if_none_match.contains_weak(etag):
+            return Response(status=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(asset.variants[encoding], content_type=asset.mimetype, headers=headers)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Return the published URL and per-encoding size of each asset."""
+        return {
+            name: {"url": url, "bytes": {coding: len(data) for coding, data in self._routes[name][0].variants.items()}}
+            for name, url in self.urls.items()
+        }
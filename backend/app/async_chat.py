@@ -0,0 +1,95 @@
+"""Asyncio implementation of the chat pipeline used by the ASGI entry point."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from .services.answer_cache import AnswerCache
+from .services.async_clients import AsyncGeminiClient, AsyncHealthDataService, AsyncTranslationService
+from .services.chat_pipeline import HEALTH, LLM, TRANSLATION, Call, ChatSteps, Prefetch, chat_steps
+from .services.compaction import PayloadCompactor
+from .services.intent_router import IntentRouter
+from .services.sessions import Conversation
+
+logger = logging.getLogger(__name__)
+
+
+def _start_prefetch(call: Call, services: Dict[str, Any]) -> "asyncio.Task[Any]":
+    """Start ``call`` in the background ahead of the pipeline asking for it."""
+    task = asyncio.ensure_future(call.invoke(services))
+    # An unused speculative fetch must not log "exception was never retrieved".
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+    return task
+
+
+async def _run_steps(steps: ChatSteps, services: Dict[str, Any]) -> Dict[str, Any]:
+    """Drive ``steps`` by awaiting the async clients, starting prefetch hints as tasks."""
+    prefetched: Optional[Call] = None
+    prefetch_task: Optional["asyncio.Task[Any]"] = None
+    prefetch_hit = False
+    result: Any = None
+    error: Optional[Exception] = None
+    try:
+        while True:
+            try:
+                effect = steps.throw(error) if error is not None else steps.send(result)
+            except StopIteration as finished:
+                payload = finished.value
+                break
+            result, error = None, None
+            if isinstance(effect, Prefetch):
+                if prefetch_task is None:
+                    prefetched, prefetch_task = effect.call, _start_prefetch(effect.call, services)
+                continue
+            try:
+                if prefetch_task is not None and not prefetch_hit and effect == prefetched:
+                    prefetch_hit = True
+                    result = await prefetch_task
+                else:
+                    result = await effect.invoke(services)
+            except Exception as exc:
+                error = exc
+    finally:
+        if prefetch_task is not None and not prefetch_task.done():
+            prefetch_task.cancel()
+
+    if prefetch_hit:
+        payload["metadata"]["prefetch"] = "hit"
+    return payload
+
+
+async def async_chat_with_bot(
+    message: str,
+    language: str,
+    translation_service: AsyncTranslationService,
+    health_service: AsyncHealthDataService,
+    llm_service: AsyncGeminiClient,
+    context: Optional[str] = None,
+    answer_cache: Optional[AnswerCache] = None,
+    intent_router: Optional[IntentRouter] = None,
+    render_modes: Optional[Dict[str, str]] = None,
+    compactor: Optional[PayloadCompactor] = None,
+    conversation: Optional[Conversation] = None,
+    pipeline_modes: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Asyncio version of ``routes.chat_with_bot`` returning the same payload.
+
+    Blocking upstream calls are awaited instead of holding a worker, and tool
+    data that the local router expects is fetched speculatively while the
+    message is translated and sent to Gemini.
+    """
+    steps = chat_steps(
+        message,
+        language,
+        context=context,
+        answer_cache=answer_cache,
+        intent_router=intent_router,
+        render_modes=render_modes,
+        compactor=compactor,
+        conversation=conversation,
+        pipeline_modes=pipeline_modes,
+    )
+    services = {TRANSLATION: translation_service, HEALTH: health_service, LLM: llm_service}
+    return await _run_steps(steps, services)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 
 @dataclass(slots=True)
@@ -13,20 +13,108 @@ class Settings:
 
     gemini_api_key: Optional[str] = field(default_factory=lambda: os.getenv("GEMINI_API_KEY"))
     gemini_model: str = field(default_factory=lambda: os.getenv("GEMINI_MODEL", "gemini-1.5-flash"))
+    gemini_context_cache_ttl: float = field(default_factory=lambda: float(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "0")))
+    gemini_max_in_flight: int = field(default_factory=lambda: int(os.getenv("GEMINI_MAX_IN_FLIGHT", "4")))
+    gemini_max_queue: int = field(default_factory=lambda: int(os.getenv("GEMINI_MAX_QUEUE", "32")))
+    gemini_queue_timeout: float = field(default_factory=lambda: float(os.getenv("GEMINI_QUEUE_TIMEOUT", "10")))
+    client_rate_limit: float = field(default_factory=lambda: float(os.getenv("CLIENT_RATE_LIMIT", "0")))
+    client_burst: int = field(default_factory=lambda: int(os.getenv("CLIENT_BURST", "10")))
+    trusted_proxies: int = field(default_factory=lambda: int(os.getenv("TRUSTED_PROXIES", "0")))
+    dashboard_max_age: int = field(default_factory=lambda: int(os.getenv("DASHBOARD_MAX_AGE", "60")))
+    feedback_store_path: Optional[str] = field(default_factory=lambda: os.getenv("FEEDBACK_STORE_PATH"))
+    feedback_max_queue: int = field(default_factory=lambda: int(os.getenv("FEEDBACK_MAX_QUEUE", "1000")))
+    feedback_batch_size: int = field(default_factory=lambda: int(os.getenv("FEEDBACK_BATCH_SIZE", "100")))
+    feedback_flush_interval: float = field(default_factory=lambda: float(os.getenv("FEEDBACK_FLUSH_INTERVAL", "1")))
+    static_pipeline_enabled: bool = field(default_factory=lambda: os.getenv("STATIC_PIPELINE_ENABLED", "1") == "1")
     translation_provider: str = field(default_factory=lambda: os.getenv("TRANSLATION_PROVIDER", "google_translate"))
     translation_api_key: Optional[str] = field(default_factory=lambda: os.getenv("TRANSLATION_API_KEY"))
+    translation_cache_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATION_CACHE_SIZE", "2048")))
+    translation_cache_ttl: float = field(default_factory=lambda: float(os.getenv("TRANSLATION_CACHE_TTL", "86400")))
+    translation_cache_path: Optional[str] = field(default_factory=lambda: os.getenv("TRANSLATION_CACHE_PATH") or None)
+    translation_batch_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATION_BATCH_SIZE", "16")))
+    translation_max_concurrency: int = field(default_factory=lambda: int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "4")))
+    answer_cache_enabled: bool = field(default_factory=lambda: os.getenv("ANSWER_CACHE_ENABLED", "1") == "1")
+    answer_cache_ttl: float = field(default_factory=lambda: float(os.getenv("ANSWER_CACHE_TTL", "21600")))
+    answer_cache_max_bytes: int = field(default_factory=lambda: int(os.getenv("ANSWER_CACHE_MAX_BYTES", str(8 * 1024 * 1024))))
+    answer_cache_near_duplicate: bool = field(default_factory=lambda: os.getenv("ANSWER_CACHE_NEAR_DUPLICATE", "0") == "1")
+    answer_cache_similarity: float = field(default_factory=lambda: float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.8")))
+    intent_router_enabled: bool = field(default_factory=lambda: os.getenv("INTENT_ROUTER_ENABLED", "1") == "1")
+    intent_router_threshold: float = field(default_factory=lambda: float(os.getenv("INTENT_ROUTER_THRESHOLD", "0.8")))
+    tool_render_modes: str = field(default_factory=lambda: os.getenv("TOOL_RENDER_MODES", ""))
+    language_pipeline_modes: str = field(default_factory=lambda: os.getenv("LANGUAGE_PIPELINE_MODES", ""))
+    prompt_token_budget: int = field(default_factory=lambda: int(os.getenv("PROMPT_TOKEN_BUDGET", "1500")))
     health_api_base_url: str = field(default_factory=lambda: os.getenv("HEALTH_API_BASE_URL", ""))
+    hospital_store_path: str = field(default_factory=lambda: os.getenv("HOSPITAL_STORE_PATH", ""))
+    hospital_store_max_age: float = field(default_factory=lambda: float(os.getenv("HOSPITAL_STORE_MAX_AGE", str(7 * 24 * 60 * 60))))
+    upstream_pool_size: int = field(default_factory=lambda: int(os.getenv("UPSTREAM_POOL_SIZE", "10")))
+    upstream_max_retries: int = field(default_factory=lambda: int(os.getenv("UPSTREAM_MAX_RETRIES", "2")))
+    upstream_failure_threshold: int = field(default_factory=lambda: int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "3")))
+    upstream_reset_timeout: float = field(default_factory=lambda: float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30")))
+    upstream_host_overrides: str = field(default_factory=lambda: os.getenv("UPSTREAM_HOST_OVERRIDES", ""))
+    async_io_threads: int = field(default_factory=lambda: int(os.getenv("ASYNC_IO_THREADS", "64")))
+    sync_enabled: bool = field(default_factory=lambda: os.getenv("SYNC_ENABLED", "1") == "1")
+    sync_intervals: str = field(default_factory=lambda: os.getenv("SYNC_INTERVALS", ""))
+    warm_up: bool = field(default_factory=lambda: os.getenv("WARM_UP", "0") == "1")
+    session_ttl: float = field(default_factory=lambda: float(os.getenv("SESSION_TTL", "1800")))
+    session_max_sessions: int = field(default_factory=lambda: int(os.getenv("SESSION_MAX_SESSIONS", "10000")))
+    session_token_budget: int = field(default_factory=lambda: int(os.getenv("SESSION_TOKEN_BUDGET", "800")))
+    session_max_turns: int = field(default_factory=lambda: int(os.getenv("SESSION_MAX_TURNS", "6")))
+    session_store_path: Optional[str] = field(default_factory=lambda: os.getenv("SESSION_STORE_PATH") or None)
     cors_origins: str = field(default_factory=lambda: os.getenv("CORS_ORIGINS", "*"))
     debug: bool = field(default_factory=lambda: os.getenv("FLASK_DEBUG", "0") == "1")
 
-    def to_flask_config(self) -> Dict[str, Optional[str]]:
+    def to_flask_config(self) -> Dict[str, Any]:
         """Expose settings as Flask-compatible configuration values."""
         return {
             "GEMINI_API_KEY": self.gemini_api_key,
             "GEMINI_MODEL": self.gemini_model,
+            "GEMINI_CONTEXT_CACHE_TTL": self.gemini_context_cache_ttl,
+            "GEMINI_MAX_IN_FLIGHT": self.gemini_max_in_flight,
+            "GEMINI_MAX_QUEUE": self.gemini_max_queue,
+            "GEMINI_QUEUE_TIMEOUT": self.gemini_queue_timeout,
+            "CLIENT_RATE_LIMIT": self.client_rate_limit,
+            "CLIENT_BURST": self.client_burst,
+            "TRUSTED_PROXIES": self.trusted_proxies,
+            "DASHBOARD_MAX_AGE": self.dashboard_max_age,
+            "FEEDBACK_STORE_PATH": self.feedback_store_path,
+            "FEEDBACK_MAX_QUEUE": self.feedback_max_queue,
+            "FEEDBACK_BATCH_SIZE": self.feedback_batch_size,
+            "FEEDBACK_FLUSH_INTERVAL": self.feedback_flush_interval,
+            "STATIC_PIPELINE_ENABLED": self.static_pipeline_enabled,
             "TRANSLATION_PROVIDER": self.translation_provider,
             "TRANSLATION_API_KEY": self.translation_api_key,
+            "TRANSLATION_CACHE_SIZE": self.translation_cache_size,
+            "TRANSLATION_CACHE_TTL": self.translation_cache_ttl,
+            "TRANSLATION_CACHE_PATH": self.translation_cache_path,
+            "TRANSLATION_BATCH_SIZE": self.translation_batch_size,
+            "TRANSLATION_MAX_CONCURRENCY": self.translation_max_concurrency,
+            "ANSWER_CACHE_ENABLED": self.answer_cache_enabled,
+            "ANSWER_CACHE_TTL": self.answer_cache_ttl,
+            "ANSWER_CACHE_MAX_BYTES": self.answer_cache_max_bytes,
+            "ANSWER_CACHE_NEAR_DUPLICATE": self.answer_cache_near_duplicate,
+            "ANSWER_CACHE_SIMILARITY": self.answer_cache_similarity,
+            "INTENT_ROUTER_ENABLED": self.intent_router_enabled,
+            "INTENT_ROUTER_THRESHOLD": self.intent_router_threshold,
+            "TOOL_RENDER_MODES": self.tool_render_modes,
+            "LANGUAGE_PIPELINE_MODES": self.language_pipeline_modes,
+            "PROMPT_TOKEN_BUDGET": self.prompt_token_budget,
             "HEALTH_API_BASE_URL": self.health_api_base_url,
+            "HOSPITAL_STORE_PATH": self.hospital_store_path,
+            "HOSPITAL_STORE_MAX_AGE": self.hospital_store_max_age,
+            "UPSTREAM_POOL_SIZE": self.upstream_pool_size,
+            "UPSTREAM_MAX_RETRIES": self.upstream_max_retries,
+            "UPSTREAM_FAILURE_THRESHOLD": self.upstream_failure_threshold,
+            "UPSTREAM_RESET_TIMEOUT": self.upstream_reset_timeout,
+            "UPSTREAM_HOST_OVERRIDES": self.upstream_host_overrides,
+            "ASYNC_IO_THREADS": self.async_io_threads,
+            "SYNC_ENABLED": self.sync_enabled,
+            "SYNC_INTERVALS": self.sync_intervals,
+            "WARM_UP": self.warm_up,
+            "SESSION_TTL": self.session_ttl,
+            "SESSION_MAX_SESSIONS": self.session_max_sessions,
+            "SESSION_TOKEN_BUDGET": self.session_token_budget,
+            "SESSION_MAX_TURNS": self.session_max_turns,
+            "SESSION_STORE_PATH": self.session_store_path,
             "CORS_ORIGINS": self.cors_origins,
             "DEBUG": self.debug,
         }
@@ -4,21 +4,66 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
+import sqlite3
+from contextlib import nullcontext
 from http import HTTPStatus
-from typing import Any, Dict, Optional
-
-from flask import Blueprint, current_app, jsonify, request
-
-from .sample_data import get_dashboard_data
-from .services.health_data import HealthDataError, HealthDataService
-from .services.llm import GeminiClient, GeminiClientError
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context, url_for
+
+from .services.admission import AdmissionController, AdmissionRejected
+from .services.answer_cache import AnswerCache
+from .services.chat_pipeline import (
+    HEALTH,
+    LLM,
+    TRANSLATION,
+    Call,
+    StreamedReply,
+    chat_steps,
+    native_language,
+    run_steps,
+)
+from .services.compaction import PayloadCompactor
+from .services.dashboard import DashboardFeed
+from .services.feedback import (
+    FeedbackIngestor,
+    FeedbackQueueFull,
+    FeedbackStore,
+    FeedbackValidationError,
+    validate_feedback,
+)
+from .services.health_data import (
+    HealthDataError,
+    HealthDataService,
+    dataset_stats,
+    load_dataset,
+    load_hospital_fallbacks,
+)
+from .services.hospital_store import HospitalStore
+from .services.intent_router import IntentRouter
+from .services.llm import GeminiClient, GeminiClientError, GeminiResponse, parse_pipeline_modes
+from .services.message_catalog import get_catalog
+from .services.renderers import parse_render_modes
+from .services.sessions import Conversation, SessionStore
+from .services.sync import SyncScheduler, parse_sync_intervals
 from .services.translation import TranslationService, TranslationServiceError
-from .utils.language import detect_language, is_supported_language
+from .services.upstream import UpstreamClient, parse_host_overrides
+from .utils.cache import LRUCache, SQLiteCache, TieredCache
+from .utils.language import LanguageGuess, detect_language_with_confidence, is_supported_language
+from .utils.metrics import REGISTRY, collect_timings, stage_span
 
 logger = logging.getLogger(__name__)
 
 api_bp = Blueprint("api", __name__)
 
+MAX_TRANSLATION_BATCH = 200
+# Punctuation only ends a sentence when whitespace follows it, so decimals
+# ("2.5") and list markers split across stream chunks ("1." + "5 mg") stay
+# whole; whatever is left when the stream ends is flushed as the last piece.
+_SENTENCE_BOUNDARY = re.compile(r"(?:[.!?\u0964]+(?=\s)|\n)\s*")
+
 
 @api_bp.record_once
 def setup_state(state: Any) -> None:
@@ -32,29 +77,254 @@ def setup_state(state: Any) -> None:
     gemini_model = app.config.get("GEMINI_MODEL", "gemini-1.5-flash")
     health_base_url = app.config.get("HEALTH_API_BASE_URL")
 
-    app.extensions["translation_service"] = TranslationService(translation_provider, translation_api_key)
-    app.extensions["gemini_client"] = GeminiClient(gemini_api_key, gemini_model)
-    app.extensions["health_data_service"] = HealthDataService(health_base_url)
+    translation_cache = TieredCache(
+        LRUCache(
+            max_entries=app.config.get("TRANSLATION_CACHE_SIZE", 2048),
+            ttl_seconds=app.config.get("TRANSLATION_CACHE_TTL"),
+        ),
+        _build_persistent_cache(
+            app.config.get("TRANSLATION_CACHE_PATH"),
+            namespace="translations",
+            ttl_seconds=app.config.get("TRANSLATION_CACHE_TTL"),
+        ),
+    )
+
+    app.extensions["translation_service"] = TranslationService(
+        translation_provider,
+        translation_api_key,
+        cache=translation_cache,
+        batch_size=app.config.get("TRANSLATION_BATCH_SIZE", 16),
+        max_concurrency=app.config.get("TRANSLATION_MAX_CONCURRENCY", 4),
+    )
+    admission = AdmissionController(
+        max_in_flight=app.config.get("GEMINI_MAX_IN_FLIGHT", 4),
+        max_queue=app.config.get("GEMINI_MAX_QUEUE", 32),
+        max_wait_seconds=app.config.get("GEMINI_QUEUE_TIMEOUT", 10.0),
+        client_rate=app.config.get("CLIENT_RATE_LIMIT", 0) / 60,
+        client_burst=app.config.get("CLIENT_BURST", 10),
+    )
+    app.extensions["admission"] = admission
+    app.extensions["gemini_client"] = GeminiClient(
+        gemini_api_key,
+        gemini_model,
+        context_cache_ttl=app.config.get("GEMINI_CONTEXT_CACHE_TTL"),
+        admission=admission,
+    )
+    hospital_store = HospitalStore(
+        app.config.get("HOSPITAL_STORE_PATH") or ":memory:",
+        max_age_seconds=app.config.get("HOSPITAL_STORE_MAX_AGE", 7 * 24 * 60 * 60),
+    )
+    try:
+        hospital_store.seed_fallbacks(load_hospital_fallbacks())
+    except HealthDataError:
+        app.logger.warning("Hospital fallback data could not be loaded into the store.")
+
+    upstream = UpstreamClient(
+        pool_size=app.config.get("UPSTREAM_POOL_SIZE", 10),
+        max_retries=app.config.get("UPSTREAM_MAX_RETRIES", 2),
+        failure_threshold=app.config.get("UPSTREAM_FAILURE_THRESHOLD", 3),
+        reset_timeout=app.config.get("UPSTREAM_RESET_TIMEOUT", 30.0),
+        host_overrides=parse_host_overrides(app.config.get("UPSTREAM_HOST_OVERRIDES")),
+    )
+    health_service = HealthDataService(health_base_url, hospital_store=hospital_store, upstream=upstream)
+    sync_scheduler = SyncScheduler()
+    # The refresh loop is started by the process entry point (see ``start_background_tasks``).
+    health_service.register_sync_sources(sync_scheduler, parse_sync_intervals(app.config.get("SYNC_INTERVALS")))
+    app.extensions["health_data_service"] = health_service
+    app.extensions["sync_scheduler"] = sync_scheduler
+    app.extensions["feedback"] = FeedbackIngestor(
+        _open_feedback_store(app.config.get("FEEDBACK_STORE_PATH") or os.path.join(app.instance_path, "feedback.sqlite3")),
+        max_queue=app.config.get("FEEDBACK_MAX_QUEUE", 1000),
+        batch_size=app.config.get("FEEDBACK_BATCH_SIZE", 100),
+        flush_interval=app.config.get("FEEDBACK_FLUSH_INTERVAL", 1.0),
+    )
+    app.extensions["dashboard_feed"] = DashboardFeed(
+        load_dataset, max_age_seconds=app.config.get("DASHBOARD_MAX_AGE", 60)
+    )
+
+    app.extensions["payload_compactor"] = PayloadCompactor(token_budget=app.config.get("PROMPT_TOKEN_BUDGET", 1500))
+    app.extensions["tool_render_modes"] = parse_render_modes(app.config.get("TOOL_RENDER_MODES"))
+    app.extensions["pipeline_modes"] = parse_pipeline_modes(app.config.get("LANGUAGE_PIPELINE_MODES"))
+
+    if app.config.get("INTENT_ROUTER_ENABLED", True):
+        app.extensions["intent_router"] = IntentRouter(threshold=app.config.get("INTENT_ROUTER_THRESHOLD", 0.8))
+
+    session_ttl = app.config.get("SESSION_TTL", 1800)
+    app.extensions["session_store"] = SessionStore(
+        TieredCache(
+            LRUCache(max_entries=app.config.get("SESSION_MAX_SESSIONS", 10000), ttl_seconds=session_ttl),
+            _build_persistent_cache(app.config.get("SESSION_STORE_PATH"), namespace="sessions", ttl_seconds=session_ttl),
+        ),
+        token_budget=app.config.get("SESSION_TOKEN_BUDGET", 800),
+        max_turns=app.config.get("SESSION_MAX_TURNS", 6),
+    )
+
+    if app.config.get("ANSWER_CACHE_ENABLED", True):
+        app.extensions["answer_cache"] = AnswerCache(
+            ttl_seconds=app.config.get("ANSWER_CACHE_TTL"),
+            max_bytes=app.config.get("ANSWER_CACHE_MAX_BYTES", 8 * 1024 * 1024),
+            near_duplicate=app.config.get("ANSWER_CACHE_NEAR_DUPLICATE", False),
+            similarity_threshold=app.config.get("ANSWER_CACHE_SIMILARITY", 0.8),
+        )
+
+
+def _build_persistent_cache(path: Optional[str], namespace: str, ttl_seconds: Optional[float]) -> Optional[SQLiteCache]:
+    """Open the optional SQLite cache tier, degrading to memory-only on failure."""
+    if not path:
+        return None
+
+    try:
+        return SQLiteCache(path, namespace=namespace, ttl_seconds=ttl_seconds)
+    except sqlite3.Error:
+        logger.exception("Could not open persistent cache at %s; using memory only.", path)
+        return None
+
+
+def _open_feedback_store(path: str) -> FeedbackStore:
+    """Open the feedback database, falling back to memory (with a loud log) if the file is unusable."""
+    if path != ":memory:":
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            return FeedbackStore(path)
+        except (OSError, sqlite3.Error):
+            logger.exception("Could not open the feedback store at %s.", path)
+    logger.error("Feedback is kept in memory only and will be lost on restart; set FEEDBACK_STORE_PATH.")
+    return FeedbackStore(":memory:")
 
 
 @api_bp.get("/healthcheck")
 def healthcheck() -> Any:
     """Simple uptime check for monitoring and deployment verification."""
-    return jsonify({"status": "ok", "service": "nirogi-backend"})
+    warm_up_state = current_app.extensions.get("warm_up", {"status": "off"})
+    return jsonify({"status": "ok", "service": "nirogi-backend", "warm_up": warm_up_state["status"]})
 
 
 @api_bp.get("/dashboard-data")
 def dashboard_data() -> Any:
-    """Provide sample data for the live dashboard UI."""
-    return jsonify(get_dashboard_data())
+    """Serve outbreak and vaccination aggregates; unchanged polls get ``304 Not Modified``."""
+    feed: DashboardFeed = current_app.extensions["dashboard_feed"]
+    try:
+        rendered = feed.current()
+    except HealthDataError as exc:
+        logger.exception("Dashboard data could not be built.")
+        return jsonify({"error": str(exc)}), HTTPStatus.SERVICE_UNAVAILABLE
+
+    return _conditional_json(rendered.body, rendered.etag, f"public, max-age={feed.max_age_seconds}")
+
+
+@api_bp.get("/messages")
+def message_catalog() -> Any:
+    """List the message bundles; their URLs change whenever the catalog does."""
+    catalog = get_catalog()
+    payload = {
+        "version": catalog.version,
+        "languages": catalog.languages,
+        "bundles": {
+            language: url_for("api.message_bundle", language=language, v=catalog.version) for language in catalog.languages
+        },
+    }
+    return _conditional_json(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8"), f'"{catalog.version}"', "no-cache"
+    )
+
+
+@api_bp.get("/messages/<language>")
+def message_bundle(language: str) -> Any:
+    """Serve the bot messages for ``language``; URLs carrying the current ``v`` are immutable."""
+    catalog = get_catalog()
+    bundle = catalog.bundle(language)
+    if bundle is None:
+        return jsonify({"error": f"No messages for language '{language}'."}), HTTPStatus.NOT_FOUND
+    versioned = request.args.get("v") == catalog.version
+    return _conditional_json(bundle.body, bundle.etag, "public, max-age=31536000, immutable" if versioned else "no-cache")
+
+
+def _conditional_json(body: bytes, etag: str, cache_control: str) -> Any:
+    """Return pre-serialized JSON, or an empty 304 when the client already has ``etag``."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    # If-None-Match uses weak comparison (RFC 9110), so W/ variants of our tag also match.
+    if request.if_none_match.contains_weak(etag.strip('"')):
+        return Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return Response(body, mimetype="application/json", headers=headers)
+
+
+@api_bp.get("/cache-stats")
+def cache_stats() -> Any:
+    """Report hit/miss/eviction counters so cache sizes can be tuned."""
+    translation_service: TranslationService = current_app.extensions["translation_service"]
+    answer_cache: Optional[AnswerCache] = current_app.extensions.get("answer_cache")
+    session_store: SessionStore = current_app.extensions["session_store"]
+    return jsonify(
+        {
+            "translation": translation_service.cache_stats(),
+            "answers": answer_cache.stats() if answer_cache is not None else {"enabled": False},
+            "sessions": session_store.stats(),
+            "dashboard": current_app.extensions["dashboard_feed"].stats(),
+            "feedback": current_app.extensions["feedback"].stats(),
+        }
+    )
+
+
+@api_bp.get("/router-stats")
+def router_stats() -> Any:
+    """Report how many tool requests the local intent router resolved without Gemini."""
+    intent_router: Optional[IntentRouter] = current_app.extensions.get("intent_router")
+    if intent_router is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **intent_router.stats()})
+
+
+@api_bp.get("/data-status")
+def data_status() -> Any:
+    """Report the age and refresh state of every dataset served from memory."""
+    sync_scheduler: SyncScheduler = current_app.extensions["sync_scheduler"]
+    return jsonify({"datasets": sync_scheduler.status(), "files": dataset_stats()})
+
+
+@api_bp.get("/upstream-status")
+def upstream_status() -> Any:
+    """Report breaker state, pool usage and collapsed duplicate calls for upstream APIs."""
+    health_service: HealthDataService = current_app.extensions["health_data_service"]
+    translation_service: TranslationService = current_app.extensions["translation_service"]
+    llm_service: GeminiClient = current_app.extensions["gemini_client"]
+    admission: Optional[AdmissionController] = current_app.extensions.get("admission")
+    return jsonify(
+        {
+            **health_service.upstream.stats(),
+            "coalescing": {
+                "health_data": health_service.coalescing_stats(),
+                "translation": translation_service.coalescing_stats(),
+                "gemini": llm_service.coalescing_stats(),
+            },
+            "admission": admission.stats() if admission is not None else None,
+        }
+    )
+
+
+@api_bp.get("/metrics")
+def metrics() -> Any:
+    """Expose stage, tool and upstream latency histograms in Prometheus text format."""
+    return Response(REGISTRY.render(), mimetype="text/plain; version=0.0.4")
 
 
 @api_bp.post("/feedback")
 def feedback() -> Any:
-    """Accept user feedback submissions from the frontend."""
-    payload: Dict[str, Any] = request.get_json(silent=True) or {}
-    logger.info("FEEDBACK RECEIVED: %s", payload)
-    return jsonify({"status": "ok"})
+    """Accept user feedback submissions from the frontend; they are stored in the background."""
+    ingestor: FeedbackIngestor = current_app.extensions["feedback"]
+    try:
+        ingestor.submit(validate_feedback(request.get_json(silent=True)))
+    except FeedbackValidationError as exc:
+        return jsonify({"error": str(exc)}), HTTPStatus.BAD_REQUEST
+    except FeedbackQueueFull as exc:
+        response = jsonify({"error": str(exc), "retry_after": exc.retry_after})
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        response.headers["Retry-After"] = str(exc.retry_after)
+        return response
+    return jsonify({"status": "accepted"}), HTTPStatus.ACCEPTED
+
+
+def _chat_services(translation_service: Any, health_service: Any, llm_service: Any) -> Dict[str, Any]:
+    return {TRANSLATION: translation_service, HEALTH: health_service, LLM: llm_service}
 
 
 def chat_with_bot(
@@ -64,123 +334,200 @@ def chat_with_bot(
     health_service: HealthDataService,
     llm_service: GeminiClient,
     context: Optional[str] = None,
+    answer_cache: Optional[AnswerCache] = None,
+    intent_router: Optional[IntentRouter] = None,
+    render_modes: Optional[Dict[str, str]] = None,
+    compactor: Optional[PayloadCompactor] = None,
+    conversation: Optional[Conversation] = None,
+    pipeline_modes: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    """Handle chat requests, manage tool invocations, and preserve context."""
-
-    metadata: Dict[str, Any] = {"context": None}
-    supplemental_data: Dict[str, Any] = {}
-    normalized_language = language or "en"
-    needs_translation = language == "hi"
-
-    # --- STEP 1: Handle context-based follow ups ---
-    if context == "awaiting_city_for_hospitals":
-        city_name = message.strip()
-        if not city_name:
-            response_text = "Please share a valid city or district name so I can search for hospitals."
-        else:
-            if needs_translation:
-                translation_result = translation_service.translate(city_name, target_language="en")
-                city_name = translation_result.text.strip()
-
-            hospitals = health_service.get_nearby_hospitals(city_name)
-            if not hospitals:
-                response_text = f"Sorry, I couldn't find any hospitals in {city_name}."
-            else:
-                prompt_string = (
-                    f"Here is a list of hospitals in {city_name}: {json.dumps(hospitals, ensure_ascii=False)}. "
-                    "Please format the top 3-4 results for the user, showing only the name and any available address information. "
-                    "At the end, add the source: 'Source: OpenStreetMap API'"
-                )
-                summary = llm_service.get_response(prompt_string)
-                response_text = summary.text.strip()
-                metadata["llm"] = summary.metadata
-                supplemental_data["hospitals"] = hospitals
-
-        metadata["context"] = None
-    elif context == "awaiting_disease_for_alert":
-        disease_name = message.strip()
-        if not disease_name:
-            response_text = "Please tell me the disease name, for example Dengue or Malaria."
-        else:
-            if needs_translation:
-                translation_result = translation_service.translate(disease_name, target_language="en")
-                disease_name = translation_result.text.strip()
-
-            alert_data = health_service.get_local_outbreak_alert(disease_name)
-            if not alert_data:
-                response_text = f"Sorry, I do not have any alerts for '{disease_name}' right now."
+    """Handle chat requests, manage tool invocations, and preserve context.
+
+    The turn itself is :func:`~app.services.chat_pipeline.chat_steps`; this
+    runs its upstream calls one after another on the request thread.
+    """
+    steps = chat_steps(
+        message,
+        language,
+        context=context,
+        answer_cache=answer_cache,
+        intent_router=intent_router,
+        render_modes=render_modes,
+        compactor=compactor,
+        conversation=conversation,
+        pipeline_modes=pipeline_modes,
+    )
+    return run_steps(steps, _chat_services(translation_service, health_service, llm_service))
+
+
+def _split_sentences(buffer: str) -> Tuple[List[str], str]:
+    """Split complete sentences (with trailing whitespace) off the front of ``buffer``."""
+    sentences: List[str] = []
+    position = 0
+    for match in _SENTENCE_BOUNDARY.finditer(buffer):
+        sentences.append(buffer[position : match.end()])
+        position = match.end()
+    return sentences, buffer[position:]
+
+
+def _localize_fragment(fragment: str, translation_service: TranslationService) -> str:
+    """Translate one streamed sentence to Hindi while keeping its trailing whitespace."""
+    stripped = fragment.rstrip()
+    if not stripped.strip():
+        return fragment
+    translated = translation_service.translate(stripped, target_language="hi")
+    return translated.text + fragment[len(stripped) :]
+
+
+def _stream_reply(
+    call: Call,
+    translation_service: TranslationService,
+    llm_service: GeminiClient,
+    needs_translation: bool,
+) -> Generator[Tuple[str, Dict[str, Any]], None, Any]:
+    """Stream the routing answer to the client, returning it once Gemini is done.
+
+    The opening chunks are held back until they cannot be the start of a tool
+    sentinel; a sentinel is returned without emitting anything so the pipeline
+    can resolve it.
+    """
+    prompt, system_prompt = call.args
+    head = ""
+    streaming = False
+    pending = ""
+    generated: List[str] = []
+    for chunk in llm_service.stream_response(prompt, system_prompt):
+        generated.append(chunk)
+        if not streaming:
+            head += chunk
+            opening = head.lstrip()
+            if not opening or opening == "@" or opening.startswith("@@"):
+                continue
+            streaming = True
+            chunk = head
+
+        if not needs_translation:
+            yield "token", {"text": chunk}
+            continue
+
+        pending += chunk
+        sentences, pending = _split_sentences(pending)
+        for sentence in sentences:
+            yield "token", {"text": _localize_fragment(sentence, translation_service)}
+
+    metadata = {"provider": llm_service.provider_name}
+    if not streaming:
+        return GeminiResponse(text=head, metadata=metadata)
+    if pending:
+        yield "token", {"text": _localize_fragment(pending, translation_service) if needs_translation else pending}
+    return StreamedReply(text="".join(generated), metadata=metadata)
+
+
+def stream_chat_with_bot(
+    message: str,
+    language: str,
+    translation_service: TranslationService,
+    health_service: HealthDataService,
+    llm_service: GeminiClient,
+    context: Optional[str] = None,
+    answer_cache: Optional[AnswerCache] = None,
+    intent_router: Optional[IntentRouter] = None,
+    render_modes: Optional[Dict[str, str]] = None,
+    compactor: Optional[PayloadCompactor] = None,
+    conversation: Optional[Conversation] = None,
+    pipeline_modes: Optional[Dict[str, str]] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(event, payload)`` pairs for a chat turn as the reply is generated.
+
+    Plain answers are streamed token by token (sentence by sentence for Hindi,
+    so translation overlaps with generation). Context follow-ups and tool
+    sentinels run through the same pipeline as :func:`chat_with_bot` and are
+    emitted as a single chunk.
+    """
+    steps = chat_steps(
+        message,
+        language,
+        context=context,
+        answer_cache=answer_cache,
+        intent_router=intent_router,
+        render_modes=render_modes,
+        compactor=compactor,
+        conversation=conversation,
+        pipeline_modes=pipeline_modes,
+    )
+    services = _chat_services(translation_service, health_service, llm_service)
+    # Natively generated answers stream as they are; translated ones sentence by sentence.
+    needs_translation = language == "hi" and native_language(language, pipeline_modes) is None
+    delivered = False
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            effect = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as finished:
+            payload = finished.value
+            break
+        result, error = None, None
+        if not isinstance(effect, Call):
+            continue
+        try:
+            if effect.streamable:
+                result = yield from _stream_reply(effect, translation_service, llm_service, needs_translation)
+                delivered = isinstance(result, StreamedReply)
             else:
-                prompt_string = (
-                    f"Here is the alert data for {disease_name}: {json.dumps(alert_data, ensure_ascii=False)}. "
-                    "Please summarize this for the user and include the 'advice' section. At the end, add the source: 'Source: National Health Portal (Simulated Data)'"
-                )
-                summary = llm_service.get_response(prompt_string)
-                response_text = summary.text.strip()
-                metadata["llm"] = summary.metadata
-                supplemental_data["alert"] = alert_data
-
-        metadata["context"] = None
+                result = effect.invoke(services)
+        except Exception as exc:
+            error = exc
+
+    response_text = payload.pop("message")
+    if not delivered:
+        yield "token", {"text": response_text}
+    yield "done", payload
+
+
+def _format_sse(event: str, payload: Dict[str, Any]) -> str:
+    """Serialize a payload as a Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def _open_conversation(session_store: Optional[SessionStore], data: Dict[str, Any]) -> Tuple[Optional[Conversation], Optional[str]]:
+    """Return the request's conversation and its pending tool context.
+
+    An explicit ``context`` in the payload still wins so older clients that
+    echo the token back keep working.
+    """
+    conversation = session_store.open(data.get("session_id")) if session_store is not None else None
+    context_token = (data.get("context") or None) or (conversation.context if conversation is not None else None)
+    return conversation, context_token
+
+
+def _resolve_chat_language(message: str, requested_language: str) -> LanguageGuess:
+    """Return the chat language, detecting it when not supplied.
+
+    Raises
+    ------
+    ValueError
+        If the language is not supported by the application.
+    """
+    if requested_language:
+        guess = LanguageGuess(requested_language, 1.0, "explicit")
     else:
-        # --- STEP 2: Handle a new inbound message ---
-        normalized_prompt = message.strip()
-        if not normalized_prompt:
-            return {"message": "message cannot be empty", "metadata": metadata}
-
-        if language and language != "en":
-            translation_result = translation_service.translate(normalized_prompt, target_language="en", source_language=language)
-            normalized_prompt = translation_result.text
-            normalized_language = translation_result.detected_language
-
-        first_response = llm_service.get_response(normalized_prompt)
-        response_text = first_response.text.strip()
-        metadata["llm"] = first_response.metadata
-
-        # --- STEP 3: Tool handling ---
-        if response_text == "@@FETCH_COVID_STATS@@":
-            state_data = health_service.get_statewise_covid_data()
-            supplemental_data["statewise_covid"] = state_data
-            prompt_string = (
-                "Here is the live, state-wise COVID-19 data for all of India: "
-                f"{json.dumps(state_data, ensure_ascii=False)}. Please summarize this data by grouping the states with active cases > 10. "
-                "For each state, use a bullet point to list the **Active Cases** and **Cured (Recovered) Cases**. "
-                "Use **bolding** for the state name. Do not use a markdown table. Finally, add a new line at the very bottom: 'Source: disease.sh API'"
-            )
-            second_response = llm_service.get_response(prompt_string)
-            response_text = second_response.text.strip()
-            metadata["llm"] = second_response.metadata
-        elif response_text == "@@FETCH_HOSPITALS@@":
-            response_text = "To find hospitals, I need to know your city or district name. Please tell me your city."
-            metadata["context"] = "awaiting_city_for_hospitals"
-        elif response_text == "@@FETCH_VACCINE_SCHEDULE@@":
-            schedule = health_service.get_vaccine_schedule()
-            supplemental_data["vaccine_schedule"] = schedule
-            prompt_string = (
-                "Here is the official vaccination schedule: "
-                f"{json.dumps(schedule, ensure_ascii=False)}. Please format this nicely for the user, grouped by age."
-            )
-            second_response = llm_service.get_response(prompt_string)
-            response_text = second_response.text.strip()
-            metadata["llm"] = second_response.metadata
-        elif response_text == "@@FETCH_DISEASE_OUTBREAK@@":
-            response_text = "Which disease are you asking about? (e.g., Dengue, Malaria)"
-            metadata["context"] = "awaiting_disease_for_alert"
-        else:
-            metadata["context"] = None
-
-    # --- STEP 4: Translate back to the user's requested language ---
-    if needs_translation:
-        translated = translation_service.translate(response_text, target_language="hi")
-        response_text = translated.text
-
-    if supplemental_data:
-        metadata["supplemental_data"] = supplemental_data
-
-    return {
-        "message": response_text,
-        "metadata": metadata,
-        "source_language": normalized_language,
-        "language": language or normalized_language,
-    }
+        guess = detect_language_with_confidence(message)
+    is_supported_language(guess.language)
+    return guess
+
+
+def _check_client(admission: Optional[AdmissionController], client_id: Optional[str]) -> None:
+    """Charge one chat request to the caller's rate limit; raises ``AdmissionRejected``."""
+    if admission is not None:
+        admission.check_client(client_id or "unknown")
+
+
+def _rejected_response(exc: AdmissionRejected) -> Any:
+    response = jsonify({"error": str(exc), "retry_after": exc.retry_after})
+    response.status_code = HTTPStatus.TOO_MANY_REQUESTS
+    response.headers["Retry-After"] = str(exc.retry_after)
+    return response
 
 
 @api_bp.post("/chat")
@@ -192,35 +539,43 @@ def chat() -> Any:
         return jsonify({"error": "message is required"}), HTTPStatus.BAD_REQUEST
 
     requested_language = (data.get("language") or "").strip().lower()
-    context_token = (data.get("context") or None) or None
-
-    language = requested_language
 
     try:
-        if not language:
-            language = detect_language(message)
-
-        is_supported_language(language)
+        language_guess = _resolve_chat_language(message, requested_language)
     except ValueError:
-        invalid_lang = requested_language or language or "auto-detected"
+        invalid_lang = requested_language or "auto-detected"
         return (
             jsonify({"error": f"Language '{invalid_lang}' is not supported yet."}),
             HTTPStatus.BAD_REQUEST,
         )
 
+    try:
+        _check_client(current_app.extensions.get("admission"), request.remote_addr)
+    except AdmissionRejected as exc:
+        return _rejected_response(exc)
+
+    language = language_guess.language
+    conversation, context_token = _open_conversation(current_app.extensions.get("session_store"), data)
     translation_service: TranslationService = current_app.extensions["translation_service"]
     health_service: HealthDataService = current_app.extensions["health_data_service"]
     llm_service: GeminiClient = current_app.extensions["gemini_client"]
 
     try:
-        result = chat_with_bot(
-            message=message,
-            language=language,
-            translation_service=translation_service,
-            health_service=health_service,
-            llm_service=llm_service,
-            context=context_token,
-        )
+        with collect_timings() if data.get("timings") else nullcontext() as timings, stage_span("chat"):
+            result = chat_with_bot(
+                message=message,
+                language=language,
+                translation_service=translation_service,
+                health_service=health_service,
+                llm_service=llm_service,
+                context=context_token,
+                answer_cache=current_app.extensions.get("answer_cache"),
+                intent_router=current_app.extensions.get("intent_router"),
+                render_modes=current_app.extensions.get("tool_render_modes"),
+                compactor=current_app.extensions.get("payload_compactor"),
+                conversation=conversation,
+                pipeline_modes=current_app.extensions.get("pipeline_modes"),
+            )
     except TranslationServiceError as exc:
         logger.exception("Translation failed.")
         return jsonify({"error": str(exc)}), HTTPStatus.INTERNAL_SERVER_ERROR
@@ -230,10 +585,88 @@ def chat() -> Any:
     except GeminiClientError as exc:
         logger.exception("Gemini request failed.")
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_GATEWAY
-
+    except AdmissionRejected as exc:
+        logger.warning("Chat request shed: %s", exc.reason)
+        return _rejected_response(exc)
+
+    result["metadata"]["language_detection"] = language_guess.to_metadata()
+    if conversation is not None:
+        result["session_id"] = conversation.session_id
+    if timings is not None:
+        result["metadata"]["timings_ms"] = timings
     return jsonify(result)
 
 
+@api_bp.post("/chat/stream")
+def chat_stream() -> Any:
+    """Streaming variant of ``/chat`` that emits the reply over Server-Sent Events."""
+    data: Dict[str, Any] = request.get_json(silent=True) or {}
+    message = (data.get("message") or "").strip()
+    if not message:
+        return jsonify({"error": "message is required"}), HTTPStatus.BAD_REQUEST
+
+    requested_language = (data.get("language") or "").strip().lower()
+
+    try:
+        language_guess = _resolve_chat_language(message, requested_language)
+    except ValueError:
+        invalid_lang = requested_language or "auto-detected"
+        return (
+            jsonify({"error": f"Language '{invalid_lang}' is not supported yet."}),
+            HTTPStatus.BAD_REQUEST,
+        )
+
+    try:
+        _check_client(current_app.extensions.get("admission"), request.remote_addr)
+    except AdmissionRejected as exc:
+        return _rejected_response(exc)
+
+    language = language_guess.language
+    conversation, context_token = _open_conversation(current_app.extensions.get("session_store"), data)
+    translation_service: TranslationService = current_app.extensions["translation_service"]
+    health_service: HealthDataService = current_app.extensions["health_data_service"]
+    llm_service: GeminiClient = current_app.extensions["gemini_client"]
+    answer_cache: Optional[AnswerCache] = current_app.extensions.get("answer_cache")
+    intent_router: Optional[IntentRouter] = current_app.extensions.get("intent_router")
+    render_modes: Optional[Dict[str, str]] = current_app.extensions.get("tool_render_modes")
+    compactor: Optional[PayloadCompactor] = current_app.extensions.get("payload_compactor")
+    pipeline_modes: Optional[Dict[str, str]] = current_app.extensions.get("pipeline_modes")
+
+    def generate() -> Iterator[str]:
+        try:
+            for event, payload in stream_chat_with_bot(
+                message=message,
+                language=language,
+                translation_service=translation_service,
+                health_service=health_service,
+                llm_service=llm_service,
+                context=context_token,
+                answer_cache=answer_cache,
+                intent_router=intent_router,
+                render_modes=render_modes,
+                compactor=compactor,
+                conversation=conversation,
+                pipeline_modes=pipeline_modes,
+            ):
+                if event == "done":
+                    payload["metadata"]["language_detection"] = language_guess.to_metadata()
+                    if conversation is not None:
+                        payload["session_id"] = conversation.session_id
+                yield _format_sse(event, payload)
+        except (TranslationServiceError, HealthDataError, GeminiClientError) as exc:
+            logger.exception("Streaming chat failed.")
+            yield _format_sse("error", {"error": str(exc)})
+        except AdmissionRejected as exc:
+            logger.warning("Streaming chat shed: %s", exc.reason)
+            yield _format_sse("error", {"error": str(exc), "retry_after": exc.retry_after})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @api_bp.get("/test-hospitals")
 def test_hospitals() -> Any:
     """Temporary route to fetch hospitals for a given city using Overpass."""
@@ -251,17 +684,74 @@ def test_hospitals() -> Any:
     return jsonify({"city": city, "hospitals": hospitals})
 
 
+@api_bp.get("/hospitals/nearby")
+def hospitals_nearby() -> Any:
+    """Return the hospitals closest to the supplied browser coordinates."""
+    try:
+        lat = float(request.args["lat"])
+        lon = float(request.args["lon"])
+        limit = min(max(int(request.args.get("limit", 5)), 1), 20)
+    except (KeyError, ValueError):
+        return jsonify({"error": "lat and lon query parameters are required numbers"}), HTTPStatus.BAD_REQUEST
+
+    health_service: HealthDataService = current_app.extensions["health_data_service"]
+    try:
+        hospitals = health_service.get_hospitals_near(lat, lon, limit=limit)
+    except HealthDataError as exc:
+        logger.exception("Failed to fetch hospitals near %s,%s", lat, lon)
+        return jsonify({"error": str(exc)}), HTTPStatus.BAD_GATEWAY
+
+    return jsonify({"lat": lat, "lon": lon, "hospitals": hospitals})
+
+
 @api_bp.post("/translate")
 def translate() -> Any:
-    """Dedicated translation endpoint used by the frontend for UI text."""
+    """Dedicated translation endpoint used by the frontend for UI text.
+
+    Accepts either a single ``text`` string or a ``texts`` list; the list form
+    translates every UI string in one request and preserves input order.
+    """
     data: Dict[str, Any] = request.get_json(silent=True) or {}
-    text = (data.get("text") or "").strip()
     target_language = (data.get("target_language") or "en").strip().lower()
+    translation_service: TranslationService = current_app.extensions["translation_service"]
+
+    texts = data.get("texts")
+    if texts is not None:
+        if not isinstance(texts, list) or not all(isinstance(item, str) for item in texts):
+            return jsonify({"error": "texts must be a list of strings"}), HTTPStatus.BAD_REQUEST
+        if not texts:
+            return jsonify({"error": "texts must not be empty"}), HTTPStatus.BAD_REQUEST
+        if len(texts) > MAX_TRANSLATION_BATCH:
+            return (
+                jsonify({"error": f"texts may contain at most {MAX_TRANSLATION_BATCH} entries"}),
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        source_language = (data.get("source_language") or "").strip().lower() or None
+        try:
+            translation_results = translation_service.translate_many(
+                texts,
+                target_language=target_language,
+                source_language=source_language,
+            )
+        except TranslationServiceError as exc:
+            logger.exception("Batch translation failed.")
+            return jsonify({"error": str(exc)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+        return jsonify(
+            {
+                "translations": [
+                    {"text": result.text, "detected_language": result.detected_language}
+                    for result in translation_results
+                ],
+                "target_language": target_language,
+            }
+        )
 
+    text = (data.get("text") or "").strip()
     if not text:
         return jsonify({"error": "text is required"}), HTTPStatus.BAD_REQUEST
 
-    translation_service: TranslationService = current_app.extensions["translation_service"]
     try:
         translation_result = translation_service.translate(text, target_language=target_language)
     except TranslationServiceError as exc:
@@ -0,0 +1,225 @@
+"""Admission control for Gemini calls: in-flight cap, priority queue and per-client rate limits."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Tuple
+
+from ..utils.metrics import REGISTRY
+
+# Lower values are served first.
+FOLLOW_UP = 0
+FRESH = 1
+
+QUEUE_WAIT_SECONDS = REGISTRY.histogram("nirogi_gemini_queue_wait_seconds", "Time Gemini calls waited for a slot.", ("priority",))
+REJECTIONS = REGISTRY.counter("nirogi_admission_rejections_total", "Requests shed by admission control.", ("reason",))
+
+_PRIORITY_LABELS = {FOLLOW_UP: "follow_up", FRESH: "fresh"}
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a request is shed; ``retry_after`` is a hint in seconds."""
+
+    def __init__(self, message: str, retry_after: float, reason: str) -> None:
+        super().__init__(message)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.reason = reason
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, now: float) -> float:
+        """Take one token; return 0 on success or the seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Waiter:
+    __slots__ = ("event", "granted", "cancelled")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.granted = False
+        self.cancelled = False
+
+
+class AdmissionController:
+    """Bound concurrent Gemini calls and shed excess demand early.
+
+    At most ``max_in_flight`` calls run at once. Further calls wait in a
+    priority queue (tool follow-ups ahead of fresh questions) of at most
+    ``max_queue`` entries. A call is rejected up front when the queue is full
+    or its expected wait exceeds ``max_wait_seconds``, and after
+    ``max_wait_seconds`` if it is still queued, so callers get a fast 429
+    instead of a slow timeout. Chat requests are also limited per client by
+    token buckets (``client_rate`` per second, bursts of ``client_burst``).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        max_queue: int = 32,
+        max_wait_seconds: float = 10.0,
+        client_rate: float = 0.5,
+        client_burst: int = 10,
+        max_clients: int = 10000,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_wait_seconds = max_wait_seconds
+        self.client_rate = client_rate
+        self.client_burst = max(1, client_burst)
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._service_seconds = 1.0
+        self._waits: Deque[float] = deque(maxlen=1024)
+        self._admitted = 0
+        self._rejected: Dict[str, int] = {"rate_limited": 0, "queue_full": 0, "timeout": 0}
+
+    def check_client(self, client_id: str) -> None:
+        """Charge one request to ``client_id``.
+
+        Raises
+        ------
+        AdmissionRejected
+            If the client's token bucket is empty.
+        """
+        if self.client_rate <= 0:
+            return
+        with self._lock:
+            bucket = self._buckets.get(client_id)
+            if bucket is None:
+                bucket = TokenBucket(self.client_rate, self.client_burst)
+                self._buckets[client_id] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client_id)
+            wait = bucket.take(time.monotonic())
+            if wait:
+                self._rejected["rate_limited"] += 1
+        if wait:
+            REJECTIONS.inc("rate_limited")
+            raise AdmissionRejected("Too many requests; please slow down.", wait, "rate_limited")
+
+    @contextmanager
+    def slot(self, priority: int = FRESH) -> Iterator[None]:
+        """Hold one Gemini slot for the duration of the block.
+
+        Raises
+        ------
+        AdmissionRejected
+            If the queue is full, the expected wait is too long, or no slot
+            frees up within ``max_wait_seconds``.
+        """
+        started = time.monotonic()
+        self._acquire(priority)
+        waited = time.monotonic() - started
+        QUEUE_WAIT_SECONDS.observe(waited, _PRIORITY_LABELS.get(priority, str(priority)))
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started - waited)
+
+    def _acquire(self, priority: int) -> None:
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._queue:
+                self._in_flight += 1
+                self._admitted += 1
+                self._waits.append(0.0)
+                return
+
+            expected_wait = self._expected_wait(len(self._queue) + 1)
+            if len(self._queue) >= self.max_queue or expected_wait > self.max_wait_seconds:
+                self._rejected["queue_full"] += 1
+                reason, retry_after = "queue_full", expected_wait
+            else:
+                waiter = _Waiter()
+                heapq.heappush(self._queue, (priority, next(self._sequence), waiter))
+                reason = ""
+
+        if reason:
+            REJECTIONS.inc(reason)
+            raise AdmissionRejected("The assistant is busy; please retry shortly.", retry_after, reason)
+
+        started = time.monotonic()
+        waiter.event.wait(self.max_wait_seconds)
+        with self._lock:
+            if not waiter.granted:
+                waiter.cancelled = True
+                self._rejected["timeout"] += 1
+                retry_after = self._expected_wait(len(self._queue))
+            else:
+                self._waits.append(time.monotonic() - started)
+                retry_after = None
+        if retry_after is not None:
+            REJECTIONS.inc("timeout")
+            raise AdmissionRejected("The assistant is busy; please retry shortly.", retry_after, "timeout")
+
+    def _release(self, service_seconds: float) -> None:
+        with self._lock:
+            # Exponential moving average of call duration, used for wait estimates.
+            self._service_seconds += 0.2 * (service_seconds - self._service_seconds)
+            while self._queue:
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.cancelled:
+                    continue
+                # Hand the slot straight to the next waiter; in-flight count is unchanged.
+                waiter.granted = True
+                self._admitted += 1
+                waiter.event.set()
+                return
+            self._in_flight -= 1
+
+    def _expected_wait(self, position: int) -> float:
+        """Estimate the wait for the ``position``-th queued call; the caller holds the lock."""
+        return position * self._service_seconds / self.max_in_flight
+
+    def stats(self) -> Dict[str, object]:
+        """Return queue depth, in-flight calls, wait percentiles and rejection counts."""
+        with self._lock:
+            waits = sorted(self._waits)
+            queued = sum(1 for _, _, waiter in self._queue if not waiter.cancelled)
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queue_depth": queued,
+                "max_queue": self.max_queue,
+                "admitted": self._admitted,
+                "rejected": dict(self._rejected),
+                "wait_ms": {
+                    "p50": round(_percentile(waits, 0.5) * 1000, 1),
+                    "p95": round(_percentile(waits, 0.95) * 1000, 1),
+                },
+                "service_ms": round(self._service_seconds * 1000, 1),
+                "clients_tracked": len(self._buckets),
+            }
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
@@ -0,0 +1,197 @@
+"""Cache of Gemini answers for frequently repeated health questions."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import struct
+import threading
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = re.compile(r"[^\w\s@]", re.UNICODE)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Return the canonical form of an English prompt used as the cache key."""
+    folded = unicodedata.normalize("NFKC", prompt).casefold()
+    return " ".join(_PUNCTUATION.sub(" ", folded).split())
+
+
+@dataclass(slots=True)
+class CachedAnswer:
+    """Answer text and LLM metadata stored for a normalized prompt."""
+
+    text: str
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+class MinHasher:
+    """Compute MinHash signatures over word shingles of a normalized prompt."""
+
+    def __init__(self, num_permutations: int = 64, shingle_size: int = 2, seed: int = 7) -> None:
+        self.num_permutations = num_permutations
+        self.shingle_size = shingle_size
+        # Deterministic (a, b) pairs for the universal hash family a*x + b mod p.
+        self._coefficients: List[Tuple[int, int]] = []
+        for index in range(num_permutations):
+            digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=16).digest()
+            a, b = struct.unpack("<QQ", digest)
+            self._coefficients.append((a % (_MERSENNE_PRIME - 1) + 1, b % _MERSENNE_PRIME))
+
+    def shingles(self, normalized: str) -> Set[str]:
+        """Return word n-gram shingles, falling back to single words for short prompts."""
+        words = normalized.split()
+        if len(words) < self.shingle_size:
+            return set(words)
+        return {" ".join(words[index : index + self.shingle_size]) for index in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, normalized: str) -> Tuple[int, ...]:
+        """Return the MinHash signature of ``normalized``."""
+        hashed = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+            for shingle in self.shingles(normalized)
+        ]
+        if not hashed:
+            return tuple([_MAX_HASH] * self.num_permutations)
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashed) for a, b in self._coefficients
+        )
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        matches = sum(1 for a, b in zip(left, right) if a == b)
+        return matches / len(left)
+
+
+class AnswerCache:
+    """TTL- and memory-bounded cache of LLM answers keyed on normalized prompts.
+
+    Entries are partitioned by the language the answer is written in, so a
+    Hindi answer generated natively is never served to an English chat for
+    the same prompt (or the reverse). Exact matches are looked up by the
+    normalized prompt. When
+    ``near_duplicate`` is enabled, misses fall back to a MinHash/LSH index so
+    that paraphrases such as "what are the symptoms of dengue" and "dengue
+    symptoms what are they" can share one answer once their estimated
+    similarity reaches ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = 6 * 60 * 60,
+        max_bytes: int = 8 * 1024 * 1024,
+        near_duplicate: bool = False,
+        similarity_threshold: float = 0.8,
+        num_permutations: int = 64,
+        bands: int = 16,
+    ) -> None:
+        if num_permutations % bands:
+            raise ValueError("num_permutations must be divisible by bands.")
+
+        self.near_duplicate = near_duplicate
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self._rows = num_permutations // bands
+        self._hasher = MinHasher(num_permutations=num_permutations)
+        self._signatures: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[Tuple[str, str]]] = defaultdict(set)
+        self._index_lock = threading.Lock()
+        self._near_hits = 0
+        self._entries = LRUCache(
+            max_entries=max(1, max_bytes // 64),
+            ttl_seconds=ttl_seconds,
+            max_weight=max_bytes,
+            weigher=_estimate_size,
+            on_evict=self._forget,
+        )
+
+    def get(self, prompt: str, language: str = "en") -> Optional[CachedAnswer]:
+        """Return the ``language`` answer cached for ``prompt`` or its closest paraphrase."""
+        normalized = normalize_prompt(prompt)
+        if not normalized:
+            return None
+
+        key = (language, normalized)
+        answer = self._entries.get(key)
+        if answer is not None or not self.near_duplicate:
+            return answer
+
+        signature = self._hasher.signature(normalized)
+        best_key: Optional[Tuple[str, str]] = None
+        best_score = self.similarity_threshold
+        with self._index_lock:
+            candidates: Set[Tuple[str, str]] = set()
+            for band in self._bands(language, signature):
+                candidates.update(self._buckets.get(band, ()))
+            for candidate in candidates:
+                score = MinHasher.similarity(signature, self._signatures[candidate])
+                if score >= best_score:
+                    best_key, best_score = candidate, score
+
+        if best_key is None:
+            return None
+
+        answer = self._entries.get(best_key)
+        if answer is not None:
+            with self._index_lock:
+                self._near_hits += 1
+            logger.debug("Answer cache near-duplicate hit (%.2f): '%s' -> '%s'", best_score, normalized, best_key[1])
+        return answer
+
+    def set(self, prompt: str, answer: CachedAnswer, language: str = "en") -> None:
+        """Store ``answer``, written in ``language``, for ``prompt``."""
+        normalized = normalize_prompt(prompt)
+        if not normalized:
+            return
+
+        key = (language, normalized)
+        self._entries.set(key, answer)
+        if self.near_duplicate:
+            signature = self._hasher.signature(normalized)
+            with self._index_lock:
+                self._signatures[key] = signature
+                for band in self._bands(language, signature):
+                    self._buckets[band].add(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters, including near-duplicate hits."""
+        payload: Dict[str, Any] = self._entries.stats().to_dict()
+        with self._index_lock:
+            payload["near_duplicate_hits"] = self._near_hits
+        payload["near_duplicate"] = self.near_duplicate
+        return payload
+
+    def _bands(self, language: str, signature: Tuple[int, ...]) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        return [
+            (language, band, signature[band * self._rows : (band + 1) * self._rows]) for band in range(self.bands)
+        ]
+
+    def _forget(self, key: Any, _value: Any) -> None:
+        """Drop ``key`` from the LSH index when the LRU evicts it."""
+        with self._index_lock:
+            signature = self._signatures.pop(key, None)
+            if signature is None:
+                return
+            for band in self._bands(key[0], signature):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band]
+
+
+def _estimate_size(key: Any, answer: CachedAnswer) -> int:
+    """Approximate the memory held by one cache entry in bytes."""
+    metadata_size = sum(len(str(name)) + len(str(value)) for name, value in answer.metadata.items())
+    return 2 * (len(str(key)) + len(answer.text)) + metadata_size + 256
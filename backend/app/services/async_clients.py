@@ -0,0 +1,101 @@
+"""Asyncio front-ends for the translation, Gemini and health data services."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from .admission import FRESH
+from .health_data import HealthDataService
+from .llm import GeminiClient, GeminiResponse
+from .translation import TranslationResult, TranslationService
+
+T = TypeVar("T")
+
+
+class BlockingCallRunner:
+    """Run blocking SDK calls on a bounded thread pool without blocking the event loop.
+
+    googletrans, ``requests`` and the Gemini SDK's cached model handles are
+    synchronous, so each call is parked on a worker thread while the event
+    loop keeps serving other chats. The pool size caps how many upstream
+    calls are in flight at once, independently of how many chats are open.
+    """
+
+    def __init__(self, max_workers: int = 64) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nirogi-io")
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        # Carry context variables (e.g. the per-request timing breakdown) into the worker thread.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, functools.partial(context.run, func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncTranslationService:
+    """Awaitable wrapper around :class:`TranslationService`."""
+
+    def __init__(self, service: TranslationService, runner: BlockingCallRunner) -> None:
+        self.service = service
+        self._runner = runner
+
+    async def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResult:
+        return await self._runner.run(self.service.translate, text, target_language, source_language)
+
+    async def translate_many(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+    ) -> List[TranslationResult]:
+        return await self._runner.run(self.service.translate_many, texts, target_language, source_language)
+
+
+class AsyncGeminiClient:
+    """Awaitable wrapper around :class:`GeminiClient`."""
+
+    def __init__(self, client: GeminiClient, runner: BlockingCallRunner) -> None:
+        self.client = client
+        self._runner = runner
+
+    @property
+    def provider_name(self) -> str:
+        return self.client.provider_name
+
+    async def get_response(self, prompt: str, system_prompt: Optional[str] = None, priority: int = FRESH) -> GeminiResponse:
+        return await self._runner.run(self.client.get_response, prompt, system_prompt, priority)
+
+
+class AsyncHealthDataService:
+    """Awaitable wrapper around :class:`HealthDataService`.
+
+    Lookups that are served from memory (the synced datasets and the local
+    indexes) run inline; anything that may reach an upstream API is
+    offloaded to the runner.
+    """
+
+    def __init__(self, service: HealthDataService, runner: BlockingCallRunner) -> None:
+        self.service = service
+        self._runner = runner
+
+    async def get_statewise_covid_data(self) -> List[Dict[str, Any]]:
+        return await self._runner.run(self.service.get_statewise_covid_data)
+
+    async def get_india_covid_stats(self) -> Dict[str, Any]:
+        return await self._runner.run(self.service.get_india_covid_stats)
+
+    async def get_nearby_hospitals(self, city_name: str) -> List[Dict[str, Any]]:
+        return await self._runner.run(self.service.get_nearby_hospitals, city_name)
+
+    async def get_vaccine_schedule(self) -> Dict[str, Any]:
+        return self.service.get_vaccine_schedule()
+
+    async def get_local_outbreak_alert(self, disease_name: str) -> Optional[Dict[str, Any]]:
+        return self.service.get_local_outbreak_alert(disease_name)
@@ -0,0 +1,389 @@
+"""Chat turn logic shared by the Flask, streaming and asyncio entry points.
+
+The pipeline is written once as a generator that never talks to an upstream
+service itself: it yields a :class:`Call` whenever it needs the translator,
+health data or Gemini, and receives the result back through ``send``. Each
+entry point supplies a small driver that runs those calls its own way
+(directly, streamed to the client, or awaited), so prompts, routing, caching
+and tool handling stay identical across them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, List, Mapping, Optional, Tuple, Union
+
+from ..utils.metrics import stage_span, tool_span
+from .admission import FOLLOW_UP
+from .answer_cache import AnswerCache, CachedAnswer
+from .compaction import CompactedPayload, PayloadCompactor
+from .intent_router import COVID_STATS, DISEASE_OUTBREAK, HOSPITALS, TOOL_SENTINELS, VACCINE_SCHEDULE, IntentRouter
+from .llm import NATIVE, native_system_prompt
+from .message_catalog import DEFAULT_LANGUAGE, get_catalog
+from .renderers import TEMPLATE, parse_render_modes, render_hospitals, render_outbreak_alert, render_vaccine_schedule
+from .sessions import Conversation
+
+TRANSLATION = "translation"
+HEALTH = "health"
+LLM = "llm"
+
+AWAITING_CITY = "awaiting_city_for_hospitals"
+AWAITING_DISEASE = "awaiting_disease_for_alert"
+
+
+@dataclass(frozen=True, slots=True)
+class Call:
+    """One upstream call the pipeline needs: ``<service>.<method>(*args, **kwargs)``.
+
+    ``streamable`` marks the routing Gemini call, whose answer a streaming
+    driver may forward to the user while it is generated.
+    """
+
+    service: str
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    streamable: bool = False
+
+    def invoke(self, services: Mapping[str, Any]) -> Any:
+        """Run the call against ``services`` (a coroutine for the async clients)."""
+        return getattr(services[self.service], self.method)(*self.args, **self.kwargs)
+
+
+@dataclass(frozen=True, slots=True)
+class Prefetch:
+    """Hint that ``call`` is likely to follow, so a driver may start it early."""
+
+    call: Call
+
+
+@dataclass(frozen=True, slots=True)
+class StreamedReply:
+    """Routing answer that the driver already delivered to the user as it streamed."""
+
+    text: str
+    metadata: Dict[str, str]
+
+
+Effect = Union[Call, Prefetch]
+ChatSteps = Generator[Effect, Any, Dict[str, Any]]
+
+# Tools whose data does not depend on a follow-up answer and can be fetched
+# speculatively while the message is still being translated and routed.
+TOOL_DATA_CALLS: Dict[str, Call] = {
+    COVID_STATS: Call(HEALTH, "get_statewise_covid_data"),
+    VACCINE_SCHEDULE: Call(HEALTH, "get_vaccine_schedule"),
+}
+
+
+def covid_summary_prompt(compacted: CompactedPayload, min_active_cases: int) -> str:
+    """Ask Gemini to summarize the statewise COVID-19 numbers."""
+    return (
+        f"Here are the Indian states with more than {min_active_cases} active COVID-19 cases, "
+        "sorted by active cases: "
+        f"{compacted.to_json()}. Please summarize this data for the user. "
+        "For each state, use a bullet point to list the **Active Cases** and **Cured (Recovered) Cases**. "
+        "Use **bolding** for the state name. Do not use a markdown table. Finally, add a new line at the very bottom: 'Source: disease.sh API'"
+    )
+
+
+def vaccine_schedule_prompt(compacted: CompactedPayload) -> str:
+    """Ask Gemini to format the vaccination schedule by age."""
+    return (
+        "Here is the official vaccination schedule: "
+        f"{compacted.to_json()}. Please format this nicely for the user, grouped by age."
+    )
+
+
+def hospitals_prompt(city_name: str, compacted: CompactedPayload) -> str:
+    """Ask Gemini to list the hospitals found in ``city_name``."""
+    return (
+        f"Here is a list of hospitals in {city_name}: {compacted.to_json()}. "
+        "Please format these results for the user, showing only the name and any available address information. "
+        "At the end, add the source: 'Source: OpenStreetMap API'"
+    )
+
+
+def outbreak_alert_prompt(disease_name: str, compacted: CompactedPayload) -> str:
+    """Ask Gemini to summarize the outbreak alert for ``disease_name``."""
+    return (
+        f"Here is the alert data for {disease_name}: {compacted.to_json()}. "
+        "Please summarize this for the user and include the 'advice' section. At the end, add the source: 'Source: National Health Portal (Simulated Data)'"
+    )
+
+
+def canned_reply(metadata: Dict[str, Any], message_id: str, language: str, **params: Any) -> str:
+    """Render a fixed bot message from the catalog directly in the user's language."""
+    catalog = get_catalog()
+    metadata["message_id"] = message_id
+    if params:
+        metadata["message_params"] = params
+    metadata["reply_language"] = language if catalog.supports(language) else DEFAULT_LANGUAGE
+    return catalog.render(message_id, language, **params)
+
+
+def mark_reply_language(metadata: Dict[str, Any], reply_language: Optional[str]) -> None:
+    if reply_language:
+        metadata["reply_language"] = reply_language
+
+
+def native_language(language: Optional[str], pipeline_modes: Optional[Dict[str, str]]) -> Optional[str]:
+    """Return ``language`` when its chats are sent to Gemini untranslated, else ``None``."""
+    if language and language != "en" and (pipeline_modes or {}).get(language) == NATIVE:
+        return language
+    return None
+
+
+def needs_output_translation(language: Optional[str], metadata: Dict[str, Any]) -> bool:
+    # Template-rendered tool replies and natively generated answers are already in the user's language.
+    return language == "hi" and metadata.get("renderer") != TEMPLATE and metadata.get("reply_language") != language
+
+
+def chat_steps(
+    message: str,
+    language: str,
+    context: Optional[str] = None,
+    answer_cache: Optional[AnswerCache] = None,
+    intent_router: Optional[IntentRouter] = None,
+    render_modes: Optional[Dict[str, str]] = None,
+    compactor: Optional[PayloadCompactor] = None,
+    conversation: Optional[Conversation] = None,
+    pipeline_modes: Optional[Dict[str, str]] = None,
+) -> ChatSteps:
+    """Run one chat turn, yielding the upstream calls it needs; returns the reply payload.
+
+    With a ``conversation`` the session's recent turns are sent to Gemini
+    along with the message, and the exchange is recorded (in the language
+    Gemini saw) once the reply is known. ``pipeline_modes`` maps languages
+    to ``native`` to send their messages to Gemini untranslated and have it
+    answer in that language; only tool arguments are translated to English.
+    """
+    turn = _ChatTurn(message, language, render_modes, compactor, pipeline_modes)
+    if context == AWAITING_CITY:
+        response_text = yield from turn.hospitals_follow_up()
+    elif context == AWAITING_DISEASE:
+        response_text = yield from turn.outbreak_follow_up()
+    elif not turn.user_text:
+        return {"message": "message cannot be empty", "metadata": turn.metadata}
+    else:
+        response_text = yield from turn.new_message(answer_cache, intent_router, conversation)
+
+    if conversation is not None:
+        conversation.record(turn.user_text, response_text, turn.metadata["context"])
+
+    if not turn.delivered and needs_output_translation(language, turn.metadata):
+        with stage_span("output_translation"):
+            translated = yield Call(TRANSLATION, "translate", (response_text,), {"target_language": "hi"})
+        response_text = translated.text
+
+    if turn.supplemental_data:
+        turn.metadata["supplemental_data"] = turn.supplemental_data
+
+    return {
+        "message": response_text,
+        "metadata": turn.metadata,
+        "source_language": turn.normalized_language,
+        "language": language or turn.normalized_language,
+    }
+
+
+class _ChatTurn:
+    """State of one chat turn while :func:`chat_steps` runs."""
+
+    def __init__(
+        self,
+        message: str,
+        language: str,
+        render_modes: Optional[Dict[str, str]],
+        compactor: Optional[PayloadCompactor],
+        pipeline_modes: Optional[Dict[str, str]],
+    ) -> None:
+        self.message = message.strip()
+        self.user_text = self.message
+        self.language = language or "en"
+        self.requested_language = language
+        self.normalized_language = self.language
+        self.native_language = native_language(language, pipeline_modes)
+        self.system_prompt = native_system_prompt(self.native_language) if self.native_language else None
+        self.modes = render_modes or parse_render_modes(None)
+        self.compactor = compactor or PayloadCompactor()
+        self.metadata: Dict[str, Any] = {"context": None}
+        self.supplemental_data: Dict[str, Any] = {}
+        # Set when the driver streamed the answer to the user as Gemini wrote it.
+        self.delivered = False
+        if self.native_language:
+            self.metadata["pipeline"] = NATIVE
+
+    def tool_argument(self) -> ChatSteps:
+        """Return the follow-up answer in English, as the health lookups expect."""
+        if self.requested_language != "hi":
+            return self.message
+        with stage_span("input_translation"):
+            result = yield Call(TRANSLATION, "translate", (self.message,), {"target_language": "en"})
+        self.user_text = result.text.strip()
+        return self.user_text
+
+    def format_with_llm(self, prompt: str, compacted: CompactedPayload) -> ChatSteps:
+        """Have Gemini format tool data and return its reply."""
+        self.metadata["prompt_tokens"] = {"before": compacted.tokens_before, "after": compacted.tokens_after}
+        with stage_span("formatting_llm"):
+            response = yield Call(LLM, "get_response", (prompt, self.system_prompt), {"priority": FOLLOW_UP})
+        self.metadata["llm"] = response.metadata
+        mark_reply_language(self.metadata, self.native_language)
+        return response.text.strip()
+
+    def hospitals_follow_up(self) -> ChatSteps:
+        if not self.message:
+            return canned_reply(self.metadata, "chat.hospitals.city_required", self.language)
+
+        city_name = yield from self.tool_argument()
+        with tool_span(HOSPITALS):
+            with stage_span("health_fetch"):
+                hospitals = yield Call(HEALTH, "get_nearby_hospitals", (city_name,))
+            if not hospitals:
+                return canned_reply(self.metadata, "chat.hospitals.none_found", self.language, city=self.message)
+
+            self.supplemental_data["hospitals"] = hospitals
+            if self.modes["hospitals"] == TEMPLATE:
+                self.metadata["renderer"] = TEMPLATE
+                return render_hospitals(hospitals, city_name, language=self.language)
+            compacted = self.compactor.hospitals(hospitals)
+            return (yield from self.format_with_llm(hospitals_prompt(city_name, compacted), compacted))
+
+    def outbreak_follow_up(self) -> ChatSteps:
+        if not self.message:
+            return canned_reply(self.metadata, "chat.outbreak.disease_required", self.language)
+
+        disease_name = yield from self.tool_argument()
+        with tool_span(DISEASE_OUTBREAK):
+            with stage_span("health_fetch"):
+                alert_data = yield Call(HEALTH, "get_local_outbreak_alert", (disease_name,))
+            if not alert_data:
+                return canned_reply(self.metadata, "chat.outbreak.none_found", self.language, disease=self.message)
+
+            self.supplemental_data["alert"] = alert_data
+            if self.modes["disease_outbreak"] == TEMPLATE:
+                self.metadata["renderer"] = TEMPLATE
+                if self.requested_language != "hi":
+                    return render_outbreak_alert(alert_data, language=self.language)
+                return (yield from self.render_alert_in_hindi(alert_data))
+            compacted = self.compactor.outbreak_alert(alert_data)
+            return (yield from self.format_with_llm(outbreak_alert_prompt(disease_name, compacted), compacted))
+
+    def render_alert_in_hindi(self, alert: Dict[str, Any]) -> ChatSteps:
+        """Translate the alert's free-text fields in one batch, then render the Hindi template."""
+        fields = [text for text in (str(alert.get(key, "")).strip() for key in ("status", "advice")) if text]
+        translated: List[Any] = []
+        if fields:
+            with stage_span("output_translation"):
+                translated = yield Call(TRANSLATION, "translate_many", (fields,), {"target_language": "hi"})
+        lookup = {source: result.text for source, result in zip(fields, translated)}
+        return render_outbreak_alert(alert, language="hi", translate=lambda text: lookup.get(text, text))
+
+    def new_message(
+        self,
+        answer_cache: Optional[AnswerCache],
+        intent_router: Optional[IntentRouter],
+        conversation: Optional[Conversation],
+    ) -> ChatSteps:
+        decision = None
+        if intent_router is not None:
+            with stage_span("intent_router"):
+                decision = intent_router.route(self.message)
+            self.metadata["router"] = decision.to_metadata()
+            expected_tool = TOOL_DATA_CALLS.get(decision.intent or decision.candidate or "")
+            if expected_tool is not None:
+                yield Prefetch(expected_tool)
+
+        if decision is not None and decision.intent is not None:
+            # The local router recognised a tool request; skip translation and the routing LLM call.
+            response_text = decision.intent
+        else:
+            response_text = yield from self.ask_llm(answer_cache, conversation)
+        return (yield from self.resolve_tool(response_text))
+
+    def ask_llm(self, answer_cache: Optional[AnswerCache], conversation: Optional[Conversation]) -> ChatSteps:
+        """Send the message to Gemini (or serve it from the answer cache) and return the raw reply."""
+        prompt = self.message
+        if self.requested_language and self.requested_language != "en" and not self.native_language:
+            with stage_span("input_translation"):
+                result = yield Call(
+                    TRANSLATION, "translate", (prompt,), {"target_language": "en", "source_language": self.requested_language}
+                )
+            prompt = self.user_text = result.text
+            self.normalized_language = result.detected_language
+
+        # Natively generated answers are only shared with chats in that language.
+        answer_language = self.native_language or "en"
+        cached_answer = answer_cache.get(prompt, answer_language) if answer_cache is not None else None
+        # Answers written with earlier turns in view are never stored. Once a session
+        # has history only cached tool sentinels are reused: they name a tool to run
+        # rather than reply to the conversation.
+        has_history = conversation is not None and conversation.has_history
+        if has_history and cached_answer is not None and cached_answer.text not in TOOL_SENTINELS:
+            cached_answer = None
+        if cached_answer is not None:
+            self.metadata["llm"] = {**cached_answer.metadata, "cache": "hit"}
+            return cached_answer.text
+
+        llm_prompt = conversation.prompt_for(prompt) if conversation is not None else prompt
+        with stage_span("routing_llm"):
+            response = yield Call(LLM, "get_response", (llm_prompt, self.system_prompt), streamable=True)
+        response_text = response.text.strip()
+        self.delivered = isinstance(response, StreamedReply)
+        self.metadata["llm"] = {**response.metadata, "streamed": "true"} if self.delivered else response.metadata
+        if answer_cache is not None and not has_history and response.metadata.get("provider") != "mock":
+            answer_cache.set(prompt, CachedAnswer(text=response_text, metadata=dict(response.metadata)), answer_language)
+        return response_text
+
+    def resolve_tool(self, response_text: str) -> ChatSteps:
+        """Resolve a tool sentinel into the user-facing reply; other text is returned as is.
+
+        In native mode Gemini formats tool data directly in the user's
+        language, and replies it wrote are marked in
+        ``metadata["reply_language"]`` so they are not translated again.
+        """
+        if response_text in TOOL_DATA_CALLS:
+            with tool_span(response_text):
+                with stage_span("health_fetch"):
+                    data = yield TOOL_DATA_CALLS[response_text]
+                if response_text == COVID_STATS:
+                    self.supplemental_data["statewise_covid"] = data
+                    compacted = self.compactor.covid_states(data)
+                    prompt = covid_summary_prompt(compacted, self.compactor.min_active_cases)
+                else:
+                    self.supplemental_data["vaccine_schedule"] = data
+                    if self.modes["vaccine_schedule"] == TEMPLATE:
+                        self.metadata["renderer"] = TEMPLATE
+                        return render_vaccine_schedule(data, language=self.language)
+                    compacted = self.compactor.vaccine_schedule(data)
+                    prompt = vaccine_schedule_prompt(compacted)
+                return (yield from self.format_with_llm(prompt, compacted))
+
+        if response_text == HOSPITALS:
+            self.metadata["context"] = AWAITING_CITY
+            return canned_reply(self.metadata, "chat.hospitals.ask_city", self.language)
+
+        if response_text == DISEASE_OUTBREAK:
+            self.metadata["context"] = AWAITING_DISEASE
+            return canned_reply(self.metadata, "chat.outbreak.ask_disease", self.language)
+
+        mark_reply_language(self.metadata, self.native_language)
+        return response_text
+
+
+def run_steps(steps: ChatSteps, services: Mapping[str, Any]) -> Dict[str, Any]:
+    """Drive ``steps`` with synchronous services, ignoring prefetch hints."""
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            effect = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as finished:
+            return finished.value
+        result, error = None, None
+        if isinstance(effect, Call):
+            try:
+                result = effect.invoke(services)
+            except Exception as exc:
+                error = exc
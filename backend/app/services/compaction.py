@@ -0,0 +1,145 @@
+"""Shrink tool payloads to the fields each prompt needs before calling the LLM."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English JSON with Gemini tokenizers.
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(value: Any) -> int:
+    """Estimate the prompt tokens used by ``value`` once serialized."""
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass(slots=True)
+class CompactedPayload:
+    """A tool payload reduced for prompting, with before/after token estimates."""
+
+    data: Any
+    tokens_before: int
+    tokens_after: int
+    dropped: int = 0
+
+    def to_json(self) -> str:
+        """Serialize the compacted data for embedding in a prompt."""
+        return json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+
+
+class PayloadCompactor:
+    """Project, pre-filter and budget tool payloads for the formatting prompt.
+
+    Each tool keeps only the fields its prompt mentions, filtering and sorting
+    happen in Python rather than being delegated to the model, and list
+    payloads are truncated until their estimated size fits ``token_budget``.
+    """
+
+    def __init__(self, token_budget: int = 1500, min_active_cases: int = 10, hospital_limit: int = 4) -> None:
+        self.token_budget = token_budget
+        self.min_active_cases = min_active_cases
+        self.hospital_limit = hospital_limit
+
+    def covid_states(self, states: Sequence[Mapping[str, Any]]) -> CompactedPayload:
+        """Keep states above the active-case threshold, sorted by active cases."""
+        projected = [
+            {
+                "state": state.get("state"),
+                "active": _to_int(state.get("active")),
+                "cured": _to_int(state.get("recovered", state.get("cured"))),
+            }
+            for state in states
+            if isinstance(state, Mapping)
+        ]
+        filtered = sorted(
+            (state for state in projected if state["active"] > self.min_active_cases),
+            key=lambda state: state["active"],
+            reverse=True,
+        )
+        return self._finish("covid_states", states, filtered)
+
+    def hospitals(self, elements: Sequence[Mapping[str, Any]]) -> CompactedPayload:
+        """Keep the name and address of the first named hospitals."""
+        projected: List[Dict[str, str]] = []
+        for element in elements:
+            tags = element.get("tags") or {}
+            name = tags.get("name")
+            if not name:
+                continue
+            entry = {"name": name}
+            address = tags.get("addr:full") or ", ".join(
+                str(tags[key]) for key in ("addr:street", "addr:suburb", "addr:city") if tags.get(key)
+            )
+            if address:
+                entry["address"] = address
+            projected.append(entry)
+            if len(projected) >= self.hospital_limit:
+                break
+        return self._finish("hospitals", elements, projected)
+
+    def vaccine_schedule(self, schedule: Mapping[str, Any]) -> CompactedPayload:
+        """Keep only age groups and vaccine names."""
+        projected = [
+            {"age": entry.get("age"), "vaccines": list(entry.get("vaccines", []))}
+            for entry in schedule.get("schedule", [])
+            if isinstance(entry, Mapping)
+        ]
+        return self._finish("vaccine_schedule", schedule, projected)
+
+    def outbreak_alert(self, alert: Mapping[str, Any]) -> CompactedPayload:
+        """Keep the alert fields referenced by the summary prompt."""
+        keys = ("disease", "region", "status", "cases_reported", "advice")
+        projected = {key: alert[key] for key in keys if alert.get(key) is not None}
+        return self._finish("outbreak_alert", alert, projected)
+
+    def _finish(self, tool: str, original: Any, data: Any) -> CompactedPayload:
+        tokens_before = estimate_tokens(original)
+        kept, dropped = fit_to_budget(data, self.token_budget) if isinstance(data, list) else (data, 0)
+        payload = CompactedPayload(
+            data=kept,
+            tokens_before=tokens_before,
+            tokens_after=estimate_tokens(kept),
+            dropped=dropped,
+        )
+        logger.info(
+            "Compacted %s payload: ~%d -> ~%d prompt tokens (%d items dropped for budget).",
+            tool,
+            payload.tokens_before,
+            payload.tokens_after,
+            dropped,
+        )
+        return payload
+
+
+def fit_to_budget(items: List[Any], token_budget: Optional[int]) -> Tuple[List[Any], int]:
+    """Drop trailing items until the serialized list fits ``token_budget``."""
+    if not token_budget or token_budget <= 0:
+        return items, 0
+
+    total = estimate_tokens(items)
+    if total <= token_budget:
+        return items, 0
+
+    kept: List[Any] = []
+    used = 1
+    for item in items:
+        cost = estimate_tokens(item) + 1
+        if used + cost > token_budget:
+            break
+        kept.append(item)
+        used += cost
+    return kept, len(items) - len(kept)
@@ -0,0 +1,170 @@
+"""Dashboard feed aggregated from the local datasets and pre-serialized for conditional GETs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .datasets import DatasetSnapshot, normalize_key
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_SOURCES = ("outbreak_alerts", "vaccination_camps", "vaccine_schedule")
+
+# Severity order used to report the worst status of merged alerts.
+_STATUS_RANK = {"high alert": 3, "moderate alert": 2, "low alert": 1}
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedFeed:
+    """One serialized version of the dashboard payload."""
+
+    body: bytes
+    etag: str
+    source_digests: Tuple[str, ...]
+    built_on: date
+
+
+def aggregate_outbreaks(payload: Any) -> List[Dict[str, Any]]:
+    """Sum reported cases per district and disease, largest outbreaks first."""
+    alerts = payload.get("alerts", []) if isinstance(payload, dict) else []
+    totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for alert in alerts:
+        if not isinstance(alert, dict) or not alert.get("region") or not alert.get("disease"):
+            continue
+        key = (normalize_key(alert["region"]), normalize_key(alert["disease"]))
+        entry = totals.setdefault(
+            key, {"district": alert["region"], "disease": alert["disease"], "cases": 0, "status": alert.get("status")}
+        )
+        try:
+            entry["cases"] += int(alert.get("cases_reported") or 0)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring non-numeric case count for %s in %s.", alert["disease"], alert["region"])
+        if _STATUS_RANK.get(normalize_key(alert.get("status") or ""), 0) > _STATUS_RANK.get(
+            normalize_key(entry["status"] or ""), 0
+        ):
+            entry["status"] = alert.get("status")
+    return sorted(totals.values(), key=lambda entry: (-entry["cases"], entry["district"], entry["disease"]))
+
+
+def _camp_date(camp: Dict[str, Any], today: Optional[date]) -> date:
+    """Return a camp's date from its ISO ``date`` or its ``days_from_today`` offset.
+
+    Raises
+    ------
+    ValueError
+        If the camp has neither a valid date nor a valid offset.
+    """
+    if camp.get("days_from_today") is not None:
+        return (today or date.today()) + timedelta(days=int(camp["days_from_today"]))
+    return date.fromisoformat(str(camp.get("date") or ""))
+
+
+def list_camps(payload: Any, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Return camps held on or after ``today`` in date order with display dates; undated camps go last.
+
+    Simulated camps may give ``days_from_today`` instead of a ``date`` so the
+    bundled feed always lists upcoming camps.
+    """
+    camps = payload.get("camps", []) if isinstance(payload, dict) else []
+    listed: List[Tuple[str, Dict[str, Any]]] = []
+    for camp in camps:
+        if not isinstance(camp, dict) or not camp.get("name"):
+            continue
+        raw_date = str(camp.get("date") or "")
+        try:
+            camp_date = _camp_date(camp, today)
+        except (TypeError, ValueError):
+            display_date, sort_key = raw_date, "9999"
+        else:
+            if today is not None and camp_date < today:
+                continue
+            display_date, sort_key = camp_date.strftime("%b %d, %Y"), camp_date.isoformat()
+        listed.append(
+            (
+                sort_key,
+                {
+                    "name": camp["name"],
+                    "area": camp.get("area", ""),
+                    "date": display_date,
+                    "vaccines": list(camp.get("vaccines") or []),
+                },
+            )
+        )
+    return [camp for _, camp in sorted(listed, key=lambda item: item[0])]
+
+
+def build_dashboard_data(outbreaks: Any, camps: Any, schedule: Any, today: Optional[date] = None) -> Dict[str, Any]:
+    """Compute the dashboard payload from the raw dataset payloads; camps before ``today`` are left out."""
+    alerts = aggregate_outbreaks(outbreaks)
+    listed_camps = list_camps(camps, today)
+    stages = schedule.get("schedule", []) if isinstance(schedule, dict) else []
+    return {
+        "outbreak_alerts": alerts,
+        "vaccination_camps": listed_camps,
+        "summary": {
+            "total_cases": sum(alert["cases"] for alert in alerts),
+            "districts": len({normalize_key(alert["district"]) for alert in alerts}),
+            "diseases": len({normalize_key(alert["disease"]) for alert in alerts}),
+            "high_alerts": sum(1 for alert in alerts if normalize_key(alert["status"] or "") == "high alert"),
+            "upcoming_camps": len(listed_camps),
+            "scheduled_doses": sum(len(stage.get("vaccines", [])) for stage in stages if isinstance(stage, dict)),
+        },
+    }
+
+
+class DashboardFeed:
+    """Serve the dashboard payload as bytes rebuilt only when a source dataset changes.
+
+    Each call compares the digests of the source snapshots with those the
+    cached body was built from; the registry already limits file checks to
+    one stat per interval, so an unchanged feed costs a tuple comparison.
+    The feed is also rebuilt when the date changes, since camps drop off the
+    upcoming list once they have passed. The ETag is a hash of the body, so
+    it changes exactly when the bytes do.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], DatasetSnapshot],
+        max_age_seconds: int = 60,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.loader = loader
+        self.today = today
+        self.max_age_seconds = max(0, int(max_age_seconds))
+        self._rendered: Optional[RenderedFeed] = None
+        self._lock = threading.Lock()
+        self._builds = 0
+
+    def current(self) -> RenderedFeed:
+        """Return the serialized feed, rebuilding it if any source changed."""
+        snapshots = [self.loader(name) for name in DASHBOARD_SOURCES]
+        digests = tuple(snapshot.digest for snapshot in snapshots)
+        today = self.today()
+        rendered = self._rendered
+        if rendered is not None and rendered.source_digests == digests and rendered.built_on == today:
+            return rendered
+
+        with self._lock:
+            rendered = self._rendered
+            if rendered is None or rendered.source_digests != digests or rendered.built_on != today:
+                payload = build_dashboard_data(*(snapshot.payload for snapshot in snapshots), today=today)
+                body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                rendered = RenderedFeed(body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"', digests, today)
+                self._rendered = rendered
+                self._builds += 1
+            return rendered
+
+    def stats(self) -> Dict[str, Any]:
+        rendered = self._rendered
+        return {
+            "builds": self._builds,
+            "bytes": len(rendered.body) if rendered else 0,
+            "etag": rendered.etag if rendered else None,
+        }
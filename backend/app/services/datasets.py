@@ -0,0 +1,152 @@
+"""Registry of local JSON datasets parsed once and indexed for constant-time lookups."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Indexer = Callable[[Any], Dict[str, Dict[str, Any]]]
+
+
+class DatasetError(RuntimeError):
+    """Raised when a registered dataset cannot be read or parsed."""
+
+
+def normalize_key(value: Any) -> str:
+    """Normalize an index key so lookups are case- and whitespace-insensitive."""
+    return str(value).strip().lower()
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSnapshot:
+    """One parsed version of a dataset file together with its indexes."""
+
+    name: str
+    payload: Any
+    indexes: Dict[str, Dict[str, Any]]
+    mtime_ns: int
+    digest: str
+    loaded_at: float = field(default_factory=time.time)
+
+    def lookup(self, index: str, key: Any, default: Any = None) -> Any:
+        """Return the entry stored under ``key`` in ``index``."""
+        return self.indexes.get(index, {}).get(normalize_key(key), default)
+
+
+@dataclass(slots=True)
+class _RegisteredDataset:
+    file_name: str
+    indexer: Optional[Indexer]
+    snapshot: Optional[DatasetSnapshot] = None
+    checked_at: float = 0.0
+    reloads: int = 0
+
+
+class DatasetRegistry:
+    """Load local JSON files once and swap in new versions only when they change.
+
+    ``snapshot`` stats the file at most every ``check_interval_seconds``. A
+    changed mtime triggers a read and SHA-256 comparison; only a changed
+    digest is parsed and re-indexed. The new snapshot replaces the old one in
+    a single reference swap, so readers always see a consistent payload and
+    index pair. A failed reload keeps serving the previous snapshot.
+    """
+
+    def __init__(self, data_dir: str, check_interval_seconds: float = 1.0) -> None:
+        self.data_dir = data_dir
+        self.check_interval_seconds = check_interval_seconds
+        self._datasets: Dict[str, _RegisteredDataset] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, file_name: str, indexer: Optional[Indexer] = None) -> None:
+        """Register ``file_name`` under ``name``; it is loaded on first access."""
+        with self._lock:
+            self._datasets[name] = _RegisteredDataset(file_name=file_name, indexer=indexer)
+
+    def snapshot(self, name: str) -> DatasetSnapshot:
+        """Return the current snapshot of ``name``, reloading it if the file changed."""
+        dataset = self._datasets.get(name)
+        if dataset is None:
+            raise DatasetError(f"Dataset '{name}' is not registered.")
+
+        current = dataset.snapshot
+        now = time.monotonic()
+        if current is not None and now - dataset.checked_at < self.check_interval_seconds:
+            return current
+
+        with self._lock:
+            current = dataset.snapshot
+            if current is not None and now - dataset.checked_at < self.check_interval_seconds:
+                return current
+            try:
+                dataset.snapshot = self._reload(name, dataset)
+            except DatasetError:
+                if current is None:
+                    raise
+                logger.warning("Keeping previous version of dataset '%s' after a failed reload.", name, exc_info=True)
+            dataset.checked_at = now
+            return dataset.snapshot
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the file, digest, reload count and index sizes of each loaded dataset."""
+        payload: Dict[str, Dict[str, Any]] = {}
+        for name, dataset in list(self._datasets.items()):
+            snapshot = dataset.snapshot
+            payload[name] = {
+                "file": dataset.file_name,
+                "loaded": snapshot is not None,
+                "reloads": dataset.reloads,
+                "digest": snapshot.digest[:12] if snapshot else None,
+                "indexes": {index: len(entries) for index, entries in snapshot.indexes.items()} if snapshot else {},
+            }
+        return payload
+
+    def _reload(self, name: str, dataset: _RegisteredDataset) -> DatasetSnapshot:
+        """Build a new snapshot if the file changed; the caller holds ``self._lock``."""
+        path = os.path.join(self.data_dir, dataset.file_name)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError as exc:
+            raise DatasetError(f"Data file '{dataset.file_name}' is missing.") from exc
+
+        current = dataset.snapshot
+        if current is not None and current.mtime_ns == mtime_ns:
+            return current
+
+        try:
+            with open(path, "rb") as handle:
+                raw = handle.read()
+        except OSError as exc:
+            raise DatasetError(f"Failed to load data from {dataset.file_name}.") from exc
+
+        digest = hashlib.sha256(raw).hexdigest()
+        if current is not None and current.digest == digest:
+            return DatasetSnapshot(name, current.payload, current.indexes, mtime_ns, digest, current.loaded_at)
+
+        try:
+            payload = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise DatasetError(f"Failed to load data from {dataset.file_name}.") from exc
+
+        indexes = dataset.indexer(payload) if dataset.indexer is not None else {}
+        if current is not None:
+            dataset.reloads += 1
+            logger.info("Reloaded dataset '%s' from %s.", name, dataset.file_name)
+        return DatasetSnapshot(name, payload, indexes, mtime_ns, digest)
+
+
+def group_by(items: Any, field_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Group dict ``items`` by the normalized value of ``field_name``."""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict) and item.get(field_name):
+            grouped.setdefault(normalize_key(item[field_name]), []).append(item)
+    return grouped
@@ -0,0 +1,236 @@
+"""Feedback ingestion: validate, queue in memory and write to SQLite in batches off the request path."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..utils.metrics import REGISTRY, record_error
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK = REGISTRY.counter("nirogi_feedback_total", "Feedback submissions by outcome.", ("outcome",))
+
+MAX_MESSAGE_CHARS = 2000
+# Optional short string fields and their length limits.
+_TEXT_FIELDS = {"category": 64, "language": 8, "session_id": 64, "page": 200}
+_STOP = object()
+
+
+class FeedbackValidationError(ValueError):
+    """Raised when a feedback payload is malformed."""
+
+
+class FeedbackQueueFull(RuntimeError):
+    """Raised when the ingestion queue is full; ``retry_after`` is a hint in seconds."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Feedback is arriving faster than it can be stored; please retry shortly.")
+        self.retry_after = retry_after
+
+
+def validate_feedback(payload: Any) -> Dict[str, Any]:
+    """Return the accepted fields of ``payload``.
+
+    A submission needs a ``message`` or a ``rating`` from 1 to 5; ``category``,
+    ``language``, ``session_id`` and ``page`` are optional short strings.
+    Other fields are dropped.
+
+    Raises
+    ------
+    FeedbackValidationError
+        If the payload is not an object or a field has the wrong type or size.
+    """
+    if not isinstance(payload, Mapping):
+        raise FeedbackValidationError("feedback must be a JSON object")
+
+    entry: Dict[str, Any] = {}
+    message = payload.get("message")
+    if message is not None:
+        if not isinstance(message, str):
+            raise FeedbackValidationError("message must be a string")
+        message = message.strip()
+        if len(message) > MAX_MESSAGE_CHARS:
+            raise FeedbackValidationError(f"message must be at most {MAX_MESSAGE_CHARS} characters")
+        if message:
+            entry["message"] = message
+
+    rating = payload.get("rating")
+    if rating is not None:
+        if isinstance(rating, bool) or not isinstance(rating, int) or not 1 <= rating <= 5:
+            raise FeedbackValidationError("rating must be an integer from 1 to 5")
+        entry["rating"] = rating
+
+    if not entry:
+        raise FeedbackValidationError("message or rating is required")
+
+    for name, limit in _TEXT_FIELDS.items():
+        value = payload.get(name)
+        if value is None:
+            continue
+        if not isinstance(value, str) or len(value) > limit:
+            raise FeedbackValidationError(f"{name} must be a string of at most {limit} characters")
+        entry[name] = value
+    return entry
+
+
+class FeedbackStore:
+    """Append-only SQLite table of feedback entries, written one transaction per batch."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS feedback ("
+                " id INTEGER PRIMARY KEY,"
+                " received_at REAL NOT NULL,"
+                " payload TEXT NOT NULL)"
+            )
+
+    def append(self, entries: Sequence[Tuple[float, Dict[str, Any]]]) -> None:
+        """Insert ``(received_at, entry)`` pairs in a single transaction."""
+        rows = [(received_at, json.dumps(entry, ensure_ascii=False)) for received_at, entry in entries]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT INTO feedback (received_at, payload) VALUES (?, ?)", rows)
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return the newest entries first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT received_at, payload FROM feedback ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [{"received_at": received_at, **json.loads(payload)} for received_at, payload in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+
+
+class FeedbackIngestor:
+    """Accept feedback into a bounded queue and persist it from one background writer.
+
+    ``submit`` only enqueues, so the request path never waits on storage.
+    The writer thread (started on first use) flushes a batch once it holds
+    ``batch_size`` entries or its oldest entry is ``flush_interval`` seconds
+    old. When the queue is full ``submit`` raises ``FeedbackQueueFull``
+    instead of blocking. ``stop`` drains and flushes whatever is queued; it
+    is also registered with ``atexit``.
+    """
+
+    def __init__(
+        self,
+        store: FeedbackStore,
+        max_queue: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue))
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._counts = {"accepted": 0, "rejected": 0, "written": 0, "failed": 0, "batches": 0}
+        self._counts_lock = threading.Lock()
+
+    def submit(self, entry: Dict[str, Any]) -> None:
+        """Queue a validated entry.
+
+        Raises
+        ------
+        FeedbackQueueFull
+            If the queue is at capacity.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((time.time(), entry))
+        except queue.Full:
+            self._count("rejected")
+            raise FeedbackQueueFull(retry_after=max(1, round(self.flush_interval))) from None
+        self._count("accepted")
+
+    def _count(self, outcome: str, amount: int = 1) -> None:
+        with self._counts_lock:
+            self._counts[outcome] += amount
+        FEEDBACK.inc(outcome, amount=amount)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="feedback-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush everything queued so far and stop the writer."""
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        # The sentinel may not fit in a full queue; the writer drains it either way.
+        while thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        batch: List[Tuple[float, Dict[str, Any]]] = []
+        deadline = 0.0
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._drain_into(batch)
+                self._flush(batch)
+                return
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+            if len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+
+    def _drain_into(self, batch: List[Tuple[float, Dict[str, Any]]]) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                batch.append(item)
+
+    def _flush(self, batch: List[Tuple[float, Dict[str, Any]]]) -> None:
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start : start + self.batch_size]
+            try:
+                self.store.append(chunk)
+            except sqlite3.Error as exc:
+                logger.exception("Failed to store %d feedback entries.", len(chunk))
+                record_error("feedback", "sqlite", exc)
+                self._count("failed", len(chunk))
+                continue
+            self._count("written", len(chunk))
+            with self._counts_lock:
+                self._counts["batches"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counts_lock:
+            counts = dict(self._counts)
+        return {"queued": self._queue.qsize(), "max_queue": self._queue.maxsize, **counts}
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import requests
 
+from .datasets import DatasetError, DatasetRegistry, DatasetSnapshot, group_by, normalize_key
+from .hospital_store import HospitalStore, area_key
+from .sync import SyncScheduler
+from .upstream import UpstreamClient
+from ..utils.metrics import record_fallback
+from ..utils.singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,79 +35,241 @@ class HealthInsight:
 
 
 DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../data"))
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+DISEASE_SH_URL = "https://disease.sh/v3/covid-19"
+
+# Fail fast on unreachable hosts; Overpass itself may take a while to answer.
+_OVERPASS_TIMEOUT = (3.05, 15)
+# Background city refreshes share a few worker threads instead of one thread each.
+_REFRESH_WORKERS = 2
+
+# Refresh interval and jitter, in seconds, for each dataset kept warm by the
+# sync scheduler. Override per source with ``SYNC_INTERVALS``.
+DEFAULT_SYNC_INTERVALS: Dict[str, Tuple[float, float]] = {
+    "covid_statewise": (6 * 60 * 60, 10 * 60),
+    "covid_india": (6 * 60 * 60, 10 * 60),
+    "outbreak_alerts": (5 * 60, 30),
+    "vaccine_schedule": (60 * 60, 60),
+}
+
+
+def _city_query(city_name: str) -> str:
+    """Build the Overpass query for hospitals and clinics inside a named area."""
+    escaped_city = city_name.replace('"', '\\"')
+    return f"""
+[out:json][timeout:25];
+area["name"~"^{escaped_city}$", i]->.searchArea;
+(
+    node["amenity"="hospital"](area.searchArea);
+    way["amenity"="hospital"](area.searchArea);
+    relation["amenity"="hospital"](area.searchArea);
+
+    node["amenity"="clinic"](area.searchArea);
+    way["amenity"="clinic"](area.searchArea);
+    relation["amenity"="clinic"](area.searchArea);
+);
+out center;
+"""
+
+
+def _around_query(lat: float, lon: float, radius_m: int) -> str:
+    """Build the Overpass query for hospitals and clinics around a coordinate."""
+    return f"""
+[out:json][timeout:25];
+(
+    nwr["amenity"="hospital"](around:{radius_m},{lat},{lon});
+    nwr["amenity"="clinic"](around:{radius_m},{lat},{lon});
+);
+out center;
+"""
 
 
 class HealthDataService:
     """Fetches health data from official sources such as CoWIN and MoHFW."""
 
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        hospital_store: Optional[HospitalStore] = None,
+        sync: Optional[SyncScheduler] = None,
+        upstream: Optional[UpstreamClient] = None,
+    ) -> None:
         self.base_url = base_url or ""
+        self.hospital_store = hospital_store
+        self.sync = sync
+        self.upstream = upstream or UpstreamClient()
+        self._flights = SingleFlight()
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._last_refresh_attempt: Dict[str, float] = {}
+        self._refresh_executor = ThreadPoolExecutor(max_workers=_REFRESH_WORKERS, thread_name_prefix="hospital-refresh")
+
+    def register_sync_sources(
+        self,
+        scheduler: SyncScheduler,
+        intervals: Optional[Mapping[str, Tuple[float, float]]] = None,
+    ) -> None:
+        """Register the COVID feeds and local datasets with ``scheduler`` and read through it."""
+        loaders: Dict[str, Callable[[], Any]] = {
+            "covid_statewise": self._fetch_statewise_covid_data,
+            "covid_india": self._fetch_india_covid_stats,
+            "outbreak_alerts": lambda: load_dataset("outbreak_alerts"),
+            "vaccine_schedule": get_vaccine_schedule,
+        }
+        overrides = intervals or {}
+        for name, loader in loaders.items():
+            interval, jitter = overrides.get(name, DEFAULT_SYNC_INTERVALS[name])
+            scheduler.register(name, loader, interval, jitter)
+        self.sync = scheduler
+
+    def _read(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Return dataset ``name`` from the sync scheduler, or load it directly without one."""
+        if self.sync is not None and name in self.sync:
+            return self.sync.get(name)
+        return loader()
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return how many concurrent identical upstream fetches shared one call."""
+        return self._flights.stats()
 
     def get_india_covid_stats(self) -> Dict[str, Any]:
         """Return national COVID-19 statistics for India."""
+        return self._read("covid_india", self._fetch_india_covid_stats)
+
+    def _fetch_india_covid_stats(self) -> Dict[str, Any]:
+        return self._flights.do("covid_india", self._request_india_covid_stats)
+
+    def _request_india_covid_stats(self) -> Dict[str, Any]:
         try:
-            response = requests.get("https://disease.sh/v3/covid-19/countries/India", timeout=5)
-            response.raise_for_status()
+            response = self.upstream.get(f"{DISEASE_SH_URL}/countries/India", timeout=5)
         except requests.RequestException as exc:
             raise HealthDataError(str(exc)) from exc
 
         return response.json()
 
     def get_nearby_hospitals(self, city_name: str) -> List[Dict[str, Any]]:
-        """Return a list of hospitals and clinics for the specified city using Overpass."""
+        """Return a list of hospitals and clinics for the specified city.
+
+        Cities already in the local hospital store are answered from it; stale
+        entries are served immediately while a background Overpass refresh
+        runs. Unknown cities are fetched from Overpass synchronously.
+        """
         normalized_city = city_name.strip()
         if not normalized_city:
             raise HealthDataError("City name is required to fetch nearby hospitals.")
 
-        overpass_url = "https://overpass-api.de/api/interpreter"
-        escaped_city = normalized_city.replace('"', '\\"')
-        query_string = f"""
-[out:json][timeout:25];
-area["name"~"^{escaped_city}$", i]->.searchArea;
-(
-    node["amenity"="hospital"](area.searchArea);
-    way["amenity"="hospital"](area.searchArea);
-    relation["amenity"="hospital"](area.searchArea);
+        if self.hospital_store is not None:
+            record = self.hospital_store.get_city(normalized_city)
+            if record is not None and record.elements:
+                if record.is_stale(self.hospital_store.max_age_seconds):
+                    self.refresh_city_in_background(normalized_city)
+                return record.elements
 
-    node["amenity"="clinic"](area.searchArea);
-    way["amenity"="clinic"](area.searchArea);
-    relation["amenity"="clinic"](area.searchArea);
-);
-out center;
-"""
+        return self._fetch_hospitals(normalized_city)
+
+    def get_hospitals_near(self, lat: float, lon: float, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return the hospitals closest to a coordinate, ordered by distance."""
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise HealthDataError("Coordinates are out of range.")
+
+        if self.hospital_store is None:
+            raise HealthDataError("Nearby hospital search is not available.")
 
+        hospitals = self.hospital_store.nearest(lat, lon, limit=limit)
+        if hospitals:
+            return hospitals
+
+        # Nothing stored around this point yet: fetch the area once from
+        # Overpass and keep it in the store for later lookups.
         try:
-            response = requests.post(overpass_url, data={"data": query_string}, timeout=15)
-            response.raise_for_status()
-            payload = response.json()
+            elements = self._query_overpass(_around_query(lat, lon, radius_m=10000))
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning("Overpass nearby lookup failed for %s: %s", area_key(lat, lon), exc)
+            raise HealthDataError("Hospital lookup timed out. Please try again shortly.") from exc
+
+        self.hospital_store.upsert_area(lat, lon, elements)
+        return self.hospital_store.nearest(lat, lon, limit=limit)
+
+    def refresh_city_in_background(self, city_name: str, min_interval_seconds: float = 300.0) -> bool:
+        """Queue a refresh of one city from Overpass on the shared refresh pool; return False if skipped."""
+        key = city_name.strip().lower()
+        now = time.monotonic()
+        with self._refresh_lock:
+            last_attempt = self._last_refresh_attempt.get(key)
+            if key in self._refreshing or (last_attempt is not None and now - last_attempt < min_interval_seconds):
+                return False
+            self._refreshing.add(key)
+            self._last_refresh_attempt[key] = now
+
+        self._refresh_executor.submit(self._refresh_city, city_name.strip())
+        return True
+
+    def _refresh_city(self, city_name: str) -> None:
+        try:
+            elements = self._query_overpass(_city_query(city_name))
+            if elements and self.hospital_store is not None:
+                self.hospital_store.upsert_city(city_name, elements)
+        except (requests.RequestException, ValueError) as exc:
+            logger.info("Background hospital refresh failed for %s: %s", city_name, exc)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(city_name.lower())
+
+    def _query_overpass(self, query_string: str, timeout: Any = _OVERPASS_TIMEOUT) -> List[Dict[str, Any]]:
+        """Run an Overpass query and return its elements.
+
+        Concurrent identical queries (e.g. a surge of lookups for one city)
+        share a single request.
+        """
+        return self._flights.do(("overpass", query_string), lambda: self._post_overpass(query_string, timeout))
+
+    def _post_overpass(self, query_string: str, timeout: Any) -> List[Dict[str, Any]]:
+        response = self.upstream.post(OVERPASS_URL, data={"data": query_string}, timeout=timeout)
+        payload = response.json()
+        elements = payload.get("elements", [])
+        return elements if isinstance(elements, list) else []
+
+    def _fetch_hospitals(self, normalized_city: str) -> List[Dict[str, Any]]:
+        """Fetch hospitals for a city from Overpass, falling back to bundled data."""
+        try:
+            elements = self._query_overpass(_city_query(normalized_city))
         except requests.RequestException as exc:
             logger.warning("Overpass request failed for %s: %s", normalized_city, exc)
             fallback = self.get_local_hospital_fallback(normalized_city)
             if fallback:
+                record_fallback("hospital_fallback")
                 return fallback
             raise HealthDataError("Hospital lookup timed out. Please try again shortly.") from exc
         except ValueError as exc:
             logger.warning("Overpass response parsing failed for %s: %s", normalized_city, exc)
             fallback = self.get_local_hospital_fallback(normalized_city)
             if fallback:
+                record_fallback("hospital_fallback")
                 return fallback
             raise HealthDataError("Received an unexpected response while fetching hospitals.") from exc
 
-        elements = payload.get("elements", [])
-        if not isinstance(elements, list) or not elements:
+        if not elements:
             fallback = self.get_local_hospital_fallback(normalized_city)
             if fallback:
+                record_fallback("hospital_fallback")
                 return fallback
             raise HealthDataError("No hospitals were found for the requested city.")
 
+        if self.hospital_store is not None:
+            self.hospital_store.upsert_city(normalized_city, elements)
+
         return elements
 
     def get_statewise_covid_data(self) -> List[Dict[str, Any]]:
         """Return live state-wise COVID-19 statistics for India."""
-        url = "https://disease.sh/v3/covid-19/gov/India"
+        return self._read("covid_statewise", self._fetch_statewise_covid_data)
+
+    def _fetch_statewise_covid_data(self) -> List[Dict[str, Any]]:
+        return self._flights.do("covid_statewise", self._request_statewise_covid_data)
+
+    def _request_statewise_covid_data(self) -> List[Dict[str, Any]]:
         try:
-            response = requests.get(url, timeout=8)
-            response.raise_for_status()
+            response = self.upstream.get(f"{DISEASE_SH_URL}/gov/India", timeout=8)
             payload = response.json()
         except requests.RequestException as exc:
             raise HealthDataError(str(exc)) from exc
@@ -113,11 +284,15 @@ out center;
 
     def get_vaccine_schedule(self) -> Dict[str, Any]:
         """Expose the local vaccine schedule via the service instance."""
-        return get_vaccine_schedule()
+        return self._read("vaccine_schedule", get_vaccine_schedule)
 
     def get_local_outbreak_alert(self, disease_name: str) -> Optional[Dict[str, Any]]:
         """Expose the local outbreak alert lookup via the service instance."""
-        return get_local_outbreak_alert(disease_name)
+        if not disease_name:
+            return None
+        snapshot: DatasetSnapshot = self._read("outbreak_alerts", lambda: load_dataset("outbreak_alerts"))
+        alerts = snapshot.lookup("disease", disease_name)
+        return alerts[0] if alerts else None
 
     def get_local_hospital_fallback(self, city_name: str) -> Optional[List[Dict[str, Any]]]:
         """Expose local hospital fallback data via the service instance."""
@@ -135,8 +310,7 @@ out center;
             return {}
 
         try:
-            response = requests.get(self.base_url, timeout=5)
-            response.raise_for_status()
+            response = self.upstream.get(self.base_url, timeout=5)
         except requests.RequestException as exc:
             raise HealthDataError(str(exc)) from exc
 
@@ -148,21 +322,41 @@ out center;
         }
 
 
-def _load_json_file(file_name: str) -> Any:
-    file_path = os.path.join(DATA_DIR, file_name)
-    if not os.path.exists(file_path):
-        raise HealthDataError(f"Data file '{file_name}' is missing.")
+def _index_outbreak_alerts(payload: Any) -> Dict[str, Dict[str, Any]]:
+    alerts = payload.get("alerts", []) if isinstance(payload, dict) else []
+    return {"disease": group_by(alerts, "disease"), "region": group_by(alerts, "region")}
+
+
+def _index_hospital_fallbacks(payload: Any) -> Dict[str, Dict[str, Any]]:
+    fallbacks = payload.get("fallbacks", {}) if isinstance(payload, dict) else {}
+    if not isinstance(fallbacks, dict):
+        return {"city": {}}
+    return {"city": {normalize_key(city): elements for city, elements in fallbacks.items() if isinstance(elements, list)}}
 
+
+_datasets = DatasetRegistry(DATA_DIR)
+_datasets.register("outbreak_alerts", "outbreak_alerts.json", _index_outbreak_alerts)
+_datasets.register("vaccine_schedule", "vaccine_schedules.json")
+_datasets.register("vaccination_camps", "vaccination_camps.json")
+_datasets.register("hospital_fallbacks", "hospital_fallbacks.json", _index_hospital_fallbacks)
+
+
+def load_dataset(name: str) -> DatasetSnapshot:
+    """Return the current indexed snapshot of a bundled dataset."""
     try:
-        with open(file_path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (OSError, json.JSONDecodeError) as exc:
-        raise HealthDataError(f"Failed to load data from {file_name}.") from exc
+        return _datasets.snapshot(name)
+    except DatasetError as exc:
+        raise HealthDataError(str(exc)) from exc
+
+
+def dataset_stats() -> Dict[str, Dict[str, Any]]:
+    """Return load and index statistics for the bundled datasets."""
+    return _datasets.stats()
 
 
 def get_vaccine_schedule() -> Dict[str, Any]:
     """Return the locally stored vaccine schedule."""
-    return _load_json_file("vaccine_schedules.json")
+    return load_dataset("vaccine_schedule").payload
 
 
 def get_local_outbreak_alert(disease_name: str) -> Optional[Dict[str, Any]]:
@@ -170,20 +364,21 @@ def get_local_outbreak_alert(disease_name: str) -> Optional[Dict[str, Any]]:
     if not disease_name:
         return None
 
-    payload = _load_json_file("outbreak_alerts.json")
-    alerts = payload.get("alerts", [])
-    if not isinstance(alerts, list):
-        return None
+    alerts = load_dataset("outbreak_alerts").lookup("disease", disease_name)
+    return alerts[0] if alerts else None
+
+
+def get_outbreak_alerts_for_region(region: str) -> List[Dict[str, Any]]:
+    """Return every locally stored outbreak alert for the given region."""
+    if not region:
+        return []
+
+    return list(load_dataset("outbreak_alerts").lookup("region", region, default=[]))
 
-    lower_name = disease_name.strip().lower()
-    for alert in alerts:
-        if not isinstance(alert, dict):
-            continue
-        disease = str(alert.get("disease", "")).lower()
-        if disease == lower_name:
-            return alert
 
-    return None
+def load_hospital_fallbacks() -> Dict[str, List[Dict[str, Any]]]:
+    """Return every bundled fallback city keyed by its lower-case name."""
+    return dict(load_dataset("hospital_fallbacks").indexes["city"])
 
 
 def get_local_hospital_fallback(city_name: str) -> Optional[List[Dict[str, Any]]]:
@@ -192,12 +387,6 @@ def get_local_hospital_fallback(city_name: str) -> Optional[List[Dict[str, Any]]
         return None
 
     try:
-        payload = _load_json_file("hospital_fallbacks.json")
+        return load_dataset("hospital_fallbacks").lookup("city", city_name)
     except HealthDataError:
         return None
-
-    fallbacks = payload.get("fallbacks", {})
-    if not isinstance(fallbacks, dict):
-        return None
-
-    return fallbacks.get(city_name.strip().lower())
@@ -0,0 +1,289 @@
+"""Local SQLite store of hospitals with per-city freshness and nearest-K lookup."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEGREE = 111.32
+_GRID_SIZE_DEGREES = 0.1
+
+SOURCE_OVERPASS = "overpass"
+SOURCE_FALLBACK = "fallback"
+
+
+@dataclass(slots=True)
+class CityHospitals:
+    """Hospitals stored for one city together with their freshness."""
+
+    city: str
+    elements: List[Dict[str, Any]]
+    refreshed_at: float
+    source: str
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        """Return True when the record should be refreshed from upstream."""
+        return self.source != SOURCE_OVERPASS or time.time() - self.refreshed_at > max_age_seconds
+
+
+def element_coordinates(element: Mapping[str, Any]) -> Optional[Tuple[float, float]]:
+    """Return ``(lat, lon)`` for an Overpass node or the centre of a way/relation."""
+    lat, lon = element.get("lat"), element.get("lon")
+    if lat is None or lon is None:
+        center = element.get("center") or {}
+        lat, lon = center.get("lat"), center.get("lon")
+    if lat is None or lon is None:
+        return None
+    try:
+        return float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+
+def area_key(lat: float, lon: float) -> str:
+    """Return the key of the roughly 11 km grid area containing ``(lat, lon)``."""
+    return f"@{round(lat, 1)},{round(lon, 1)}"
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class HospitalStore:
+    """SQLite-backed hospital cache with an R-tree (or grid) spatial index.
+
+    City lookups return every element stored for the city. Hospitals fetched
+    around a coordinate are stored per grid area (see ``area_key``) and
+    tracked in their own table, so they never show up as cities. ``nearest``
+    answers nearest-K queries by growing a bounding box over the spatial
+    index until enough candidates are found, then ranking them by
+    great-circle distance. When the SQLite build lacks the R-tree module a
+    coarse lat/lon grid index is used instead.
+    """
+
+    def __init__(self, path: str = ":memory:", max_age_seconds: float = 7 * 24 * 60 * 60) -> None:
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self.uses_rtree = self._create_schema()
+
+    def _create_schema(self) -> bool:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cities ("
+                " city TEXT PRIMARY KEY,"
+                " refreshed_at REAL NOT NULL,"
+                " source TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS areas ("
+                " area TEXT PRIMARY KEY,"
+                " refreshed_at REAL NOT NULL)"
+            )
+            # Older stores kept coordinate lookups as "@lat,lon" pseudo-cities.
+            self._connection.execute(
+                "INSERT OR IGNORE INTO areas (area, refreshed_at) SELECT city, refreshed_at FROM cities WHERE city LIKE '@%'"
+            )
+            self._connection.execute("DELETE FROM cities WHERE city LIKE '@%'")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS hospitals ("
+                " id INTEGER PRIMARY KEY,"
+                " city TEXT NOT NULL,"
+                " lat REAL,"
+                " lon REAL,"
+                " grid_lat INTEGER,"
+                " grid_lon INTEGER,"
+                " payload TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS hospitals_city ON hospitals (city)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS hospitals_grid ON hospitals (grid_lat, grid_lon)")
+            try:
+                self._connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS hospitals_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+                )
+            except sqlite3.OperationalError:
+                logger.info("SQLite R-tree module unavailable; using grid index for hospital lookups.")
+                return False
+        return True
+
+    def get_city(self, city: str) -> Optional[CityHospitals]:
+        """Return the stored hospitals for ``city`` or ``None`` if never loaded."""
+        key = city.strip().lower()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT refreshed_at, source FROM cities WHERE city = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            payloads = self._connection.execute(
+                "SELECT payload FROM hospitals WHERE city = ? ORDER BY id",
+                (key,),
+            ).fetchall()
+
+        return CityHospitals(
+            city=key,
+            elements=[json.loads(payload) for (payload,) in payloads],
+            refreshed_at=row[0],
+            source=row[1],
+        )
+
+    def upsert_city(
+        self,
+        city: str,
+        elements: Iterable[Mapping[str, Any]],
+        source: str = SOURCE_OVERPASS,
+        refreshed_at: Optional[float] = None,
+    ) -> None:
+        """Atomically replace every hospital stored for ``city``."""
+        key = city.strip().lower()
+        with self._lock, self._connection:
+            self._replace_hospitals(key, elements)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cities (city, refreshed_at, source) VALUES (?, ?, ?)",
+                (key, refreshed_at if refreshed_at is not None else time.time(), source),
+            )
+
+    def upsert_area(self, lat: float, lon: float, elements: Iterable[Mapping[str, Any]]) -> str:
+        """Atomically replace the hospitals fetched around ``(lat, lon)``; return the area key."""
+        key = area_key(lat, lon)
+        with self._lock, self._connection:
+            self._replace_hospitals(key, elements)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO areas (area, refreshed_at) VALUES (?, ?)",
+                (key, time.time()),
+            )
+        return key
+
+    def _replace_hospitals(self, key: str, elements: Iterable[Mapping[str, Any]]) -> None:
+        """Swap the hospital rows stored under ``key``; the caller holds the lock and transaction."""
+        rows = []
+        for element in elements:
+            coordinates = element_coordinates(element)
+            lat, lon = coordinates if coordinates else (None, None)
+            rows.append((key, lat, lon, *self._grid_cell(lat, lon), json.dumps(element, ensure_ascii=False)))
+
+        if self.uses_rtree:
+            self._connection.execute(
+                "DELETE FROM hospitals_rtree WHERE id IN (SELECT id FROM hospitals WHERE city = ?)",
+                (key,),
+            )
+        self._connection.execute("DELETE FROM hospitals WHERE city = ?", (key,))
+        for row in rows:
+            cursor = self._connection.execute(
+                "INSERT INTO hospitals (city, lat, lon, grid_lat, grid_lon, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            lat, lon = row[1], row[2]
+            if self.uses_rtree and lat is not None and lon is not None:
+                self._connection.execute(
+                    "INSERT INTO hospitals_rtree (id, min_lat, max_lat, min_lon, max_lon) VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, lat, lat, lon, lon),
+                )
+
+    def seed_fallbacks(self, fallbacks: Mapping[str, List[Mapping[str, Any]]]) -> int:
+        """Load bundled fallback cities that are not in the store yet; return how many were added."""
+        added = 0
+        for city, elements in fallbacks.items():
+            if not isinstance(elements, list) or self.get_city(city) is not None:
+                continue
+            # A zero timestamp keeps fallback data permanently stale so the
+            # first lookup schedules a real Overpass refresh.
+            self.upsert_city(city, elements, source=SOURCE_FALLBACK, refreshed_at=0.0)
+            added += 1
+        return added
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        limit: int = 5,
+        max_radius_km: float = 50.0,
+    ) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` hospitals closest to ``(lat, lon)`` within ``max_radius_km``.
+
+        Each element is returned with an added ``distance_km`` field.
+        """
+        radius_km = min(2.0, max_radius_km)
+        candidates: List[Tuple[float, str]] = []
+        while True:
+            candidates = self._candidates_within(lat, lon, radius_km)
+            if len(candidates) >= limit or radius_km >= max_radius_km:
+                break
+            radius_km = min(radius_km * 2, max_radius_km)
+
+        # The box can miss closer points outside its corners' inscribed circle,
+        # so widen it once to the distance of the K-th candidate.
+        if len(candidates) >= limit:
+            kth_distance = sorted(distance for distance, _ in candidates)[limit - 1]
+            if kth_distance > radius_km:
+                candidates = self._candidates_within(lat, lon, min(kth_distance, max_radius_km))
+
+        ranked = sorted((item for item in candidates if item[0] <= max_radius_km), key=lambda item: item[0])
+        results: List[Dict[str, Any]] = []
+        seen: set = set()
+        for distance, payload in ranked:
+            element = json.loads(payload)
+            identity = (element.get("type"), element.get("id"))
+            if element.get("id") is not None and identity in seen:
+                continue
+            seen.add(identity)
+            element["distance_km"] = round(distance, 2)
+            results.append(element)
+            if len(results) >= limit:
+                break
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Return row counts and the index in use."""
+        with self._lock:
+            (cities,) = self._connection.execute("SELECT COUNT(*) FROM cities").fetchone()
+            (areas,) = self._connection.execute("SELECT COUNT(*) FROM areas").fetchone()
+            (hospitals,) = self._connection.execute("SELECT COUNT(*) FROM hospitals").fetchone()
+        return {
+            "cities": cities,
+            "areas": areas,
+            "hospitals": hospitals,
+            "index": "rtree" if self.uses_rtree else "grid",
+        }
+
+    def _candidates_within(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, str]]:
+        d_lat = radius_km / _KM_PER_DEGREE
+        d_lon = radius_km / (_KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+        with self._lock:
+            if self.uses_rtree:
+                rows = self._connection.execute(
+                    "SELECT h.lat, h.lon, h.payload FROM hospitals_rtree r JOIN hospitals h ON h.id = r.id"
+                    " WHERE r.min_lat >= ? AND r.max_lat <= ? AND r.min_lon >= ? AND r.max_lon <= ?",
+                    (lat - d_lat, lat + d_lat, lon - d_lon, lon + d_lon),
+                ).fetchall()
+            else:
+                low_lat, low_lon = self._grid_cell(lat - d_lat, lon - d_lon)
+                high_lat, high_lon = self._grid_cell(lat + d_lat, lon + d_lon)
+                rows = self._connection.execute(
+                    "SELECT lat, lon, payload FROM hospitals"
+                    " WHERE grid_lat BETWEEN ? AND ? AND grid_lon BETWEEN ? AND ?",
+                    (low_lat, high_lat, low_lon, high_lon),
+                ).fetchall()
+        return [(haversine_km(lat, lon, row_lat, row_lon), payload) for row_lat, row_lon, payload in rows]
+
+    @staticmethod
+    def _grid_cell(lat: Optional[float], lon: Optional[float]) -> Tuple[Optional[int], Optional[int]]:
+        if lat is None or lon is None:
+            return None, None
+        return math.floor(lat / _GRID_SIZE_DEGREES), math.floor(lon / _GRID_SIZE_DEGREES)
@@ -0,0 +1,389 @@
+"""Local intent router that resolves tool requests without an LLM round trip."""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+COVID_STATS = "@@FETCH_COVID_STATS@@"
+HOSPITALS = "@@FETCH_HOSPITALS@@"
+VACCINE_SCHEDULE = "@@FETCH_VACCINE_SCHEDULE@@"
+DISEASE_OUTBREAK = "@@FETCH_DISEASE_OUTBREAK@@"
+NO_TOOL = "none"
+
+TOOL_SENTINELS: Tuple[str, ...] = (COVID_STATS, HOSPITALS, VACCINE_SCHEDULE, DISEASE_OUTBREAK)
+
+# Exact trigger phrases. These mirror the tool instructions in
+# ``NIROGI_SYSTEM_PROMPT`` plus common Hindi and romanized Hindi phrasings.
+TRIGGER_PHRASES: Dict[str, Tuple[str, ...]] = {
+    COVID_STATS: (
+        "live cases",
+        "covid stats",
+        "covid statistics",
+        "outbreak data",
+        "today's covid numbers",
+        "covid numbers",
+        "covid cases today",
+        "corona cases",
+        "कोविड के आंकड़े",
+        "कोरोना के मामले",
+        "आज के कोविड मामले",
+        "corona ke case",
+        "covid ke aankde",
+    ),
+    HOSPITALS: (
+        "nearby hospitals",
+        "nearby hospital",
+        "hospitals near me",
+        "hospital near me",
+        "clinics near me",
+        "clinic near me",
+        "doctors in my area",
+        "find hospitals",
+        "find nearby hospitals",
+        "पास के अस्पताल",
+        "नजदीकी अस्पताल",
+        "नज़दीकी अस्पताल",
+        "अस्पताल कहाँ है",
+        "paas ke hospital",
+        "paas ka hospital",
+        "najdeeki aspatal",
+        "hospital kahan hai",
+    ),
+    VACCINE_SCHEDULE: (
+        "vaccine schedule",
+        "vaccination schedule",
+        "immunization chart",
+        "immunization schedule",
+        "vaccines for baby",
+        "baby vaccines",
+        "vaccine chart",
+        "टीकाकरण कार्यक्रम",
+        "टीकाकरण सूची",
+        "बच्चे के टीके",
+        "टीके की सूची",
+        "bacche ke teeke",
+        "tika suchi",
+        "teekakaran schedule",
+    ),
+    DISEASE_OUTBREAK: (
+        "dengue alert",
+        "malaria alert",
+        "malaria cases",
+        "dengue cases",
+        "dengue outbreak",
+        "malaria outbreak",
+        "outbreak alert",
+        "outbreak alerts",
+        "डेंगू अलर्ट",
+        "डेंगू का प्रकोप",
+        "मलेरिया के मामले",
+        "प्रकोप की चेतावनी",
+        "dengue ka prakop",
+        "malaria ke case",
+    ),
+}
+
+# Request wording that may surround a trigger phrase without changing what is
+# asked ("show me the vaccine schedule"). Any other word next to a phrase
+# ("how to avoid dengue cases") leaves the decision to the model.
+FILLER_WORDS: FrozenSet[str] = frozenset(
+    (
+        "a", "all", "any", "are", "check", "current", "display", "find", "for", "get", "give", "i", "is",
+        "latest", "list", "me", "my", "need", "now", "please", "see", "show", "tell", "the", "today",
+        "what", "want", "batao", "dikhao", "hai", "kya", "mujhe",
+        "क्या", "दिखाओ", "दिखाइए", "बताओ", "बताइए", "मुझे", "है", "हैं",
+    )
+)
+
+# Additional paraphrases used only to train the statistical model. The
+# ``none`` class teaches it which health questions must still go to Gemini,
+# including ones that contain a trigger phrase.
+TRAINING_EXAMPLES: Dict[str, Tuple[str, ...]] = {
+    COVID_STATS: (
+        "how many covid cases are there in india today",
+        "show me the latest coronavirus numbers",
+        "current covid situation in the states",
+        "state wise covid data",
+        "active covid cases in my state",
+        "भारत में आज कितने कोरोना केस हैं",
+        "कोविड की ताज़ा स्थिति बताओ",
+        "aaj kitne covid case hai",
+    ),
+    HOSPITALS: (
+        "where is the closest hospital",
+        "i need a doctor near my home",
+        "show hospitals in my city",
+        "which clinic is close to me",
+        "list of hospitals around here",
+        "मेरे शहर में अस्पताल बताओ",
+        "सबसे नज़दीकी डॉक्टर कहाँ है",
+        "mere shehar me hospital batao",
+    ),
+    VACCINE_SCHEDULE: (
+        "when should my baby get vaccines",
+        "which vaccines does a newborn need",
+        "show the immunization timetable",
+        "what shots does my child need at six weeks",
+        "national immunization schedule for children",
+        "नवजात को कौन से टीके लगते हैं",
+        "बच्चे को टीके कब लगवाएं",
+        "bache ko tika kab lagwana hai",
+    ),
+    DISEASE_OUTBREAK: (
+        "is there a dengue outbreak in my area",
+        "any malaria warning right now",
+        "latest disease outbreak alerts",
+        "are dengue cases rising",
+        "disease alert for my region",
+        "क्या डेंगू फैल रहा है",
+        "मलेरिया की चेतावनी है क्या",
+        "kya dengue fail raha hai",
+    ),
+    NO_TOOL: (
+        "what are the symptoms of dengue",
+        "how do i prevent malaria",
+        "how to prepare ors at home",
+        "tips to control blood pressure",
+        "what should i eat during fever",
+        "how can i boost my immunity",
+        "is it safe to take paracetamol for fever",
+        "how does the covid vaccine work",
+        "what causes diabetes",
+        "share preventive health tips",
+        "how much water should i drink daily",
+        "my child has a cough what should i do",
+        "how do mosquitoes spread dengue",
+        "what is a healthy diet for pregnant women",
+        "डेंगू के लक्षण क्या हैं",
+        "बुखार में क्या खाना चाहिए",
+        "ओआरएस कैसे बनाते हैं",
+        "ब्लड प्रेशर कैसे कम करें",
+        "mujhe bukhar hai kya karu",
+        "sugar kaise control kare",
+        "how can i protect my family from malaria at home",
+        "ways to stop dengue cases spreading in my house",
+        "what are the side effects of the covid vaccine",
+        "is fever after baby vaccines normal",
+        "how is malaria treated",
+        "how long do dengue cases take to recover",
+        "are there any side effects of the measles vaccine",
+        "what side effects do vaccines have in children",
+        "how many people get malaria in india every year",
+        "how many malaria cases turn serious",
+    ),
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into case-folded word tokens, keeping Devanagari intact."""
+    folded = unicodedata.normalize("NFC", text).casefold()
+    cleaned = "".join(
+        " " if unicodedata.category(char)[0] in ("P", "S") and char != "'" else char for char in folded
+    )
+    return [token.strip("'") for token in cleaned.split() if token.strip("'")]
+
+
+def _features(tokens: Sequence[str]) -> List[str]:
+    """Return unigram and bigram features for ``tokens``."""
+    return list(tokens) + [f"{left} {right}" for left, right in zip(tokens, tokens[1:])]
+
+
+class PhraseTrie:
+    """Word-level trie that finds the longest known trigger phrase in a message."""
+
+    def __init__(self) -> None:
+        self._root: Dict[str, dict] = {}
+
+    def add(self, phrase: str, intent: str) -> None:
+        """Register ``phrase`` as a trigger for ``intent``."""
+        node = self._root
+        for token in tokenize(phrase):
+            node = node.setdefault(token, {})
+        node[""] = intent
+
+    def match(self, tokens: Sequence[str]) -> Optional[Tuple[str, int]]:
+        """Return ``(intent, phrase_length)`` for the longest phrase found in ``tokens``."""
+        best: Optional[Tuple[str, int]] = None
+        for start in range(len(tokens)):
+            node = self._root
+            for offset in range(start, len(tokens)):
+                node = node.get(tokens[offset])
+                if node is None:
+                    break
+                intent = node.get("")
+                length = offset - start + 1
+                if intent is not None and (best is None or length > best[1]):
+                    best = (intent, length)
+        return best
+
+
+class LogisticIntentModel:
+    """Multinomial logistic regression over TF-IDF unigram/bigram features."""
+
+    def __init__(self, labels: Sequence[str], features: Callable[[Sequence[str]], List[str]] = _features) -> None:
+        self.labels = list(labels)
+        self._features = features
+        self._idf: Dict[str, float] = {}
+        self._weights: Dict[str, List[float]] = {}
+        self._bias: List[float] = [0.0] * len(self.labels)
+
+    def fit(
+        self,
+        samples: Iterable[Tuple[str, str]],
+        epochs: int = 40,
+        learning_rate: float = 0.5,
+        seed: int = 0,
+    ) -> "LogisticIntentModel":
+        """Train the model with sparse stochastic gradient descent on ``(text, label)`` pairs."""
+        documents = [(self._features(tokenize(text)), self.labels.index(label)) for text, label in samples]
+        document_frequency: Counter[str] = Counter()
+        for features, _ in documents:
+            document_frequency.update(set(features))
+
+        total = len(documents)
+        self._idf = {feature: math.log((1 + total) / (1 + count)) + 1.0 for feature, count in document_frequency.items()}
+        vectors = [(list(self._vectorize(features).items()), label) for features, label in documents]
+        self._weights = {feature: [0.0] * len(self.labels) for feature in self._idf}
+
+        order = list(range(total))
+        shuffler = random.Random(seed)
+        for _ in range(epochs):
+            shuffler.shuffle(order)
+            for position in order:
+                vector, label = vectors[position]
+                probabilities = self._probabilities(dict(vector))
+                for index, probability in enumerate(probabilities):
+                    step = learning_rate * (probability - (1.0 if index == label else 0.0))
+                    self._bias[index] -= step
+                    for feature, value in vector:
+                        self._weights[feature][index] -= step * value
+
+        return self
+
+    def predict(self, tokens: Sequence[str]) -> Tuple[str, float]:
+        """Return the most likely label for ``tokens`` and its probability."""
+        vector = self._vectorize(self._features(tokens))
+        probabilities = self._probabilities(vector)
+        best = max(range(len(self.labels)), key=probabilities.__getitem__)
+        return self.labels[best], probabilities[best]
+
+    def _vectorize(self, features: Sequence[str]) -> Dict[str, float]:
+        counts = Counter(feature for feature in features if feature in self._idf)
+        vector = {feature: count * self._idf[feature] for feature, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        return {feature: value / norm for feature, value in vector.items()} if norm else {}
+
+    def _probabilities(self, vector: Dict[str, float]) -> List[float]:
+        scores = list(self._bias)
+        for feature, value in vector.items():
+            weights = self._weights.get(feature)
+            if weights is None:
+                continue
+            for index in range(len(scores)):
+                scores[index] += weights[index] * value
+        peak = max(scores)
+        exponentials = [math.exp(score - peak) for score in scores]
+        total = sum(exponentials)
+        return [value / total for value in exponentials]
+
+
+@dataclass(slots=True)
+class IntentDecision:
+    """Outcome of routing one message."""
+
+    intent: Optional[str]
+    confidence: float
+    method: str
+    # Best tool guess even when below the threshold; used for speculative prefetching.
+    candidate: Optional[str] = None
+
+    def to_metadata(self) -> Dict[str, str]:
+        """Return a JSON-friendly summary for response metadata."""
+        return {"intent": self.intent or NO_TOOL, "confidence": f"{self.confidence:.2f}", "method": self.method}
+
+
+class IntentRouter:
+    """Decide locally whether a message maps to one of the tool sentinels.
+
+    Trigger phrases are matched through a word trie. A phrase is trusted
+    outright only when the rest of the message is request wording (see
+    ``FILLER_WORDS``); otherwise the match becomes one more feature for a
+    small logistic model, and the message is dispatched only when the
+    model's probability reaches ``threshold``. Anything else falls back to
+    Gemini.
+    """
+
+    def __init__(self, threshold: float = 0.8) -> None:
+        self.threshold = threshold
+        self._trie = PhraseTrie()
+        for intent, phrases in TRIGGER_PHRASES.items():
+            for phrase in phrases:
+                self._trie.add(phrase, intent)
+
+        samples: List[Tuple[str, str]] = []
+        for intent in TOOL_SENTINELS:
+            samples.extend((phrase, intent) for phrase in TRIGGER_PHRASES[intent])
+        for intent, examples in TRAINING_EXAMPLES.items():
+            samples.extend((example, intent) for example in examples)
+        self._model = LogisticIntentModel((*TOOL_SENTINELS, NO_TOOL), features=self._features).fit(samples)
+
+        self._lock = threading.Lock()
+        self._hits: Counter[str] = Counter()
+        self._fallbacks = 0
+
+    def route(self, message: str) -> IntentDecision:
+        """Classify ``message`` and record the outcome."""
+        tokens = tokenize(message)
+        decision = self._classify(tokens)
+        with self._lock:
+            if decision.intent is None:
+                self._fallbacks += 1
+            else:
+                self._hits[decision.intent] += 1
+        return decision
+
+    def _features(self, tokens: Sequence[str]) -> List[str]:
+        """Return n-gram features plus a marker for the trigger phrase found, if any."""
+        features = _features(tokens)
+        phrase_match = self._trie.match(tokens)
+        if phrase_match is not None:
+            features.append(f"phrase:{phrase_match[0]}")
+        return features
+
+    def stats(self) -> Dict[str, object]:
+        """Return per-intent hit counters and how many LLM calls were avoided."""
+        with self._lock:
+            hits = {intent: self._hits.get(intent, 0) for intent in TOOL_SENTINELS}
+            return {
+                "threshold": self.threshold,
+                "hits": hits,
+                "fallbacks": self._fallbacks,
+                "llm_calls_saved": sum(hits.values()),
+            }
+
+    def _classify(self, tokens: Sequence[str]) -> IntentDecision:
+        if not tokens:
+            return IntentDecision(intent=None, confidence=0.0, method="empty")
+
+        phrase_match = self._trie.match(tokens)
+        if phrase_match is not None and sum(token not in FILLER_WORDS for token in tokens) <= phrase_match[1]:
+            return IntentDecision(intent=phrase_match[0], confidence=1.0, method="phrase")
+
+        label, probability = self._model.predict(tokens)
+        if label != NO_TOOL and probability >= self.threshold:
+            return IntentDecision(intent=label, confidence=probability, method="model")
+        return IntentDecision(
+            intent=None,
+            confidence=probability,
+            method="model",
+            candidate=label if label != NO_TOOL else None,
+        )
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import queue
+import re
+import threading
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Optional
+from datetime import timedelta
+from typing import Any, ContextManager, Dict, Iterator, Optional, Tuple
+
+from .admission import FRESH, AdmissionController
+from ..utils.metrics import upstream_span
+from ..utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
-try:  # pragma: no cover - runtime dependency import
-    import google.generativeai as genai
-except ImportError:  # pragma: no cover - handled gracefully in development
-    genai = None  # type: ignore[assignment]
+_STREAM_END = object()
+
+# google-generativeai takes most of a second to import, so it is loaded on
+# first use (or during the optional warm-up) rather than at module import.
+genai: Any = None
+_genai_lock = threading.Lock()
+
+
+def load_genai() -> Any:
+    """Import the Gemini SDK on first use; return ``None`` when it is not installed."""
+    global genai
+    if genai is None:
+        with _genai_lock:
+            if genai is None:
+                try:  # pragma: no cover - runtime dependency import
+                    import google.generativeai as sdk
+                except ImportError:  # pragma: no cover - handled gracefully in development
+                    return None
+                genai = sdk
+    return genai
 
 
 NIROGI_SYSTEM_PROMPT = (
@@ -31,6 +58,39 @@ NIROGI_SYSTEM_PROMPT = (
     "you must reply with only the exact text: @@FETCH_DISEASE_OUTBREAK@@"
 )
 
+# How chats in a non-English language reach Gemini: translated to English and
+# back, or sent as written with Gemini answering in that language.
+TRANSLATE = "translate"
+NATIVE = "native"
+PIPELINE_MODES = (TRANSLATE, NATIVE)
+_LANGUAGE_NAMES = {"hi": "Hindi"}
+
+
+def native_system_prompt(language: str) -> str:
+    """Return the system prompt that has Gemini read and answer in ``language``."""
+    name = _LANGUAGE_NAMES.get(language, language)
+    return (
+        f"{NIROGI_SYSTEM_PROMPT}\n\nLanguage: The user writes in {name}. Always answer in {name}, keeping markdown "
+        "formatting, and write medicine, vaccine and disease names as they are commonly known in India, adding the "
+        "English name in brackets where it helps. The tool replies above are the only exception: when a tool applies, "
+        "reply with the exact English sentinel text and nothing else."
+    )
+
+
+def parse_pipeline_modes(spec: Optional[str]) -> Dict[str, str]:
+    """Parse ``"hi=native,..."`` into ``{language: mode}``; unlisted languages use ``translate``."""
+    modes: Dict[str, str] = {}
+    for item in (spec or "").split(","):
+        language, _, mode = item.partition("=")
+        language, mode = language.strip().lower(), mode.strip().lower()
+        if not language:
+            continue
+        if mode not in PIPELINE_MODES:
+            logger.warning("Ignoring unknown pipeline mode '%s' for language '%s'.", mode, language)
+            continue
+        modes[language] = mode
+    return modes
+
 
 class GeminiClientError(RuntimeError):
     """Wrap errors bubbled up from the Gemini SDK."""
@@ -44,24 +104,86 @@ class GeminiResponse:
     metadata: dict[str, str]
 
 
-def _compose_prompt(user_prompt: str, system_prompt: Optional[str]) -> str:
-    if system_prompt:
-        return f"{system_prompt.strip()}\n\nUser question: {user_prompt.strip()}"
-    return user_prompt
+class ModelHandleCache:
+    """Thread-safe registry of long-lived ``GenerativeModel`` handles.
 
+    Handles are keyed on ``(api_key, model_id, system_prompt)`` so the SDK
+    setup cost is paid once per combination instead of once per call. The
+    system prompt is attached as a system instruction and, when
+    ``context_cache_ttl`` is set, uploaded through Gemini context caching so
+    the static prefix is not re-billed on every turn.
+    """
 
-def get_response(
+    def __init__(self, context_cache_ttl: Optional[float] = None) -> None:
+        self.context_cache_ttl = context_cache_ttl if context_cache_ttl and context_cache_ttl > 0 else None
+        self._handles: Dict[Tuple[str, str, str], Tuple[Any, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._configured_key: Optional[str] = None
+
+    def get(self, api_key: str, model_id: str, system_prompt: str) -> Any:
+        """Return a ready-to-use model handle, building it on first use."""
+        key = (api_key, model_id, system_prompt)
+        entry = self._handles.get(key)
+        if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+            return entry[0]
+
+        with self._lock:
+            entry = self._handles.get(key)
+            if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+                entry = self._build(api_key, model_id, system_prompt)
+                self._handles[key] = entry
+            return entry[0]
+
+    def clear(self) -> None:
+        """Drop every cached handle."""
+        with self._lock:
+            self._handles.clear()
+
+    def _build(self, api_key: str, model_id: str, system_prompt: str) -> Tuple[Any, Optional[float]]:
+        # ``genai.configure`` sets process-wide credentials that every handle's
+        # SDK client picks up on first use, so it only runs (under the lock)
+        # when the key changes. The app is expected to use a single key.
+        if api_key != self._configured_key:
+            if self._configured_key is not None:
+                logger.warning("Gemini API key changed; existing model handles will use the new key.")
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+
+        model = None
+        expires_at: Optional[float] = None
+        if self.context_cache_ttl:
+            try:
+                cached_content = genai.caching.CachedContent.create(
+                    model=model_id if model_id.startswith("models/") else f"models/{model_id}",
+                    system_instruction=system_prompt,
+                    ttl=timedelta(seconds=self.context_cache_ttl),
+                )
+                model = genai.GenerativeModel.from_cached_content(cached_content)
+                # Rebuild shortly before the server-side cache entry expires.
+                expires_at = time.monotonic() + self.context_cache_ttl * 0.9
+            except Exception as exc:  # noqa: BLE001 - caching is an optimisation only
+                logger.info("Gemini context caching unavailable for %s (%s); using system instruction.", model_id, exc)
+
+        if model is None:
+            model = genai.GenerativeModel(model_id, system_instruction=system_prompt)
+        return model, expires_at
+
+
+_default_handles = ModelHandleCache()
+
+
+def _resolve_model(
     message: str,
-    *,
-    system_prompt: Optional[str] = None,
-    api_key: Optional[str] = None,
-    model_id: Optional[str] = None,
-) -> str:
-    """Return the Gemini response text for the supplied message."""
+    system_prompt: Optional[str],
+    api_key: Optional[str],
+    model_id: Optional[str],
+    handles: Optional[ModelHandleCache],
+) -> Any:
+    """Validate inputs and return the shared model handle for this request."""
     if not message:
         raise GeminiClientError("Cannot generate a response for an empty prompt.")
 
-    if genai is None:
+    if load_genai() is None:
         raise GeminiClientError("google-generativeai package is not installed.")
 
     resolved_api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -69,12 +191,29 @@ def get_response(
         raise GeminiClientError("GEMINI_API_KEY environment variable is not set.")
 
     resolved_model = model_id or os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-    prompt = _compose_prompt(message, system_prompt or NIROGI_SYSTEM_PROMPT)
+    try:
+        return (handles or _default_handles).get(
+            resolved_api_key,
+            resolved_model,
+            (system_prompt or NIROGI_SYSTEM_PROMPT).strip(),
+        )
+    except Exception as exc:  # noqa: BLE001 - surface SDK errors as-is
+        raise GeminiClientError(str(exc)) from exc
+
+
+def get_response(
+    message: str,
+    *,
+    system_prompt: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model_id: Optional[str] = None,
+    handles: Optional[ModelHandleCache] = None,
+) -> str:
+    """Return the Gemini response text for the supplied message."""
+    model = _resolve_model(message, system_prompt, api_key, model_id, handles)
 
     try:
-        genai.configure(api_key=resolved_api_key)
-        model = genai.GenerativeModel(resolved_model)
-        response = model.generate_content(prompt)
+        response = model.generate_content(message.strip())
     except Exception as exc:  # noqa: BLE001 - surface SDK errors as-is
         raise GeminiClientError(str(exc)) from exc
 
@@ -85,18 +224,64 @@ def get_response(
     return text
 
 
+def stream_response(
+    message: str,
+    *,
+    system_prompt: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model_id: Optional[str] = None,
+    handles: Optional[ModelHandleCache] = None,
+) -> Iterator[str]:
+    """Yield Gemini response text incrementally as chunks are generated."""
+    model = _resolve_model(message, system_prompt, api_key, model_id, handles)
+
+    try:
+        response = model.generate_content(message.strip(), stream=True)
+        produced_text = False
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. safety metadata) are skipped.
+                continue
+            if text:
+                produced_text = True
+                yield text
+    except GeminiClientError:
+        raise
+    except Exception as exc:  # noqa: BLE001 - surface SDK errors as-is
+        raise GeminiClientError(str(exc)) from exc
+
+    if not produced_text:
+        raise GeminiClientError("Gemini response did not contain text content.")
+
+
 class GeminiClient:
     """Lightweight Gemini API wrapper with sensible fallbacks."""
 
-    def __init__(self, api_key: Optional[str], model: str) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str],
+        model: str,
+        context_cache_ttl: Optional[float] = None,
+        admission: Optional[AdmissionController] = None,
+    ) -> None:
         self.api_key = api_key
         self.model_id = model
+        self.admission = admission
+        self._handles = ModelHandleCache(context_cache_ttl)
+        self._flights = SingleFlight()
 
         if not api_key and not os.getenv("GEMINI_API_KEY"):
             logger.warning("GEMINI_API_KEY is not set; responses will be mocked.")
 
-    def generate_health_response(self, user_prompt: str, system_prompt: Optional[str] = None) -> GeminiResponse:
-        """Generate a health-focused response from Gemini."""
+    def generate_health_response(
+        self, user_prompt: str, system_prompt: Optional[str] = None, priority: int = FRESH
+    ) -> GeminiResponse:
+        """Generate a health-focused response from Gemini.
+
+        Raises ``AdmissionRejected`` when admission control sheds the call.
+        """
         if not user_prompt:
             raise GeminiClientError("Cannot generate a response for an empty prompt.")
 
@@ -106,17 +291,94 @@ class GeminiClient:
             mocked_text = self._build_mock_response(user_prompt)
             return GeminiResponse(text=mocked_text, metadata={"provider": "mock"})
 
-        text = get_response(
-            user_prompt,
-            system_prompt=effective_prompt,
-            api_key=self.api_key,
-            model_id=self.model_id,
-        )
+        flight_key = hashlib.sha256(f"{effective_prompt}\x00{user_prompt.strip()}".encode("utf-8")).hexdigest()
+
+        def _call() -> str:
+            # Only the call that actually reaches Gemini takes an admission slot.
+            with self._admit(priority), upstream_span("gemini"):
+                return get_response(
+                    user_prompt,
+                    system_prompt=effective_prompt,
+                    api_key=self.api_key,
+                    model_id=self.model_id,
+                    handles=self._handles,
+                )
+
+        text = self._flights.do(flight_key, _call)
         return GeminiResponse(text=text, metadata={"provider": self.model_id})
 
-    def get_response(self, prompt: str, system_prompt: Optional[str] = None) -> GeminiResponse:
+    def get_response(self, prompt: str, system_prompt: Optional[str] = None, priority: int = FRESH) -> GeminiResponse:
         """Convenience wrapper mirroring generate_health_response semantics."""
-        return self.generate_health_response(prompt, system_prompt)
+        return self.generate_health_response(prompt, system_prompt, priority)
+
+    def stream_health_response(
+        self, user_prompt: str, system_prompt: Optional[str] = None, priority: int = FRESH
+    ) -> Iterator[str]:
+        """Stream a health-focused response from Gemini chunk by chunk."""
+        if not user_prompt:
+            raise GeminiClientError("Cannot generate a response for an empty prompt.")
+
+        effective_prompt = system_prompt or NIROGI_SYSTEM_PROMPT
+
+        if not (self.api_key or os.getenv("GEMINI_API_KEY")):
+            mocked_text = self._build_mock_response(user_prompt)
+            yield from re.findall(r"\S+\s*", mocked_text)
+            return
+
+        # A helper thread reads the upstream stream into a buffer, so the admission slot is
+        # held only while Gemini generates, not while the caller translates sentences or
+        # waits on a slow client between chunks.
+        buffered: "queue.Queue[Any]" = queue.Queue()
+
+        def _pump() -> None:
+            try:
+                with self._admit(priority), upstream_span("gemini"):
+                    for chunk in stream_response(
+                        user_prompt,
+                        system_prompt=effective_prompt,
+                        api_key=self.api_key,
+                        model_id=self.model_id,
+                        handles=self._handles,
+                    ):
+                        buffered.put(chunk)
+            except Exception as exc:  # noqa: BLE001 - re-raised on the caller's thread
+                buffered.put(exc)
+            finally:
+                buffered.put(_STREAM_END)
+
+        threading.Thread(target=_pump, name="gemini-stream", daemon=True).start()
+        while True:
+            item = buffered.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def stream_response(self, prompt: str, system_prompt: Optional[str] = None, priority: int = FRESH) -> Iterator[str]:
+        """Convenience wrapper mirroring stream_health_response semantics."""
+        return self.stream_health_response(prompt, system_prompt, priority)
+
+    def _admit(self, priority: int) -> ContextManager[None]:
+        return self.admission.slot(priority) if self.admission is not None else nullcontext()
+
+    def warm_up(self) -> bool:
+        """Load the SDK and build the default model handle; return False in mock mode."""
+        if not (self.api_key or os.getenv("GEMINI_API_KEY")):
+            return False
+        _resolve_model("warm-up", NIROGI_SYSTEM_PROMPT, self.api_key, self.model_id, self._handles)
+        return True
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return how many concurrent identical prompts shared one Gemini call."""
+        return self._flights.stats()
+
+    @property
+    def provider_name(self) -> str:
+        """Return the provider label recorded in response metadata."""
+        if not (self.api_key or os.getenv("GEMINI_API_KEY")):
+            return "mock"
+        return self.model_id
 
     @staticmethod
     def _build_mock_response(user_prompt: str) -> str:
@@ -0,0 +1,136 @@
+"""Catalog of localized bot messages, compiled once and shared with the frontend."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import string
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = "en"
+CATALOG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../data/messages.json"))
+
+# A compiled message: literal text alternating with placeholder names.
+_Parts = Tuple[Tuple[str, Optional[str]], ...]
+
+
+class MessageCatalogError(RuntimeError):
+    """Raised when the catalog file is missing or malformed."""
+
+
+@dataclass(frozen=True, slots=True)
+class Bundle:
+    """Serialized messages for one language, ready to send to the frontend."""
+
+    body: bytes
+    etag: str
+
+
+def compile_message(template: str) -> _Parts:
+    """Split ``template`` into ``(literal, placeholder)`` pairs; ``{{`` and ``}}`` are literal braces.
+
+    Raises
+    ------
+    ValueError
+        If a placeholder uses a conversion, format spec or attribute access.
+    """
+    parts: List[Tuple[str, Optional[str]]] = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            raise ValueError(f"Unsupported placeholder '{{{field_name}}}' in message: {template!r}")
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def _placeholders(parts: _Parts) -> set[str]:
+    return {name for _, name in parts if name is not None}
+
+
+class MessageCatalog:
+    """Look up messages by id and language, interpolating ``{name}`` placeholders.
+
+    Every message is parsed once when the catalog is built, so rendering is
+    a join over precomputed parts. Languages missing an id fall back to
+    English. The catalog version is a hash of its contents, and the
+    per-language JSON bundles served to the frontend are serialized up
+    front as well.
+    """
+
+    def __init__(self, messages: Mapping[str, Mapping[str, str]]) -> None:
+        if DEFAULT_LANGUAGE not in messages:
+            raise MessageCatalogError(f"The message catalog must define '{DEFAULT_LANGUAGE}'.")
+        self._compiled: Dict[str, Dict[str, _Parts]] = {}
+        for language, entries in messages.items():
+            try:
+                self._compiled[language] = {message_id: compile_message(text) for message_id, text in entries.items()}
+            except ValueError as exc:
+                raise MessageCatalogError(str(exc)) from exc
+
+        defaults = self._compiled[DEFAULT_LANGUAGE]
+        for language, compiled in self._compiled.items():
+            for message_id, parts in compiled.items():
+                expected = defaults.get(message_id)
+                if expected is None:
+                    logger.warning("Message '%s' in '%s' has no English original.", message_id, language)
+                elif _placeholders(parts) != _placeholders(expected):
+                    raise MessageCatalogError(f"Message '{message_id}' in '{language}' uses different placeholders.")
+
+        canonical = json.dumps(messages, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        self.version = hashlib.sha256(canonical).hexdigest()[:12]
+        self._bundles: Dict[str, Bundle] = {}
+        for language in self._compiled:
+            merged = {**messages[DEFAULT_LANGUAGE], **messages[language]}
+            body = json.dumps(
+                {"version": self.version, "language": language, "messages": merged},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            self._bundles[language] = Bundle(body, f'"{self.version}-{language}"')
+
+    @classmethod
+    def from_file(cls, path: str = CATALOG_PATH) -> "MessageCatalog":
+        """Build a catalog from a ``{language: {message_id: text}}`` JSON file."""
+        try:
+            with open(path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise MessageCatalogError(f"Failed to load message catalog from {path}.") from exc
+        if not isinstance(payload, dict) or not all(isinstance(entries, dict) for entries in payload.values()):
+            raise MessageCatalogError("The message catalog must map languages to objects of messages.")
+        return cls(payload)
+
+    @property
+    def languages(self) -> List[str]:
+        return sorted(self._compiled)
+
+    def supports(self, language: Optional[str]) -> bool:
+        return language in self._compiled
+
+    def render(self, message_id: str, language: Optional[str] = None, **params: Any) -> str:
+        """Return message ``message_id`` in ``language`` (or English) with ``params`` filled in.
+
+        Raises
+        ------
+        KeyError
+            If the id is unknown or a placeholder has no value in ``params``.
+        """
+        parts = self._compiled.get(language or DEFAULT_LANGUAGE, {}).get(message_id)
+        if parts is None:
+            parts = self._compiled[DEFAULT_LANGUAGE][message_id]
+        return "".join(literal + (str(params[name]) if name is not None else "") for literal, name in parts)
+
+    def bundle(self, language: str) -> Optional[Bundle]:
+        """Return the serialized bundle for ``language``, or ``None`` if it has no messages."""
+        return self._bundles.get(language)
+
+
+@functools.lru_cache(maxsize=1)
+def get_catalog() -> MessageCatalog:
+    """Return the bundled catalog, compiling it on first use."""
+    return MessageCatalog.from_file()
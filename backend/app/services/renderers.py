@@ -0,0 +1,110 @@
+"""Deterministic text renderers for structured tool results."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .message_catalog import get_catalog
+
+TEMPLATE = "template"
+LLM = "llm"
+
+RENDERABLE_TOOLS = ("vaccine_schedule", "hospitals", "disease_outbreak")
+
+_HINDI_AGE_PATTERNS = (
+    (re.compile(r"^at birth$", re.IGNORECASE), "जन्म के समय"),
+    (re.compile(r"^at ([\d\-–]+) weeks?$", re.IGNORECASE), r"\1 सप्ताह पर"),
+    (re.compile(r"^at ([\d\-–]+) months?$", re.IGNORECASE), r"\1 महीने पर"),
+    (re.compile(r"^at ([\d\-–]+) years?$", re.IGNORECASE), r"\1 वर्ष पर"),
+)
+
+_ADDRESS_PARTS = ("addr:housenumber", "addr:street", "addr:suburb", "addr:city", "addr:postcode")
+
+
+def parse_render_modes(spec: Optional[str]) -> Dict[str, str]:
+    """Parse ``"tool=mode,tool=mode"`` into a mapping, defaulting every tool to templates."""
+    modes = {tool: TEMPLATE for tool in RENDERABLE_TOOLS}
+    for item in (spec or "").split(","):
+        tool, _, mode = item.partition("=")
+        tool, mode = tool.strip().lower(), mode.strip().lower()
+        if tool in modes and mode in (TEMPLATE, LLM):
+            modes[tool] = mode
+    return modes
+
+
+def _label(message_id: str, language: str, **params: Any) -> str:
+    """Return a template label from the message catalog (English when ``language`` has none)."""
+    return get_catalog().render(f"render.{message_id}", language, **params)
+
+
+def _localize_age(age: str, language: str) -> str:
+    if language != "hi":
+        return age
+    for pattern, replacement in _HINDI_AGE_PATTERNS:
+        if pattern.match(age.strip()):
+            return pattern.sub(replacement, age.strip())
+    return age
+
+
+def render_vaccine_schedule(schedule: Mapping[str, Any], language: str = "en") -> str:
+    """Render the vaccine schedule as bullet lists grouped by age."""
+    lines: List[str] = [_label("vaccines.title", language), ""]
+    for entry in schedule.get("schedule", []):
+        if not isinstance(entry, Mapping):
+            continue
+        lines.append(f"**{_localize_age(str(entry.get('age', '')), language)}**")
+        lines.extend(f"- {vaccine}" for vaccine in entry.get("vaccines", []))
+        lines.append("")
+    lines.append(_label("vaccines.source", language))
+    return "\n".join(lines)
+
+
+def _hospital_address(tags: Mapping[str, Any]) -> Optional[str]:
+    if tags.get("addr:full"):
+        return str(tags["addr:full"])
+    parts = [str(tags[key]) for key in _ADDRESS_PARTS if tags.get(key)]
+    return ", ".join(parts) or None
+
+
+def render_hospitals(hospitals: List[Mapping[str, Any]], city: str, language: str = "en", limit: int = 4) -> str:
+    """Render the top ``limit`` hospitals with their name and address."""
+    named = [item for item in hospitals if (item.get("tags") or {}).get("name")]
+    selected = (named or hospitals)[:limit]
+
+    lines: List[str] = [_label("hospitals.title", language, city=city.title()), ""]
+    for item in selected:
+        tags = item.get("tags") or {}
+        name = tags.get("name") or _label("hospitals.unnamed", language)
+        address = _hospital_address(tags) or _label("hospitals.no_address", language)
+        lines.append(f"- **{name}** — {address}")
+    lines.extend(["", _label("hospitals.source", language)])
+    return "\n".join(lines)
+
+
+def render_outbreak_alert(
+    alert: Mapping[str, Any],
+    language: str = "en",
+    translate: Optional[Callable[[str], str]] = None,
+) -> str:
+    """Render an outbreak alert with its status, case count and advice.
+
+    ``translate`` localizes free-text fields such as the advice; labels come
+    from the message catalog.
+    """
+    status = str(alert.get("status", "")).strip()
+    advice = str(alert.get("advice", "")).strip()
+    if translate is not None:
+        status = translate(status) if status else status
+        advice = translate(advice) if advice else advice
+
+    lines = [
+        f"**{_label('alert.title', language, disease=alert.get('disease', ''), region=alert.get('region', ''))}**",
+        f"- {_label('alert.status', language)}: {status}",
+    ]
+    if alert.get("cases_reported") is not None:
+        lines.append(f"- {_label('alert.cases', language)}: {alert['cases_reported']}")
+    if advice:
+        lines.append(f"- {_label('alert.advice', language)}: {advice}")
+    lines.extend(["", _label("alert.source", language)])
+    return "\n".join(lines)
@@ -0,0 +1,145 @@
+"""Server-side conversation memory with a bounded, summarized history."""
+
+from __future__ import annotations
+
+import logging
+import re
+import secrets
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.cache import TieredCache
+from .compaction import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+USER = "user"
+ASSISTANT = "assistant"
+
+_SESSION_ID = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+# Words kept from a turn when it is folded into the running summary.
+_SUMMARY_WORDS = 16
+
+
+@dataclass(slots=True)
+class ConversationState:
+    """Serializable history of one session: recent turns, a summary and the pending tool context."""
+
+    turns: List[Tuple[str, str]] = field(default_factory=list)
+    summary: List[str] = field(default_factory=list)
+    context: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"turns": [list(turn) for turn in self.turns], "summary": list(self.summary), "context": self.context}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "ConversationState":
+        turns = [(str(role), str(text)) for role, text in payload.get("turns", [])]
+        return cls(turns=turns, summary=[str(line) for line in payload.get("summary", [])], context=payload.get("context"))
+
+
+def _clip_words(text: str, limit: int) -> str:
+    words = text.split()
+    return " ".join(words[:limit]) + (" ..." if len(words) > limit else "")
+
+
+def _clip_tokens(text: str, token_budget: int) -> str:
+    # estimate_tokens assumes four characters per token.
+    limit = token_budget * 4
+    return text if len(text) <= limit else text[: limit - 4].rstrip() + " ..."
+
+
+class Conversation:
+    """One request's view of a session; ``record`` writes the new turn back to the store."""
+
+    def __init__(self, store: "SessionStore", session_id: str, state: ConversationState) -> None:
+        self.store = store
+        self.session_id = session_id
+        self.state = state
+
+    @property
+    def context(self) -> Optional[str]:
+        return self.state.context
+
+    @property
+    def has_history(self) -> bool:
+        return bool(self.state.turns or self.state.summary)
+
+    def prompt_for(self, message: str) -> str:
+        """Return ``message`` prefixed with the summary and recent turns, if any."""
+        if not self.has_history:
+            return message
+
+        lines: List[str] = []
+        if self.state.summary:
+            lines.append("Earlier in this conversation: " + " | ".join(self.state.summary))
+        if self.state.turns:
+            lines.append("Recent messages:")
+            lines.extend(f"{'User' if role == USER else 'Assistant'}: {text}" for role, text in self.state.turns)
+        lines.append("")
+        lines.append(f"Current message: {message}")
+        return "\n".join(lines)
+
+    def record(self, user_text: str, assistant_text: str, context: Optional[str]) -> None:
+        """Append one exchange (as sent to Gemini), compact the history and persist it."""
+        self.store.record(self, user_text, assistant_text, context)
+
+
+class SessionStore:
+    """Keep a rolling window of turns per session, folding older turns into a short summary.
+
+    Sessions live in a ``TieredCache`` (an LRU with TTL, optionally backed by
+    SQLite). Turns beyond ``max_turns`` exchanges or ``token_budget`` tokens
+    are folded into one-line summaries, and summary lines beyond
+    ``summary_token_budget`` are dropped oldest first, so both memory per
+    session and the history added to prompts stay bounded.
+    """
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        token_budget: int = 800,
+        max_turns: int = 6,
+        summary_token_budget: int = 200,
+    ) -> None:
+        self.cache = cache
+        self.token_budget = max(64, token_budget)
+        self.max_turns = max(1, max_turns)
+        self.summary_token_budget = max(0, summary_token_budget)
+
+    def open(self, session_id: Optional[str]) -> Conversation:
+        """Return the conversation for ``session_id``, starting a new one when it is unknown or expired.
+
+        Unknown ids are replaced rather than adopted so clients cannot pick
+        another session's id.
+        """
+        if session_id and _SESSION_ID.match(session_id):
+            payload = self.cache.get(f"session:{session_id}")
+            if isinstance(payload, dict):
+                try:
+                    return Conversation(self, session_id, ConversationState.from_dict(payload))
+                except (TypeError, ValueError):
+                    logger.warning("Discarding unreadable session state.")
+        return Conversation(self, secrets.token_urlsafe(18), ConversationState())
+
+    def record(self, conversation: Conversation, user_text: str, assistant_text: str, context: Optional[str]) -> None:
+        state = conversation.state
+        turn_budget = self.token_budget // 2
+        state.turns.append((USER, _clip_tokens(user_text.strip(), turn_budget)))
+        state.turns.append((ASSISTANT, _clip_tokens(assistant_text.strip(), turn_budget)))
+        state.context = context
+        self._compact(state)
+        self.cache.set(f"session:{conversation.session_id}", state.to_dict())
+
+    def _compact(self, state: ConversationState) -> None:
+        while state.turns and (
+            len(state.turns) > self.max_turns * 2 or sum(estimate_tokens(text) for _, text in state.turns) > self.token_budget
+        ):
+            role, text = state.turns.pop(0)
+            state.summary.append(f"{'User' if role == USER else 'Assistant'}: {_clip_words(text, _SUMMARY_WORDS)}")
+
+        while state.summary and sum(estimate_tokens(line) for line in state.summary) > self.summary_token_budget:
+            state.summary.pop(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"active_sessions": len(self.cache.memory), **self.cache.stats()}
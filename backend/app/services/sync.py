@@ -0,0 +1,199 @@
+"""Background refresh scheduler that keeps health datasets warm in memory."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..utils.metrics import record_error, record_fallback
+
+logger = logging.getLogger(__name__)
+
+_RETRY_AFTER_ERROR_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class SyncSource:
+    """A dataset kept in memory and refreshed on an interval."""
+
+    name: str
+    loader: Callable[[], Any]
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    value: Any = None
+    loaded_at: Optional[float] = None
+    next_due: float = 0.0
+    last_error: Optional[str] = None
+    refreshing: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful load, or ``None`` if never loaded."""
+        return None if self.loaded_at is None else time.time() - self.loaded_at
+
+    def is_stale(self) -> bool:
+        """Return True when the cached value is older than its refresh interval."""
+        age = self.age()
+        return age is None or age >= self.interval_seconds
+
+
+def parse_sync_intervals(spec: Optional[str]) -> Dict[str, Tuple[float, float]]:
+    """Parse ``"name=interval[:jitter],..."`` into ``{name: (interval, jitter)}``."""
+    parsed: Dict[str, Tuple[float, float]] = {}
+    for item in (spec or "").split(","):
+        name, _, value = item.partition("=")
+        if not name.strip() or not value.strip():
+            continue
+        interval, _, jitter = value.partition(":")
+        try:
+            parsed[name.strip()] = (float(interval), float(jitter or 0))
+        except ValueError:
+            logger.warning("Ignoring malformed sync interval '%s'.", item)
+    return parsed
+
+
+class SyncScheduler:
+    """Serve datasets from memory and refresh them off the request path.
+
+    ``get`` never waits on upstream once a dataset has loaded: stale values
+    are returned immediately while a background refresh is triggered
+    (stale-while-revalidate). A daemon thread started with ``start`` keeps
+    every source warm on its own interval, with random jitter so refreshes do
+    not line up across workers.
+    """
+
+    def __init__(self) -> None:
+        self._sources: Dict[str, SyncSource] = {}
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def register(self, name: str, loader: Callable[[], Any], interval_seconds: float, jitter_seconds: float = 0.0) -> None:
+        """Add a dataset; it is loaded on first use or on the next scheduler tick."""
+        with self._wakeup:
+            self._sources[name] = SyncSource(
+                name=name,
+                loader=loader,
+                interval_seconds=interval_seconds,
+                jitter_seconds=jitter_seconds,
+                next_due=time.monotonic(),
+            )
+            self._wakeup.notify()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sources
+
+    def get(self, name: str) -> Any:
+        """Return the in-memory value of ``name``, loading it synchronously only the first time."""
+        source = self._sources[name]
+        if source.loaded_at is None:
+            with source.lock:
+                if source.loaded_at is None:
+                    self._load(source)
+            return source.value
+
+        if source.is_stale():
+            record_fallback("stale_dataset")
+            self.refresh_in_background(name)
+        return source.value
+
+    def refresh(self, name: str) -> bool:
+        """Reload ``name`` now; return False when the loader failed."""
+        source = self._sources[name]
+        with source.lock:
+            try:
+                self._load(source)
+            except Exception:  # noqa: BLE001 - keep serving the previous value
+                return False
+        return True
+
+    def refresh_in_background(self, name: str) -> bool:
+        """Start a refresh of ``name`` on a daemon thread unless one is running."""
+        source = self._sources[name]
+        with self._wakeup:
+            if source.refreshing:
+                return False
+            source.refreshing = True
+
+        def _run() -> None:
+            try:
+                self.refresh(name)
+            finally:
+                with self._wakeup:
+                    source.refreshing = False
+
+        threading.Thread(target=_run, name=f"sync-{name}", daemon=True).start()
+        return True
+
+    def start(self) -> None:
+        """Start the background loop that refreshes sources when they fall due."""
+        with self._wakeup:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="sync-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background loop."""
+        with self._wakeup:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            self._wakeup.notify()
+        if thread is not None:
+            thread.join(timeout)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Return the age, interval and last error of every dataset."""
+        payload: Dict[str, Dict[str, Any]] = {}
+        for name, source in list(self._sources.items()):
+            age = source.age()
+            payload[name] = {
+                "age_seconds": None if age is None else round(age, 1),
+                "interval_seconds": source.interval_seconds,
+                "stale": source.is_stale(),
+                "refreshing": source.refreshing,
+                "last_error": source.last_error,
+            }
+        return payload
+
+    def _load(self, source: SyncSource) -> None:
+        """Run the loader; the caller must hold ``source.lock``."""
+        try:
+            value = source.loader()
+        except Exception as exc:
+            source.last_error = str(exc)
+            record_error("sync", source.name, exc)
+            source.next_due = time.monotonic() + min(_RETRY_AFTER_ERROR_SECONDS, source.interval_seconds)
+            logger.warning("Refreshing dataset '%s' failed: %s", source.name, exc)
+            raise
+
+        source.value = value
+        source.loaded_at = time.time()
+        source.last_error = None
+        source.next_due = time.monotonic() + source.interval_seconds + random.uniform(0, source.jitter_seconds)
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = [source for source in self._sources.values() if source.next_due <= now and not source.refreshing]
+                if not due:
+                    next_due = min((source.next_due for source in self._sources.values()), default=now + 60)
+                    self._wakeup.wait(timeout=max(next_due - now, 0.05))
+                    continue
+                for source in due:
+                    source.refreshing = True
+
+            for source in due:
+                try:
+                    self.refresh(source.name)
+                finally:
+                    with self._wakeup:
+                        source.refreshing = False
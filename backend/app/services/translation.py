@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from googletrans import Translator
+from ..utils.cache import TieredCache
+from ..utils.metrics import upstream_span
+from ..utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
-_translator = Translator()
+# The googletrans client (and the httpx stack behind it) is built on first use.
+_translator: Any = None
+_translator_lock = threading.Lock()
+
+
+def load_translator() -> Any:
+    """Return the shared googletrans ``Translator``, creating it on first use."""
+    global _translator
+    if _translator is None:
+        with _translator_lock:
+            if _translator is None:
+                from googletrans import Translator
+
+                _translator = Translator()
+    return _translator
 
 
 class TranslationServiceError(RuntimeError):
@@ -26,12 +46,28 @@ class TranslationResult:
     target_language: str
 
 
+def normalize_cache_text(text: str) -> str:
+    """Return the canonical form of ``text`` used for cache lookups."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
 class TranslationService:
     """Translate text using the configured provider (googletrans by default)."""
 
-    def __init__(self, provider: str, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        provider: str,
+        api_key: Optional[str] = None,
+        cache: Optional[TieredCache] = None,
+        batch_size: int = 16,
+        max_concurrency: int = 4,
+    ) -> None:
         self.provider = provider
         self.api_key = api_key
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self._flights = SingleFlight()
 
     def translate(self, text: str, target_language: str, source_language: Optional[str] = None) -> TranslationResult:
         """Translate text into the target language."""
@@ -44,14 +80,172 @@ class TranslationService:
         if normalized_source and normalized_source == normalized_target:
             return TranslationResult(text=text, detected_language=normalized_source, target_language=normalized_target)
 
+        cache_key = self._cache_key(text, normalized_source, normalized_target)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return TranslationResult(
+                    text=cached["text"],
+                    detected_language=cached["detected_language"],
+                    target_language=normalized_target,
+                )
+
+        # Identical requests arriving together share one upstream call.
+        return self._flights.do(
+            cache_key,
+            lambda: self._translate_upstream(text, normalized_source, normalized_target, cache_key),
+        )
+
+    def _translate_upstream(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        cache_key: str,
+    ) -> TranslationResult:
+        """Translate one string with the provider and cache the result."""
         try:
-            translate_kwargs = {"dest": normalized_target}
-            if normalized_source:
-                translate_kwargs["src"] = normalized_source
+            translate_kwargs = {"dest": target_language}
+            if source_language:
+                translate_kwargs["src"] = source_language
 
-            result = _translator.translate(text, **translate_kwargs)
+            with upstream_span("googletrans"):
+                result = load_translator().translate(text, **translate_kwargs)
+        except Exception as exc:  # noqa: BLE001 - surface translation errors
+            raise TranslationServiceError(str(exc)) from exc
+
+        detected_language = (result.src or source_language or "en").lower()
+        if self.cache is not None:
+            self.cache.set(cache_key, {"text": result.text, "detected_language": detected_language})
+
+        return TranslationResult(text=result.text, detected_language=detected_language, target_language=target_language)
+
+    def translate_many(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+    ) -> List[TranslationResult]:
+        """Translate several strings, returning results in input order.
+
+        Inputs are de-duplicated on their normalized form and served from the
+        cache where possible. The first original spelling of each remaining
+        string (newlines and spacing intact) is sent upstream in chunks of
+        ``batch_size`` with at most ``max_concurrency`` chunks in flight.
+        Strings already being translated by a concurrent ``translate`` or
+        ``translate_many`` call are waited on rather than sent again.
+        """
+        normalized_target = target_language.lower()
+        normalized_source = (source_language or "").lower()
+
+        keys: List[Optional[str]] = []
+        results: Dict[str, TranslationResult] = {}
+        pending: Dict[str, str] = {}
+        for text in texts:
+            if not normalize_cache_text(text or "") or (normalized_source and normalized_source == normalized_target):
+                keys.append(None)
+                continue
+
+            key = self._cache_key(text, normalized_source, normalized_target)
+            keys.append(key)
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                results[key] = TranslationResult(
+                    text=cached["text"],
+                    detected_language=cached["detected_language"],
+                    target_language=normalized_target,
+                )
+            else:
+                pending[key] = text
+
+        if pending:
+            results.update(
+                self._flights.do_many(
+                    pending,
+                    lambda led: self._translate_pending(
+                        [(key, pending[key]) for key in led], normalized_source, normalized_target
+                    ),
+                )
+            )
+
+        return [
+            results[key]
+            if key is not None
+            else TranslationResult(
+                text=text or "",
+                detected_language=normalized_source or normalized_target,
+                target_language=normalized_target,
+            )
+            for text, key in zip(texts, keys)
+        ]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for the translation cache."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return how many concurrent identical translations shared one upstream call."""
+        return self._flights.stats()
+
+    def _translate_pending(
+        self,
+        pending: List[Tuple[str, str]],
+        source_language: str,
+        target_language: str,
+    ) -> Dict[str, TranslationResult]:
+        """Translate ``(cache_key, text)`` pairs in chunks, returning results by cache key."""
+        chunks = [pending[index : index + self.batch_size] for index in range(0, len(pending), self.batch_size)]
+        if len(chunks) == 1:
+            return self._translate_chunk(chunks[0], source_language, target_language)
+
+        results: Dict[str, TranslationResult] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+            for chunk_results in executor.map(
+                lambda chunk: self._translate_chunk(chunk, source_language, target_language),
+                chunks,
+            ):
+                results.update(chunk_results)
+        return results
+
+    def _translate_chunk(
+        self,
+        chunk: List[Tuple[str, str]],
+        source_language: str,
+        target_language: str,
+    ) -> Dict[str, TranslationResult]:
+        """Send one group of strings upstream and cache each translation."""
+        translate_kwargs = {"dest": target_language}
+        if source_language:
+            translate_kwargs["src"] = source_language
+
+        try:
+            with upstream_span("googletrans"):
+                translated = load_translator().translate([text for _, text in chunk], **translate_kwargs)
         except Exception as exc:  # noqa: BLE001 - surface translation errors
             raise TranslationServiceError(str(exc)) from exc
 
-        detected_language = (result.src or normalized_source or "en").lower()
-        return TranslationResult(text=result.text, detected_language=detected_language, target_language=normalized_target)
+        if not isinstance(translated, list):
+            translated = [translated]
+        if len(translated) != len(chunk):
+            raise TranslationServiceError("Translation provider returned an incomplete batch.")
+
+        chunk_results: Dict[str, TranslationResult] = {}
+        for (key, _), result in zip(chunk, translated):
+            detected_language = (result.src or source_language or "en").lower()
+            if self.cache is not None:
+                self.cache.set(key, {"text": result.text, "detected_language": detected_language})
+            chunk_results[key] = TranslationResult(
+                text=result.text,
+                detected_language=detected_language,
+                target_language=target_language,
+            )
+        return chunk_results
+
+    def _cache_key(self, text: str, source_language: str, target_language: str) -> str:
+        """Build a compact cache key from the normalized request parameters."""
+        digest = hashlib.sha256(normalize_cache_text(text).encode("utf-8")).hexdigest()
+        return f"{self.provider}:{source_language or 'auto'}:{target_language}:{digest}"
@@ -0,0 +1,260 @@
+"""Shared HTTP client for upstream health APIs with pooling, retries and circuit breakers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils.metrics import record_fallback, upstream_span
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of calling an endpoint whose circuit breaker is open.
+
+    It subclasses ``RequestException`` so existing upstream error handling
+    falls through to local fallbacks without waiting on a timeout.
+    """
+
+
+def parse_host_overrides(spec: Optional[str]) -> Dict[str, str]:
+    """Parse ``"host=base_url,..."`` into a mapping used to redirect upstream hosts."""
+    overrides: Dict[str, str] = {}
+    for item in (spec or "").split(","):
+        host, _, base_url = item.partition("=")
+        if host.strip() and base_url.strip():
+            overrides[host.strip().lower()] = base_url.strip().rstrip("/")
+    return overrides
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream endpoint.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls for ``reset_timeout`` seconds. It then lets a single trial
+    call through (half-open); success closes it again, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._times_opened = 0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True when a call may be attempted now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._state = HALF_OPEN
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._times_opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {"state": state, "consecutive_failures": self._failures, "times_opened": self._times_opened}
+
+
+class UpstreamClient:
+    """Issue upstream requests through one pooled session per host.
+
+    Connections are kept alive per host, transient failures (connection
+    errors and 429/502/503/504 responses) are retried a bounded number of
+    times with exponential backoff, and every endpoint (host plus path) has
+    its own circuit breaker. ``host_overrides`` redirects a host to another
+    base URL, which lets tests point the service at a local stub server.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 2,
+        backoff_factor: float = 0.3,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        host_overrides: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.host_overrides = {host.lower(): base for host, base in (host_overrides or {}).items()}
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request and raise ``HTTPError`` for error statuses.
+
+        Raises ``CircuitOpenError`` without touching the network when the
+        endpoint's breaker is open.
+        """
+        target, host, endpoint = self._resolve(url)
+        breaker = self._breaker(endpoint)
+        if not breaker.allow():
+            record_fallback("circuit_open")
+            raise CircuitOpenError(f"Circuit open for {endpoint}; skipping upstream call.")
+
+        session = self._session(host)
+        with self._lock:
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        try:
+            with upstream_span(host):
+                response = session.request(method, target, **kwargs)
+                response.raise_for_status()
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else 0
+            if status >= 500 or status == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        except Exception:
+            # Anything else (e.g. an unwrapped urllib3 error) still ends a half-open
+            # trial; otherwise the breaker would wait for it forever.
+            breaker.record_failure()
+            raise
+        finally:
+            with self._lock:
+                self._in_flight[host] -= 1
+
+        breaker.record_success()
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker state per endpoint and connection pool usage per host."""
+        with self._lock:
+            sessions = dict(self._sessions)
+            breakers = dict(self._breakers)
+            in_flight = dict(self._in_flight)
+
+        pools: Dict[str, Dict[str, int]] = {}
+        for host, session in sessions.items():
+            opened = requests_sent = idle = 0
+            adapters = {id(adapter): adapter for adapter in session.adapters.values()}.values()
+            for adapter in adapters:
+                for key in list(adapter.poolmanager.pools.keys()):
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    opened += pool.num_connections
+                    requests_sent += pool.num_requests
+                    idle += pool.pool.qsize() if pool.pool is not None else 0
+            pools[host] = {
+                "connections_opened": opened,
+                "requests": requests_sent,
+                "in_flight": in_flight.get(host, 0),
+                "max_size": self.pool_size,
+            }
+
+        return {
+            "breakers": {endpoint: breaker.stats() for endpoint, breaker in breakers.items()},
+            "pools": pools,
+        }
+
+    def close(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+    def _resolve(self, url: str) -> Tuple[str, str, str]:
+        """Return the URL to call, its logical host and its endpoint key."""
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        endpoint = f"{host}{parts.path or '/'}"
+        override = self.host_overrides.get(host)
+        if override is None:
+            return url, host, endpoint
+
+        base = urlsplit(override)
+        target = urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + parts.path, parts.query, parts.fragment))
+        return target, host, endpoint
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                retry = Retry(
+                    total=self.max_retries,
+                    connect=self.max_retries,
+                    read=0,
+                    status=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    backoff_max=2.0,
+                    status_forcelist=_RETRY_STATUSES,
+                    allowed_methods=frozenset({"GET", "POST"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
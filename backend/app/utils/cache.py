@@ -0,0 +1,260 @@
+"""In-process and on-disk caches shared by the service layer."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters describing how a cache tier is performing."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain dictionary."""
+        return asdict(self)
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with an optional per-entry TTL.
+
+    Besides the entry count, the cache can be bounded by a total ``max_weight``
+    computed with ``weigher`` (for example an approximate byte size). The
+    optional ``on_evict`` callback runs, under the cache lock, whenever an
+    entry leaves the cache through eviction, expiry or deletion.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[Hashable, Any], int]] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.max_weight = max_weight if max_weight and max_weight > 0 else None
+        self._weigher = weigher or (lambda key, value: 1)
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` or ``None`` when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries when full."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        weight = self._weigher(key, value) if self.max_weight else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, weight)
+            self._weight += weight
+            while len(self._entries) > self.max_entries or (
+                self.max_weight is not None and self._weight > self.max_weight and len(self._entries) > 1
+            ):
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every cached entry while keeping the counters."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop ``key``; the caller must hold the lock."""
+        value, _, weight = self._entries.pop(key)
+        self._weight -= weight
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            snapshot = CacheStats(**self._stats.to_dict())
+            snapshot.size = len(self._entries)
+            return snapshot
+
+
+class SQLiteCache:
+    """Persistent key/value cache backed by a single SQLite table.
+
+    Values must be JSON serialisable. Entries carry a wall-clock expiry so that
+    they stay valid across process restarts.
+    """
+
+    def __init__(self, path: str, namespace: str = "default", ttl_seconds: Optional[float] = None) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value for ``key`` or ``None`` when absent or expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    )
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._stats.hits += 1
+
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.warning("Discarding unreadable cache entry in namespace '%s'.", self.namespace)
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Persist ``value`` under ``key``."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl else None
+        serialized = json.dumps(value, ensure_ascii=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, serialized, expires_at),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the store if present."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (self.namespace, time.time()),
+            )
+            self._stats.expirations += cursor.rowcount
+            return cursor.rowcount
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the store counters."""
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+            snapshot = CacheStats(**self._stats.to_dict())
+            snapshot.size = size
+            return snapshot
+
+
+class TieredCache:
+    """Two-tier cache: an in-process LRU in front of an optional SQLite store."""
+
+    def __init__(self, memory: LRUCache, persistent: Optional[SQLiteCache] = None) -> None:
+        self.memory = memory
+        self.persistent = persistent
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look ``key`` up in memory first, then promote persistent hits."""
+        value = self.memory.get(key)
+        if value is not None or self.persistent is None:
+            return value
+
+        value = self.persistent.get(key)
+        if value is not None:
+            self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Write ``value`` through to every configured tier."""
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            try:
+                self.persistent.set(key, value)
+            except sqlite3.Error as exc:
+                logger.warning("Failed to persist cache entry: %s", exc)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return counters for each configured tier."""
+        payload = {"memory": self.memory.stats().to_dict()}
+        if self.persistent is not None:
+            payload["persistent"] = self.persistent.stats().to_dict()
+        return payload
@@ -2,25 +2,145 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Literal
-
-from langdetect import DetectorFactory, LangDetectException, detect
-
-DetectorFactory.seed = 0
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Literal, Optional, Tuple, Type
 
 _SUPPORTED_LANGS: set[str] = {"en", "hi"}
 logger = logging.getLogger(__name__)
 
+# Share of letters that must be Devanagari for a message to count as Hindi.
+# Hindi users often mix in Latin words such as "COVID" or "ORS".
+_DEVANAGARI_THRESHOLD = 0.3
+# Minimum confidence for the romanized-Hindi lexicon model to decide alone.
+_ROMANIZED_THRESHOLD = 0.6
 
-def detect_language(text: str) -> str:
-    """Best-effort language detection for user input."""
+_WORD = re.compile(r"[a-z]+")
+
+# High-frequency romanized Hindi words, including common spelling variants.
+# Words that are also frequent in English ("me", "to", "the", "main") are
+# deliberately left out of both lists.
+_ROMANIZED_HINDI_WORDS = frozenset(
+    """
+    hai hain ho hoga hogi hote hota hoti tha thi nahi nahin nhi kya kyu kyun kyon kaise kaisa kaisi kab kahan
+    kahaan kaun kitna kitne kitni mujhe mujhko mera meri mere hum humein hame hamara hamari tum tumhara aap aapka
+    aapki apna apni apne yeh ye woh wo vo unka unki uska uski iska iski ka ki ke ko se mein mai aur bhi ya lekin
+    kar karo kare karu karun karna karte karta karti raha rahi rahe gaya gayi gaye liye chahiye sakta sakti sakte
+    batao bataiye bataye dijiye kijiye jao jaana jana lena lelo dena dedo wala wali wale bahut thoda jyada zyada
+    accha acha achha theek thik sab kuch koi abhi aaj kal subah shaam raat din pani khana dawai dawa davai bukhar
+    bukhaar khansi sardi jukham dard ulti dast chakkar kamzori bimari bimaar ilaaj ilaj aspatal
+    aspataal teeka tika teeke bacche bachche bacha bachcha bache ladka ladki aurat mahila garbhavastha sehat swasthya
+    haan ji namaste dhanyavad shukriya pehle baad saath sath paas najdeek nazdeek
+    """.split()
+)
+
+_ENGLISH_WORDS = frozenset(
+    """
+    the a an is are was were be been being am do does did have has had i you he she it we they my your his her its
+    our their this that these those what which who whom whose when where why how can could should would will shall
+    may might must of in on at for with from by about into over after before under between and or but not no yes if
+    then than so very there here all any some each every more most other such only own same just also please tell
+    give show find need want get know help near nearby hospital hospitals doctor clinic vaccine vaccines schedule
+    fever cough cold pain headache stomach symptoms treatment medicine health baby child children pregnant water food
+    eat drink sleep today cases alert outbreak prevent prevention safe tips take much many day days week weeks
+    """.split()
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LanguageGuess:
+    """Detected language with a confidence in ``[0, 1]`` and the method that decided it."""
+
+    language: str
+    confidence: float
+    method: str
+
+    def to_metadata(self) -> Dict[str, str]:
+        """Return a JSON-friendly summary for response metadata."""
+        return {"language": self.language, "confidence": f"{self.confidence:.2f}", "method": self.method}
+
+
+def _script_counts(text: str) -> tuple[int, int]:
+    """Return the number of Devanagari and Latin letters in ``text``."""
+    devanagari = latin = 0
+    for char in text:
+        code = ord(char)
+        if 0x0900 <= code <= 0x097F:
+            # Skip the danda punctuation marks and Devanagari digits.
+            if not 0x0964 <= code <= 0x096F:
+                devanagari += 1
+        elif char.isalpha() and (code < 0x0250 or 0x1E00 <= code <= 0x1EFF):
+            latin += 1
+    return devanagari, latin
+
+
+def romanized_hindi_score(text: str) -> Optional[float]:
+    """Return the share of known words that are romanized Hindi, or ``None`` if none are known."""
+    hindi = english = 0
+    for word in _WORD.findall(text.lower()):
+        if word in _ROMANIZED_HINDI_WORDS:
+            hindi += 1
+        elif word in _ENGLISH_WORDS:
+            english += 1
+    if hindi + english == 0:
+        return None
+    return hindi / (hindi + english)
+
+
+@functools.lru_cache(maxsize=1)
+def load_langdetect() -> Tuple[Callable[[str], list], Type[Exception]]:
+    """Import langdetect on first use; its language profiles load lazily too."""
+    from langdetect import DetectorFactory, LangDetectException, detect_langs
+
+    DetectorFactory.seed = 0
+    return detect_langs, LangDetectException
+
+
+def _langdetect_guess(text: str) -> LanguageGuess:
+    """Fall back to langdetect for messages the script and lexicon checks cannot settle."""
+    detect_langs, detection_error = load_langdetect()
     try:
-        lang = detect(text)
-    except LangDetectException:
+        candidates = detect_langs(text)
+    except detection_error:
         logger.debug("Language detection failed; defaulting to English.")
-        return "en"
-    return normalize_language_tag(lang)
+        return LanguageGuess("en", 0.0, "default")
+
+    best = candidates[0]
+    return LanguageGuess(normalize_language_tag(best.lang), round(best.prob, 2), "langdetect")
+
+
+def detect_language_with_confidence(text: str) -> LanguageGuess:
+    """Detect the language of ``text`` using script ratios first.
+
+    Messages that are mostly Devanagari are Hindi; Latin-script messages are
+    scored against compact romanized Hindi and English word lists. langdetect
+    is only consulted when neither signal is decisive.
+    """
+    devanagari, latin = _script_counts(text)
+    letters = devanagari + latin
+    if letters == 0:
+        return LanguageGuess("en", 0.0, "default")
+
+    devanagari_ratio = devanagari / letters
+    if devanagari_ratio >= _DEVANAGARI_THRESHOLD:
+        return LanguageGuess("hi", round(max(devanagari_ratio, 0.5), 2), "script")
+
+    if devanagari == 0:
+        score = romanized_hindi_score(text)
+        if score is not None:
+            if score >= _ROMANIZED_THRESHOLD:
+                return LanguageGuess("hi", round(score, 2), "romanized")
+            if 1 - score >= _ROMANIZED_THRESHOLD:
+                return LanguageGuess("en", round(1 - score, 2), "lexicon")
+
+    return _langdetect_guess(text)
+
+
+def detect_language(text: str) -> str:
+    """Best-effort language detection for user input."""
+    return detect_language_with_confidence(text).language
 
 
 def normalize_language_tag(tag: str) -> str:
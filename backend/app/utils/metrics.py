@@ -0,0 +1,200 @@
+"""In-process latency histograms and counters rendered in Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers cache hits (sub-millisecond) up to slow Overpass queries.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+_INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}" for labels, value in items)
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels, matching Prometheus semantics."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum.
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        with self._lock:
+            series = self._series.get(labels)
+            return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, _INF_LABEL)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by ``/api/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: List[object] = []
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Histogram:
+        metric = Histogram(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())  # type: ignore[attr-defined]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram("nirogi_stage_seconds", "Duration of chat pipeline stages.", ("stage",))
+TOOL_SECONDS = REGISTRY.histogram("nirogi_tool_seconds", "Duration of tool sentinel handling.", ("tool",))
+UPSTREAM_SECONDS = REGISTRY.histogram("nirogi_upstream_seconds", "Duration of upstream calls per host.", ("host",))
+ERRORS = REGISTRY.counter("nirogi_errors_total", "Exceptions raised in timed spans or background refreshes.", ("kind", "name", "error"))
+FALLBACKS = REGISTRY.counter("nirogi_fallbacks_total", "Times a local or stale fallback was served.", ("kind",))
+
+_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar("nirogi_timings", default=None)
+
+
+class _Span:
+    """Context manager timing one block into a histogram (and the request breakdown)."""
+
+    __slots__ = ("_histogram", "_kind", "_name", "_started")
+
+    def __init__(self, histogram: Histogram, kind: str, name: str) -> None:
+        self._histogram = histogram
+        self._kind = kind
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        elapsed = time.perf_counter() - self._started
+        self._histogram.observe(elapsed, self._name)
+        if exc_type is not None:
+            ERRORS.inc(self._kind, self._name, exc_type.__name__)
+        breakdown = _timings.get()
+        if breakdown is not None:
+            key = self._name if self._kind == "stage" else f"{self._kind}:{self._name}"
+            breakdown[key] = round(breakdown.get(key, 0.0) + elapsed * 1000, 2)
+
+
+def stage_span(stage: str) -> _Span:
+    """Time one chat pipeline stage, e.g. ``input_translation``."""
+    return _Span(STAGE_SECONDS, "stage", stage)
+
+
+def tool_span(sentinel: str) -> _Span:
+    """Time the handling of one tool sentinel."""
+    return _Span(TOOL_SECONDS, "tool", sentinel.strip("@").lower())
+
+
+def upstream_span(host: str) -> _Span:
+    """Time one call to an upstream host or provider."""
+    return _Span(UPSTREAM_SECONDS, "upstream", host)
+
+
+def record_error(kind: str, name: str, error: BaseException) -> None:
+    """Count an exception handled outside a span, e.g. a failed background refresh."""
+    ERRORS.inc(kind, name, type(error).__name__)
+
+
+def record_fallback(kind: str) -> None:
+    """Count a request answered from a fallback instead of the primary source."""
+    FALLBACKS.inc(kind)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """Collect span durations (in ms) for the current request into the yielded dict."""
+    breakdown: Dict[str, float] = {}
+    token = _timings.set(breakdown)
+    try:
+        yield breakdown
+    finally:
+        _timings.reset(token)
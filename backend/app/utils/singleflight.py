@@ -0,0 +1,120 @@
+"""Collapse concurrent identical calls into a single execution."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight execution between callers that use the same key.
+
+    The first caller for a key runs ``func``; callers arriving while it is
+    still running block until it finishes and receive the same result or
+    re-raise the same exception. Nothing is cached afterwards: the next call
+    with that key starts a fresh execution.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executions = 0
+        self._collapsed = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` for ``key`` or wait for the execution already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._collapsed += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def do_many(self, keys: Iterable[Hashable], func: Callable[[List[Hashable]], Dict[Hashable, T]]) -> Dict[Hashable, T]:
+        """Resolve several keys together, returning ``{key: result}``.
+
+        ``func`` runs once with the keys that are not already in flight and
+        must return a result for each of them. Keys that another ``do`` or
+        ``do_many`` call is already resolving are waited on instead.
+        """
+        led: Dict[Hashable, _Call] = {}
+        joined: Dict[Hashable, _Call] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                call = self._calls.get(key)
+                if call is not None:
+                    call.waiters += 1
+                    self._collapsed += 1
+                    joined[key] = call
+                else:
+                    led[key] = self._calls[key] = _Call()
+            if led:
+                self._executions += 1
+
+        results: Dict[Hashable, T] = {}
+        if led:
+            try:
+                produced = func(list(led))
+                for key, call in led.items():
+                    call.result = results[key] = produced[key]
+            except BaseException as exc:
+                for call in led.values():
+                    call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    for key in led:
+                        self._calls.pop(key, None)
+                for call in led.values():
+                    call.done.set()
+
+        # Leaders run before waiting, so two overlapping batches cannot deadlock.
+        for key, call in joined.items():
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            results[key] = call.result
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many executions ran and how many calls were collapsed into them."""
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "collapsed": self._collapsed,
+                "in_flight": len(self._calls),
+            }
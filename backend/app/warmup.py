@@ -0,0 +1,56 @@
+"""Optional warm-up that preloads heavy dependencies off the request path."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from flask import Flask
+
+from .services.health_data import load_dataset
+from .services.translation import load_translator
+from .utils.language import load_langdetect
+
+logger = logging.getLogger(__name__)
+
+
+def _steps(app: Flask) -> List[Tuple[str, Callable[[], object]]]:
+    return [
+        ("datasets", lambda: [load_dataset(name) for name in ("outbreak_alerts", "vaccine_schedule", "hospital_fallbacks")]),
+        ("translator", load_translator),
+        ("gemini", app.extensions["gemini_client"].warm_up),
+        ("langdetect", load_langdetect),
+    ]
+
+
+def warm_up(app: Flask) -> Dict[str, object]:
+    """Run every warm-up step, recording per-step durations in ``app.extensions["warm_up"]``.
+
+    Failures are logged and recorded; the lazy code paths retry on first use.
+    """
+    state: Dict[str, object] = {"status": "running", "steps": {}}
+    app.extensions["warm_up"] = state
+    started = time.perf_counter()
+    for name, step in _steps(app):
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:  # noqa: BLE001 - warm-up is best effort
+            logger.warning("Warm-up step '%s' failed: %s", name, exc)
+            state["steps"][name] = {"ms": round((time.perf_counter() - step_started) * 1000, 1), "error": str(exc)}
+            continue
+        state["steps"][name] = {"ms": round((time.perf_counter() - step_started) * 1000, 1)}
+    state["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    state["status"] = "done"
+    logger.info("Warm-up finished in %.0f ms.", state["total_ms"])
+    return state
+
+
+def start_warm_up(app: Flask) -> threading.Thread:
+    """Run :func:`warm_up` on a daemon thread so the server can accept requests immediately."""
+    app.extensions["warm_up"] = {"status": "pending", "steps": {}}
+    thread = threading.Thread(target=warm_up, args=(app,), name="nirogi-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,8 @@
+"""ASGI entrypoint for serving the NIROGI backend, e.g. ``uvicorn asgi:application``."""
+
+from __future__ import annotations
+
+from app import create_app
+from app.asgi import create_asgi_app
+
+application = create_asgi_app(create_app())
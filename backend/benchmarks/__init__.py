@@ -0,0 +1 @@
+"""Micro-benchmarks for NIROGI backend hot paths."""
@@ -0,0 +1,256 @@
+"""Offline stand-ins for Gemini, googletrans, Overpass and disease.sh.
+
+Each fake sleeps for a configurable latency and fails at a configurable rate
+so load tests exercise the real retry, breaker, cache and fallback paths
+without touching the network. Overpass and disease.sh are served by a local
+HTTP server that ``UPSTREAM_HOST_OVERRIDES`` points the upstream client at.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.services import llm, translation
+from app.services.intent_router import COVID_STATS, DISEASE_OUTBREAK, HOSPITALS, VACCINE_SCHEDULE
+from app.services.llm import GeminiClientError
+
+FAKE_NAMES = ("gemini", "translate", "overpass", "disease")
+
+# Default latencies (ms) roughly matching what the real services showed from India.
+DEFAULT_LATENCY_MS: Dict[str, float] = {"gemini": 600.0, "translate": 120.0, "overpass": 900.0, "disease": 250.0}
+
+_SUMMARY = (
+    "Here is what you should know. Drink plenty of clean water, rest, and watch for warning signs such as "
+    "a high fever that lasts more than two days, difficulty breathing or severe dehydration. If any of these "
+    "appear, visit the nearest health centre. This information is not a diagnosis; please consult a doctor."
+)
+
+# Keyword -> sentinel, standing in for the tool instructions in the system prompt.
+_TOOL_KEYWORDS = (
+    ("covid", COVID_STATS),
+    ("vaccin", VACCINE_SCHEDULE),
+    ("hospital", HOSPITALS),
+    ("outbreak", DISEASE_OUTBREAK),
+)
+
+_STATES = [
+    {"state": name, "active": active, "recovered": active * 40, "deaths": active // 10, "total": active * 41}
+    for name, active in (
+        ("Kerala", 2400),
+        ("Maharashtra", 1800),
+        ("Karnataka", 950),
+        ("Delhi", 640),
+        ("Tamil Nadu", 420),
+        ("Gujarat", 310),
+        ("Goa", 40),
+    )
+]
+
+
+@dataclass(slots=True)
+class FaultProfile:
+    """Latency and failure behaviour of one fake upstream."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def delay_seconds(self, rng: random.Random) -> float:
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+
+class FaultInjector:
+    """Apply fault profiles with a seeded, thread-safe random source."""
+
+    def __init__(self, profiles: Dict[str, FaultProfile], seed: int = 0) -> None:
+        self.profiles = profiles
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {name: 0 for name in profiles}
+        self.failures: Dict[str, int] = {name: 0 for name in profiles}
+
+    def apply(self, name: str) -> bool:
+        """Sleep for ``name``'s latency and return True when this call should fail."""
+        profile = self.profiles[name]
+        with self._lock:
+            delay = profile.delay_seconds(self._rng)
+            failed = self._rng.random() < profile.error_rate
+            self.calls[name] += 1
+            self.failures[name] += int(failed)
+        if delay:
+            time.sleep(delay)
+        return failed
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: {"calls": self.calls[name], "failures": self.failures[name]} for name in self.profiles}
+
+
+def parse_profiles(latency_spec: Optional[str], error_spec: Optional[str]) -> Dict[str, FaultProfile]:
+    """Build profiles from ``name=ms[:jitter],...`` and ``name=rate,...`` specs.
+
+    Unlisted fakes keep ``DEFAULT_LATENCY_MS`` and never fail.
+    """
+    profiles = {name: FaultProfile(latency_ms=DEFAULT_LATENCY_MS[name]) for name in FAKE_NAMES}
+    for spec, apply in ((latency_spec, _apply_latency), (error_spec, _apply_error_rate)):
+        for item in (spec or "").split(","):
+            if not item.strip():
+                continue
+            name, _, value = item.partition("=")
+            name = name.strip()
+            if name not in profiles or not value.strip():
+                raise ValueError(f"Invalid fake spec '{item}'; expected one of {', '.join(FAKE_NAMES)}.")
+            apply(profiles[name], value.strip())
+    return profiles
+
+
+def _apply_latency(profile: FaultProfile, value: str) -> None:
+    latency, _, jitter = value.partition(":")
+    profile.latency_ms = float(latency)
+    profile.jitter_ms = float(jitter) if jitter else 0.0
+
+
+def _apply_error_rate(profile: FaultProfile, value: str) -> None:
+    profile.error_rate = float(value)
+
+
+class FakeGemini:
+    """Replacement for ``llm.get_response`` / ``llm.stream_response``."""
+
+    def __init__(self, faults: FaultInjector) -> None:
+        self.faults = faults
+
+    def reply(self, message: str) -> str:
+        text = message.strip()
+        if not text.startswith("Here "):
+            lowered = text.lower()
+            for keyword, sentinel in _TOOL_KEYWORDS:
+                if keyword in lowered:
+                    return sentinel
+        return _SUMMARY
+
+    def get_response(self, message: str, **_: Any) -> str:
+        if self.faults.apply("gemini"):
+            raise GeminiClientError("fake Gemini failure")
+        return self.reply(message)
+
+    def stream_response(self, message: str, **_: Any) -> Iterator[str]:
+        if self.faults.apply("gemini"):
+            raise GeminiClientError("fake Gemini failure")
+        for word in self.reply(message).split(" "):
+            yield word + " "
+
+
+@dataclass(slots=True)
+class _Translated:
+    text: str
+    src: str
+    dest: str
+
+
+class FakeTranslator:
+    """Replacement for the googletrans ``Translator``; one delay per call, batched or not."""
+
+    def __init__(self, faults: FaultInjector) -> None:
+        self.faults = faults
+
+    def translate(self, text: Any, dest: str = "en", src: Optional[str] = None) -> Any:
+        if self.faults.apply("translate"):
+            raise RuntimeError("fake translation failure")
+        if isinstance(text, list):
+            return [self._one(item, dest, src) for item in text]
+        return self._one(text, dest, src)
+
+    @staticmethod
+    def _one(text: str, dest: str, src: Optional[str]) -> _Translated:
+        source = src or ("hi" if any("ऀ" <= char <= "ॿ" for char in text) else "en")
+        return _Translated(text=f"[{dest}] {text}", src=source, dest=dest)
+
+
+def _hospital_elements(count: int = 8) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "node",
+            "id": 1000 + index,
+            "lat": 18.5 + index / 100,
+            "lon": 73.8 + index / 100,
+            "tags": {"amenity": "hospital", "name": f"City Hospital {index + 1}", "addr:street": f"Road {index + 1}"},
+        }
+        for index in range(count)
+    ]
+
+
+def _handler(faults: FaultInjector) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path.endswith("/gov/India"):
+                self._send("disease", {"states": _STATES})
+            elif self.path.endswith("/countries/India"):
+                self._send("disease", {"country": "India", "cases": 45000000, "active": 6560, "recovered": 44400000})
+            else:
+                self._send_status(404)
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path.endswith("/api/interpreter"):
+                self._send("overpass", {"elements": _hospital_elements()})
+            else:
+                self._send_status(404)
+
+        def _send(self, name: str, payload: Dict[str, Any]) -> None:
+            if faults.apply(name):
+                self._send_status(503)
+                return
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_status(self, status: int) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+@contextmanager
+def installed(profiles: Dict[str, FaultProfile], seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Install every fake for the duration of the block.
+
+    Yields ``{"host_overrides": ..., "faults": FaultInjector}``; pass the
+    overrides to ``Settings.upstream_host_overrides`` before creating the app.
+    """
+    faults = FaultInjector(profiles, seed=seed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(faults))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="fake-health-apis", daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    gemini = FakeGemini(faults)
+    saved = (llm.get_response, llm.stream_response, translation._translator)
+    llm.get_response = gemini.get_response
+    llm.stream_response = gemini.stream_response
+    translation._translator = FakeTranslator(faults)
+    try:
+        yield {"host_overrides": f"disease.sh={base_url},overpass-api.de={base_url}", "faults": faults}
+    finally:
+        llm.get_response, llm.stream_response, translation._translator = saved
+        server.shutdown()
+        server.server_close()
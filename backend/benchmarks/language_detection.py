@@ -0,0 +1,91 @@
+"""Compare script-based language detection with plain langdetect.
+
+Run from the ``backend`` folder::
+
+    python -m benchmarks.language_detection --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable, List, Tuple
+
+from app.utils.language import detect_language_with_confidence, normalize_language_tag
+
+# (message, expected language) pairs mixing English, Devanagari Hindi,
+# romanized Hindi and code-switched messages as seen in chat traffic.
+CORPUS: List[Tuple[str, str]] = [
+    ("What are the symptoms of dengue?", "en"),
+    ("How do I prevent malaria during the monsoon?", "en"),
+    ("Show me the vaccine schedule for my baby", "en"),
+    ("Is it safe to take paracetamol for fever?", "en"),
+    ("Find nearby hospitals", "en"),
+    ("live covid cases today", "en"),
+    ("tips to control blood pressure", "en"),
+    ("डेंगू के लक्षण क्या हैं?", "hi"),
+    ("बुखार में क्या खाना चाहिए", "hi"),
+    ("मेरे बच्चे को कौन से टीके लगवाने चाहिए", "hi"),
+    ("पास के अस्पताल बताओ", "hi"),
+    ("COVID के आज के मामले कितने हैं", "hi"),
+    ("मुझे 3 दिन से बुखार है, क्या करूं?", "hi"),
+    ("mujhe bukhar hai kya karu", "hi"),
+    ("sugar kaise control kare", "hi"),
+    ("bacche ko tika kab lagwana hai", "hi"),
+    ("kya dengue fail raha hai", "hi"),
+    ("paas ka hospital kahan hai", "hi"),
+    ("pet me dard ho raha hai", "hi"),
+    ("sir dard ke liye kya dawai lu", "hi"),
+]
+
+
+def _langdetect_only() -> Callable[[str], str]:
+    from langdetect import DetectorFactory, LangDetectException, detect
+
+    DetectorFactory.seed = 0
+
+    def run(text: str) -> str:
+        try:
+            return normalize_language_tag(detect(text))
+        except LangDetectException:
+            return "en"
+
+    return run
+
+
+def _measure(detector: Callable[[str], str], repeat: int) -> dict:
+    correct = sum(detector(text) == expected for text, expected in CORPUS)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text, _ in CORPUS:
+            detector(text)
+    elapsed = time.perf_counter() - started
+    calls = repeat * len(CORPUS)
+    return {
+        "accuracy": round(correct / len(CORPUS), 3),
+        "mean_us": round(elapsed / calls * 1e6, 1),
+        "calls": calls,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the corpus per detector")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    baseline = _langdetect_only()
+    baseline("warm up")
+    load_ms = (time.perf_counter() - started) * 1000
+
+    results = {
+        "corpus_size": len(CORPUS),
+        "langdetect": {**_measure(baseline, args.repeat), "profile_load_ms": round(load_ms, 1)},
+        "script": _measure(lambda text: detect_language_with_confidence(text).language, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""Offline load test for the chat, translate and dashboard endpoints.
+
+Gemini, googletrans, Overpass and disease.sh are replaced by the fakes in
+``benchmarks.fakes``, so the run needs no network and every commit sees the
+same upstream behaviour. Each scenario is driven at every concurrency level
+and reports throughput, latency percentiles and memory as JSON. Run from the
+``backend`` folder::
+
+    python -m benchmarks.load --concurrency 1,8,32 --requests 200 > results.json
+    python -m benchmarks.load --baseline results.json
+    python -m benchmarks.load --pipeline-modes --concurrency 1,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from flask import Flask
+
+from app import create_app
+from app.config import Settings
+from app.services.llm import PIPELINE_MODES
+
+from .fakes import installed, parse_profiles
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One request shape; ``payloads`` are cycled through in order."""
+
+    name: str
+    method: str
+    path: str
+    payloads: Sequence[Optional[Dict[str, Any]]]
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(
+        "chat_en",
+        "POST",
+        "/api/chat",
+        [
+            {"message": "How do I prevent dengue?", "language": "en"},
+            {"message": "What should I eat during a fever?", "language": "en"},
+            {"message": "Is it safe to exercise with a cold?", "language": "en"},
+        ],
+    ),
+    Scenario(
+        "chat_hi",
+        "POST",
+        "/api/chat",
+        [
+            {"message": "डेंगू से कैसे बचें?", "language": "hi"},
+            {"message": "बुखार में क्या खाना चाहिए?", "language": "hi"},
+            {"message": "सर्दी में व्यायाम करना सुरक्षित है?", "language": "hi"},
+        ],
+    ),
+    Scenario("tool_covid", "POST", "/api/chat", [{"message": "show me covid stats", "language": "en"}]),
+    Scenario(
+        "tool_covid_via_llm", "POST", "/api/chat", [{"message": "how bad is covid in the states right now", "language": "en"}]
+    ),
+    Scenario("tool_vaccine", "POST", "/api/chat", [{"message": "show me the vaccine schedule", "language": "en"}]),
+    Scenario(
+        "tool_hospitals",
+        "POST",
+        "/api/chat",
+        [{"message": city, "language": "en", "context": "awaiting_city_for_hospitals"} for city in ("Pune", "Nagpur", "Indore")],
+    ),
+    Scenario(
+        "tool_outbreak",
+        "POST",
+        "/api/chat",
+        [{"message": "Dengue", "language": "en", "context": "awaiting_disease_for_alert"}],
+    ),
+    Scenario(
+        "translate",
+        "POST",
+        "/api/translate",
+        [{"texts": ["Find hospitals", "Vaccination camps", "Outbreak alerts"], "target_language": "hi"}],
+    ),
+    Scenario("dashboard", "GET", "/api/dashboard-data", [None]),
+]
+
+
+def build_app(host_overrides: str, **overrides: Any) -> Flask:
+    """Create an app wired to the fakes, with background sync and warm-up off."""
+    settings = Settings()
+    settings.gemini_api_key = "benchmark"
+    settings.upstream_host_overrides = host_overrides
+    settings.translation_cache_path = None
+    settings.hospital_store_path = ""
+    settings.sync_enabled = False
+    settings.warm_up = False
+    # Every simulated user shares one address, so the per-client limit would only measure itself.
+    settings.client_rate_limit = 0
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    app = create_app(settings, warm_up=False)
+    app.config.update({"TESTING": True})
+    return app
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    return round(usage / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_scenario(app: Flask, scenario: Scenario, concurrency: int, requests: int, unique: bool = False) -> Dict[str, Any]:
+    """Send ``requests`` requests with ``concurrency`` workers and summarise them."""
+    local = threading.local()
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def _send(index: int) -> None:
+        nonlocal errors
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        payload = scenario.payloads[index % len(scenario.payloads)]
+        if unique and payload is not None and "message" in payload and "context" not in payload:
+            payload = {**payload, "message": f"{payload['message']} ({index})"}
+
+        started = time.perf_counter()
+        response = client.open(scenario.path, method=scenario.method, json=payload)
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            errors += int(response.status_code >= 400)
+
+    heap_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    if heap_before is not None:
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(_send, range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    result: Dict[str, Any] = {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / wall, 2) if wall else None,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_rss_mb": _max_rss_mb(),
+    }
+    if heap_before is not None:
+        result["heap_peak_mb"] = round((tracemalloc.get_traced_memory()[1] - heap_before) / (1024 * 1024), 2)
+    return result
+
+
+def run_suite(
+    concurrency_levels: Sequence[int],
+    requests: int,
+    scenarios: Sequence[Scenario] = SCENARIOS,
+    latency_spec: Optional[str] = None,
+    error_spec: Optional[str] = None,
+    seed: int = 0,
+    unique: bool = False,
+    trace_memory: bool = False,
+    settings_overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run every scenario at every concurrency level against a fresh app per scenario."""
+    profiles = parse_profiles(latency_spec, error_spec)
+    report: Dict[str, Any] = {"scenarios": {}}
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with installed(profiles, seed=seed) as fakes:
+            for scenario in scenarios:
+                app = build_app(fakes["host_overrides"], **(settings_overrides or {}))
+                # One untimed request loads datasets and lazy imports.
+                run_scenario(app, scenario, 1, 1)
+                report["scenarios"][scenario.name] = {
+                    str(level): run_scenario(app, scenario, level, requests, unique=unique) for level in concurrency_levels
+                }
+                app.extensions["sync_scheduler"].stop(timeout=1)
+            report["fakes"] = fakes["faults"].stats()
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    report["config"] = {
+        "concurrency": list(concurrency_levels),
+        "requests": requests,
+        "seed": seed,
+        "unique_prompts": unique,
+        "profiles": {name: {"latency_ms": p.latency_ms, "jitter_ms": p.jitter_ms, "error_rate": p.error_rate} for name, p in profiles.items()},
+        "settings": settings_overrides or {},
+    }
+    return report
+
+
+def compare_pipeline_modes(
+    concurrency_levels: Sequence[int],
+    requests: int,
+    language: str = "hi",
+    scenarios: Optional[Sequence[Scenario]] = None,
+    **suite_options: Any,
+) -> Dict[str, Any]:
+    """Run the ``language`` scenarios once per ``LANGUAGE_PIPELINE_MODES`` value and report them side by side."""
+    selected = scenarios or [
+        scenario
+        for scenario in SCENARIOS
+        if scenario.payloads and all(payload and payload.get("language") == language for payload in scenario.payloads)
+    ]
+    runs = {
+        mode: run_suite(
+            concurrency_levels,
+            requests,
+            scenarios=selected,
+            settings_overrides={"language_pipeline_modes": f"{language}={mode}"},
+            **suite_options,
+        )
+        for mode in PIPELINE_MODES
+    }
+    side_by_side: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for scenario in selected:
+        for level in concurrency_levels:
+            results = {mode: runs[mode]["scenarios"][scenario.name][str(level)] for mode in PIPELINE_MODES}
+            side_by_side.setdefault(scenario.name, {})[str(level)] = {
+                **{
+                    mode: {key: result[key] for key in ("errors", "throughput_rps", "p50_ms", "p95_ms", "p99_ms")}
+                    for mode, result in results.items()
+                },
+                "p95_ratio": _ratio(results["native"]["p95_ms"], results["translate"]["p95_ms"]),
+            }
+    return {
+        "language": language,
+        "scenarios": side_by_side,
+        "upstream_calls": {mode: {name: stats["calls"] for name, stats in run["fakes"].items()} for mode, run in runs.items()},
+        "config": {key: value for key, value in runs[PIPELINE_MODES[0]]["config"].items() if key != "settings"},
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """Return current/baseline ratios of throughput and p95 for shared scenario/levels."""
+    deltas: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for name, levels in current["scenarios"].items():
+        for level, result in levels.items():
+            previous = baseline.get("scenarios", {}).get(name, {}).get(level)
+            if previous is None:
+                continue
+            deltas.setdefault(name, {})[level] = {
+                "throughput_ratio": _ratio(result["throughput_rps"], previous["throughput_rps"]),
+                "p95_ratio": _ratio(result["p95_ms"], previous["p95_ms"]),
+            }
+    return deltas
+
+
+def _ratio(current: Optional[float], previous: Optional[float]) -> Optional[float]:
+    if not current or not previous:
+        return None
+    return round(current / previous, 3)
+
+
+def _commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario and level.")
+    parser.add_argument("--scenarios", default="", help="Comma-separated scenario names (default: all).")
+    parser.add_argument("--latency", default="", help="Fake latencies, e.g. gemini=600:100,translate=120.")
+    parser.add_argument("--errors", default="", help="Fake error rates, e.g. gemini=0.02,overpass=0.1.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--unique-prompts", action="store_true", help="Make every chat prompt unique to defeat caches.")
+    parser.add_argument("--trace-memory", action="store_true", help="Report Python heap peaks (slows the run).")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against.")
+    parser.add_argument(
+        "--pipeline-modes", action="store_true", help="Compare the translate and native pipelines on the Hindi scenarios."
+    )
+    args = parser.parse_args()
+
+    wanted = {name.strip() for name in args.scenarios.split(",") if name.strip()}
+    unknown = wanted - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    selected = [scenario for scenario in SCENARIOS if not wanted or scenario.name in wanted]
+    options = dict(
+        latency_spec=args.latency,
+        error_spec=args.errors,
+        seed=args.seed,
+        unique=args.unique_prompts,
+        trace_memory=args.trace_memory,
+    )
+    if args.pipeline_modes:
+        report = compare_pipeline_modes(levels, args.requests, scenarios=selected if wanted else None, **options)
+    else:
+        report = run_suite(levels, args.requests, scenarios=selected, **options)
+    report["environment"] = {"commit": _commit(), "python": platform.python_version(), "platform": platform.platform()}
+    if args.baseline and not args.pipeline_modes:
+        with open(args.baseline, encoding="utf-8") as handle:
+            report["compared_to"] = compare(report, json.load(handle))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Measure backend import time per module and time to first request.
+
+Each measurement runs in a fresh interpreter so earlier imports do not hide
+the cost. Run from the ``backend`` folder::
+
+    python -m benchmarks.startup
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+MODULES: List[str] = [
+    "app",
+    "app.config",
+    "app.routes",
+    "app.utils.cache",
+    "app.utils.language",
+    "app.services.translation",
+    "app.services.llm",
+    "app.services.health_data",
+    "app.services.intent_router",
+    "app.warmup",
+]
+
+# Heavy third-party packages; ``null`` in the report means they were not
+# imported at start-up and will load lazily.
+DEPENDENCIES: List[str] = ["flask", "requests", "googletrans", "google.generativeai", "langdetect"]
+
+# Executed in a child interpreter; prints one JSON object.
+_FIRST_REQUEST_SCRIPT = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(warm_up={warm_up})
+created = time.perf_counter()
+if {warm_up}:
+    import threading
+    for thread in threading.enumerate():
+        if thread.name == "nirogi-warm-up":
+            thread.join()
+warmed = time.perf_counter()
+client = app.test_client()
+client.get("/api/healthcheck")
+first_health = time.perf_counter()
+client.post("/api/chat", json={{"message": "How do I prevent dengue?", "language": "en"}})
+first_chat = time.perf_counter()
+print(json.dumps({{
+    "import_ms": round((imported - started) * 1000, 1),
+    "create_app_ms": round((created - imported) * 1000, 1),
+    "warm_up_ms": round((warmed - created) * 1000, 1),
+    "first_healthcheck_ms": round((first_health - warmed) * 1000, 1),
+    "first_chat_ms": round((first_chat - first_health) * 1000, 1),
+}}))
+"""
+
+_IMPORT_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)")
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # Keep the measurement offline and deterministic: mock Gemini, no background sync.
+    env.update({"GEMINI_API_KEY": "", "SYNC_ENABLED": "0"})
+    return env
+
+
+def import_times() -> Dict[str, Optional[float]]:
+    """Return the cumulative import time of each tracked module in milliseconds.
+
+    A single ``-X importtime`` trace of ``import app`` is used so every
+    module is charged for what it pulls in the first time it is imported.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        capture_output=True,
+        text=True,
+        env=_child_env(),
+        check=True,
+    )
+    cumulative: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            cumulative[match.group(2)] = round(int(match.group(1)) / 1000, 1)
+    return {module: cumulative.get(module) for module in MODULES + DEPENDENCIES}
+
+
+def first_request(warm_up: bool) -> Dict[str, float]:
+    """Return the import, app creation and first request latencies of a fresh process."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_REQUEST_SCRIPT.format(warm_up=warm_up)],
+        capture_output=True,
+        text=True,
+        env=_child_env(),
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+    print(
+        json.dumps(
+            {
+                "import_ms": import_times(),
+                "first_request": {"cold": first_request(False), "warm_up": first_request(True)},
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
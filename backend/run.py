@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 
-from app import create_app
+from app import create_app, start_background_tasks, stop_background_tasks
 
 
 def main() -> None:
@@ -12,9 +12,17 @@ def main() -> None:
     app = create_app()
     # Render sets PORT; fall back to Flask defaults when running locally.
     port = int(os.getenv("PORT", os.getenv("FLASK_RUN_PORT", "5000")))
-    app.run(host="0.0.0.0", port=port, debug=app.config.get("DEBUG", False))
+    debug = app.config.get("DEBUG", False)
+    # With the debug reloader only the child process (WERKZEUG_RUN_MAIN) serves requests.
+    serving = not debug or os.getenv("WERKZEUG_RUN_MAIN") == "true"
+    if serving:
+        start_background_tasks(app)
+    try:
+        app.run(host="0.0.0.0", port=port, debug=debug)
+    finally:
+        if serving:
+            stop_background_tasks(app)
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,22 @@
+"""Shared fixtures for the backend test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture(autouse=True)
+def _offline_settings(monkeypatch, tmp_path):
+    """Keep test apps from starting the dataset refresh loop or writing to the instance folder."""
+    monkeypatch.setenv("SYNC_ENABLED", "0")
+    monkeypatch.setenv("FEEDBACK_STORE_PATH", str(tmp_path / "feedback.sqlite3"))
+
+
+@pytest.fixture()
+def app():
+    """Create a Flask test instance."""
+    app = create_app()
+    app.config.update({"TESTING": True})
+    return app
@@ -0,0 +1,117 @@
+"""Tests for Gemini admission control and per-client rate limiting."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from app.asgi import _client_address
+from app.config import Settings
+from app.services.admission import FOLLOW_UP, FRESH, AdmissionController, AdmissionRejected
+
+
+def _hold_slot(controller, release):
+    with controller.slot(FRESH):
+        release.wait(5)
+
+
+def _wait_for_queue(controller, depth):
+    deadline = time.monotonic() + 5
+    while controller.stats()["queue_depth"] < depth and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_follow_ups_are_admitted_before_fresh_questions():
+    """A queued tool follow-up should get the next free slot even if it arrived last."""
+    controller = AdmissionController(max_in_flight=1, max_queue=4, max_wait_seconds=5)
+    release = threading.Event()
+    holder = threading.Thread(target=_hold_slot, args=(controller, release))
+    holder.start()
+    while controller.stats()["in_flight"] < 1:
+        time.sleep(0.005)
+
+    order = []
+
+    def call(priority, label):
+        with controller.slot(priority):
+            order.append(label)
+
+    fresh = threading.Thread(target=call, args=(FRESH, "fresh"))
+    fresh.start()
+    _wait_for_queue(controller, 1)
+    follow_up = threading.Thread(target=call, args=(FOLLOW_UP, "follow_up"))
+    follow_up.start()
+    _wait_for_queue(controller, 2)
+
+    release.set()
+    for thread in (holder, fresh, follow_up):
+        thread.join(5)
+
+    assert order == ["follow_up", "fresh"]
+    stats = controller.stats()
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["admitted"] == 3
+
+
+def test_full_queue_sheds_immediately_with_retry_hint():
+    """Once the queue is full, new calls should be rejected without waiting."""
+    controller = AdmissionController(max_in_flight=1, max_queue=0, max_wait_seconds=5)
+    release = threading.Event()
+    holder = threading.Thread(target=_hold_slot, args=(controller, release))
+    holder.start()
+    while controller.stats()["in_flight"] < 1:
+        time.sleep(0.005)
+
+    started = time.monotonic()
+    with pytest.raises(AdmissionRejected) as excinfo:
+        with controller.slot(FRESH):
+            pass
+    release.set()
+    holder.join(5)
+
+    assert time.monotonic() - started < 0.5
+    assert excinfo.value.reason == "queue_full"
+    assert excinfo.value.retry_after >= 1
+    assert controller.stats()["rejected"]["queue_full"] == 1
+
+
+def test_chat_returns_429_once_a_client_exhausts_its_burst(app):
+    """Requests beyond the burst should get 429 with Retry-After, visible in upstream status."""
+    app.extensions["admission"].client_rate = 0.5
+    app.extensions["admission"].client_burst = 2
+    client = app.test_client()
+    payload = {"message": "how do I stay hydrated?", "language": "en"}
+
+    statuses = [client.post("/api/chat", json=payload).status_code for _ in range(3)]
+    rejected = client.post("/api/chat", json=payload)
+
+    assert statuses[:2] == [200, 200]
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert rejected.get_json()["retry_after"] >= 1
+    admission = client.get("/api/upstream-status").get_json()["admission"]
+    assert admission["rejected"]["rate_limited"] >= 2
+
+
+def test_clients_behind_a_trusted_proxy_get_their_own_bucket():
+    """With TRUSTED_PROXIES set the limit is keyed on X-Forwarded-For, not the proxy's address."""
+    settings = Settings()
+    settings.trusted_proxies = 1
+    settings.client_rate_limit = 30
+    settings.client_burst = 1
+    app = create_app(settings)
+    client = app.test_client()
+    payload = {"message": "how do I stay hydrated?", "language": "en"}
+
+    first = client.post("/api/chat", json=payload, headers={"X-Forwarded-For": "203.0.113.1"})
+    other = client.post("/api/chat", json=payload, headers={"X-Forwarded-For": "203.0.113.2"})
+    repeat = client.post("/api/chat", json=payload, headers={"X-Forwarded-For": "203.0.113.1"})
+
+    assert (first.status_code, other.status_code, repeat.status_code) == (200, 200, 429)
+    scope = {"client": ("10.0.0.5", 443), "headers": [(b"x-forwarded-for", b"198.51.100.7, 203.0.113.9")]}
+    assert _client_address(scope, 1) == "203.0.113.9"
+    assert _client_address(scope, 0) == "10.0.0.5"
@@ -0,0 +1,88 @@
+"""Tests for the LLM answer cache."""
+
+from __future__ import annotations
+
+from app.routes import chat_with_bot
+from app.services.answer_cache import AnswerCache, CachedAnswer
+from app.services.intent_router import HOSPITALS
+from app.services.llm import GeminiResponse
+from app.services.sessions import SessionStore
+from app.utils.cache import LRUCache, TieredCache
+
+
+class _CountingLLM:
+    """Returns a fixed reply and counts calls."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def get_response(self, prompt, system_prompt=None):
+        self.calls += 1
+        return GeminiResponse(text=self.text, metadata={"provider": "fake"})
+
+
+class _Health:
+    def get_vaccine_schedule(self):
+        return {"schedule": []}
+
+
+def test_normalized_prompts_share_an_entry():
+    """Case and punctuation differences should not defeat the cache."""
+    cache = AnswerCache()
+    cache.set("How do I prepare ORS?", CachedAnswer(text="Mix salt and sugar."))
+
+    assert cache.get("how do i prepare ors").text == "Mix salt and sugar."
+
+
+def test_near_duplicate_mode_matches_paraphrases():
+    """Opt-in MinHash matching should reuse answers for near-identical prompts."""
+    cache = AnswerCache(near_duplicate=True, similarity_threshold=0.5)
+    cache.set("what are the common symptoms of dengue fever", CachedAnswer(text="Fever and rash."))
+
+    assert cache.get("what are the common symptoms of dengue fever in adults").text == "Fever and rash."
+    assert cache.get("how do i lower my blood pressure") is None
+    assert cache.stats()["near_duplicate_hits"] == 1
+
+
+def test_memory_budget_evicts_oldest_answers():
+    """The byte budget should bound the cache regardless of entry count."""
+    cache = AnswerCache(max_bytes=2000)
+    for index in range(10):
+        cache.set(f"question {index}", CachedAnswer(text="x" * 400))
+
+    assert cache.get("question 0") is None
+    assert cache.get("question 9") is not None
+    assert cache.stats()["evictions"] > 0
+
+
+def test_cached_tool_sentinel_skips_routing_call():
+    """A cached sentinel should go straight to the tool without a routing LLM call."""
+    cache = AnswerCache()
+    llm = _CountingLLM("@@FETCH_HOSPITALS@@")
+
+    for _ in range(2):
+        result = chat_with_bot("Find nearby hospitals", "en", None, _Health(), llm, answer_cache=cache)
+
+    assert llm.calls == 1
+    assert result["metadata"]["context"] == "awaiting_city_for_hospitals"
+    assert result["metadata"]["llm"]["cache"] == "hit"
+
+
+def test_sessions_with_history_reuse_only_cached_tool_sentinels():
+    """Later turns may skip routing for a cached tool request, but never reuse a cached free-text answer."""
+    cache = AnswerCache()
+    store = SessionStore(TieredCache(LRUCache(max_entries=16, ttl_seconds=60)))
+    chat_with_bot("Find nearby hospitals", "en", None, _Health(), _CountingLLM(HOSPITALS), answer_cache=cache)
+    chat_with_bot("What is ORS?", "en", None, _Health(), _CountingLLM("Oral rehydration salts."), answer_cache=cache)
+
+    conversation = store.open(None)
+    conversation.record("hello", "Hi! How can I help?", None)
+    llm = _CountingLLM("ORS, as I said earlier, is oral rehydration salts.")
+    tool = chat_with_bot("Find nearby hospitals", "en", None, _Health(), llm, answer_cache=cache, conversation=conversation)
+    answer = chat_with_bot("What is ORS?", "en", None, _Health(), llm, answer_cache=cache, conversation=conversation)
+
+    assert tool["metadata"]["llm"]["cache"] == "hit"
+    assert answer["message"] == "ORS, as I said earlier, is oral rehydration salts."
+    assert llm.calls == 1
+    assert cache.get("What is ORS?").text == "Oral rehydration salts."
@@ -0,0 +1,50 @@
+"""Tests for the fingerprinted, precompressed frontend asset pipeline."""
+
+from __future__ import annotations
+
+import gzip
+
+
+from app.assets import choose_encoding
+
+
+def test_encoding_negotiation_honours_quality_values():
+    """Brotli should win ties, explicit q=0 should exclude an encoding and unknown headers fall back."""
+    assert choose_encoding("gzip, deflate, br", {"identity", "gzip", "br"}) == "br"
+    assert choose_encoding("br;q=0, gzip;q=0.5", {"identity", "gzip", "br"}) == "gzip"
+    assert choose_encoding("gzip;q=0.4, br;q=0.9", {"identity", "gzip"}) == "gzip"
+    assert choose_encoding("*", {"identity", "gzip"}) == "gzip"
+    assert choose_encoding("", {"identity", "gzip"}) == "identity"
+
+
+def test_pages_reference_immutable_fingerprinted_assets(app):
+    """Pages should link hashed scripts that are cached for a year and served gzip-compressed."""
+    client = app.test_client()
+
+    page = client.get("/chat.html")
+    script_url = app.extensions["assets"].urls["chat.js"]
+    script = client.get(f"/{script_url}", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/chat.js")
+
+    assert page.headers["Cache-Control"] == "no-cache"
+    assert f'src="{script_url}"' in page.get_data(as_text=True)
+    assert script_url != "chat.js"
+    assert "immutable" in script.headers["Cache-Control"]
+    assert script.headers["Content-Encoding"] == "gzip"
+    assert script.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(script.data) == plain.data
+    assert "Content-Encoding" not in plain.headers
+
+
+def test_revalidation_and_unknown_files(app):
+    """A matching ETag should get 304 and files outside the whitelist 404."""
+    client = app.test_client()
+
+    first = client.get("/", headers={"Accept-Encoding": "gzip"})
+    again = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert again.status_code == 304
+    assert again.data == b""
+    assert client.get("/requests.jsonl").status_code == 404
+    assert client.get("/../README.md").status_code == 404
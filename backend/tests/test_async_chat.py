@@ -0,0 +1,112 @@
+"""Tests for the asyncio chat pipeline and its ASGI entry point."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+
+from app.async_chat import async_chat_with_bot
+from app.asgi import create_asgi_app
+from app.services.intent_router import COVID_STATS, IntentDecision
+from app.services.llm import GeminiResponse
+
+
+def _call(application, method, path, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(application(scope, receive, send))
+    status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+    content = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+    return status, json.loads(content)
+
+
+def test_asgi_chat_matches_flask_reply(app):
+    """The async pipeline should answer exactly like the synchronous endpoint."""
+    application = create_asgi_app(app)
+    request_body = {"message": "show me the vaccine schedule", "language": "en"}
+
+    status, payload = _call(application, "POST", "/api/chat", request_body)
+    expected = app.test_client().post("/api/chat", json=request_body).get_json()
+
+    assert status == 200
+    assert payload["message"] == expected["message"]
+    assert payload["metadata"]["renderer"] == "template"
+
+
+def test_asgi_delegates_other_routes_to_flask(app):
+    """Non-chat routes should still be served by the Flask application."""
+    status, payload = _call(create_asgi_app(app), "GET", "/api/healthcheck")
+
+    assert status == 200
+    assert payload["status"] == "ok"
+
+
+class _FakeRouter:
+    def route(self, message):
+        return IntentDecision(intent=None, confidence=0.4, method="model", candidate=COVID_STATS)
+
+
+class _FakeLLM:
+    provider_name = "fake"
+
+    def __init__(self):
+        self.prompts = []
+
+    async def get_response(self, prompt, system_prompt=None, priority=None):
+        self.prompts.append(prompt)
+        text = COVID_STATS if len(self.prompts) == 1 else "summary"
+        return GeminiResponse(text=text, metadata={"provider": "fake"})
+
+
+class _FakeHealth:
+    def __init__(self):
+        self.fetches = 0
+
+    async def get_statewise_covid_data(self):
+        self.fetches += 1
+        await asyncio.sleep(0)
+        return [{"state": "Kerala", "active": 40, "recovered": 10}]
+
+
+def test_tool_data_is_prefetched_while_gemini_routes():
+    """A low-confidence router guess should start the tool fetch before Gemini answers."""
+    health = _FakeHealth()
+    llm = _FakeLLM()
+
+    result = asyncio.run(
+        async_chat_with_bot(
+            message="kerala numbers?",
+            language="en",
+            translation_service=None,
+            health_service=health,
+            llm_service=llm,
+            intent_router=_FakeRouter(),
+        )
+    )
+
+    assert result["message"] == "summary"
+    assert result["metadata"]["prefetch"] == "hit"
+    assert health.fetches == 1
+    assert "Kerala" in llm.prompts[1]
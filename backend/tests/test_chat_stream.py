@@ -0,0 +1,90 @@
+"""Tests for the Server-Sent Events chat endpoint."""
+
+from __future__ import annotations
+
+import json
+
+
+from app.routes import _split_sentences
+from app.services.intent_router import HOSPITALS
+from app.services.translation import TranslationResult
+
+
+class _FakeLLM:
+    """Streams a canned reply in small chunks."""
+
+    provider_name = "fake"
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def stream_response(self, prompt, system_prompt=None):
+        yield from self.chunks
+
+    def get_response(self, prompt, system_prompt=None):
+        raise AssertionError("tool sentinels should not trigger in this test")
+
+
+class _FakeTranslator:
+    """Marks each translated fragment so sentence boundaries are visible."""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, text, target_language, source_language=None):
+        self.calls.append(text)
+        return TranslationResult(text=f"<{text}>", detected_language=source_language or "en", target_language=target_language)
+
+
+def _events(response):
+    frames = response.get_data(as_text=True).strip().split("\n\n")
+    parsed = []
+    for frame in frames:
+        event_line, data_line = frame.split("\n")
+        parsed.append((event_line[len("event: ") :], json.loads(data_line[len("data: ") :])))
+    return parsed
+
+
+def test_english_reply_is_streamed_token_by_token(app):
+    """English replies should be forwarded chunk by chunk followed by a done event."""
+    app.extensions["gemini_client"] = _FakeLLM(["Drink ", "clean ", "water."])
+
+    response = app.test_client().post("/api/chat/stream", json={"message": "tips", "language": "en"})
+    events = _events(response)
+
+    assert response.mimetype == "text/event-stream"
+    assert [payload["text"] for event, payload in events if event == "token"] == ["Drink ", "clean ", "water."]
+    assert events[-1][0] == "done"
+
+
+def test_hindi_reply_is_translated_sentence_by_sentence(app):
+    """Hindi replies should be translated per completed sentence."""
+    translator = _FakeTranslator()
+    app.extensions["gemini_client"] = _FakeLLM(["Rest well. Drink", " water. Visit", " a doctor"])
+    app.extensions["translation_service"] = translator
+
+    response = app.test_client().post("/api/chat/stream", json={"message": "सलाह", "language": "hi"})
+    tokens = [payload["text"] for event, payload in _events(response) if event == "token"]
+
+    assert tokens == ["<Rest well.> ", "<Drink water.> ", "<Visit a doctor>"]
+
+
+def test_sentence_split_keeps_decimals_and_waits_for_whitespace():
+    """A full stop without trailing whitespace may be a decimal point, so it is not a boundary yet."""
+    assert _split_sentences("Take 2.5 ml twice a day. Rest") == (["Take 2.5 ml twice a day. "], "Rest")
+    assert _split_sentences("Step 1.") == ([], "Step 1.")
+    assert _split_sentences("Step 1.5 mg daily.\nDrink water") == (["Step 1.5 mg daily.\n"], "Drink water")
+
+
+def test_streamed_tool_sentinel_is_resolved_not_streamed(app):
+    """A sentinel split across chunks must be held back and answered with the catalog prompt."""
+    app.extensions["gemini_client"] = _FakeLLM([HOSPITALS[:5], HOSPITALS[5:]])
+    app.extensions["intent_router"] = None
+
+    events = _events(app.test_client().post("/api/chat/stream", json={"message": "help", "language": "en"}))
+
+    tokens = [payload["text"] for event, payload in events if event == "token"]
+    done = events[-1][1]
+    assert len(tokens) == 1 and "@@" not in tokens[0]
+    assert done["metadata"]["message_id"] == "chat.hospitals.ask_city"
+    assert done["metadata"]["context"] == "awaiting_city_for_hospitals"
@@ -0,0 +1,33 @@
+"""Tests for tool payload compaction."""
+
+from __future__ import annotations
+
+from app.services.compaction import PayloadCompactor, estimate_tokens
+
+
+def test_covid_states_are_projected_filtered_and_sorted():
+    """Only states above the threshold should remain, largest first, with three fields."""
+    states = [
+        {"state": "Kerala", "active": 120, "recovered": 5000, "deaths": 3, "todayCases": 9},
+        {"state": "Goa", "active": 4, "recovered": 900, "deaths": 0, "todayCases": 0},
+        {"state": "Delhi", "active": 300, "recovered": 8000, "deaths": 8, "todayCases": 20},
+    ]
+
+    payload = PayloadCompactor().covid_states(states)
+
+    assert payload.data == [
+        {"state": "Delhi", "active": 300, "cured": 8000},
+        {"state": "Kerala", "active": 120, "cured": 5000},
+    ]
+    assert payload.tokens_after < payload.tokens_before
+
+
+def test_token_budget_truncates_long_lists():
+    """The configured budget should cap the serialized payload size."""
+    states = [{"state": f"State {index}", "active": 1000 - index, "recovered": 1} for index in range(200)]
+
+    payload = PayloadCompactor(token_budget=100).covid_states(states)
+
+    assert payload.dropped > 0
+    assert estimate_tokens(payload.data) <= 100
+    assert payload.data[0]["active"] == 1000
@@ -0,0 +1,103 @@
+"""Tests for the aggregated, conditionally cached dashboard feed."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime
+
+from app.services.dashboard import DashboardFeed, build_dashboard_data
+from app.services.datasets import DatasetRegistry
+
+
+def _write(path, payload):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_aggregates_merge_alerts_and_order_camps():
+    """Alerts for the same district and disease should be summed and keep the worst status."""
+    outbreaks = {
+        "alerts": [
+            {"disease": "Dengue", "region": "Delhi", "status": "Moderate Alert", "cases_reported": 40},
+            {"disease": "dengue", "region": "delhi", "status": "High Alert", "cases_reported": 60},
+            {"disease": "Malaria", "region": "Mumbai", "status": "Moderate Alert", "cases_reported": 89},
+        ]
+    }
+    camps = {
+        "camps": [
+            {"name": "B", "area": "Pune", "date": "2025-11-20"},
+            {"name": "A", "area": "Delhi", "date": "2025-11-15"},
+            {"name": "Past", "area": "Agra", "date": "2025-11-01"},
+        ]
+    }
+    schedule = {"schedule": [{"age": "At Birth", "vaccines": ["BCG", "OPV 0-dose"]}]}
+
+    data = build_dashboard_data(outbreaks, camps, schedule, today=date(2025, 11, 10))
+
+    assert data["outbreak_alerts"][0] == {"district": "Delhi", "disease": "Dengue", "cases": 100, "status": "High Alert"}
+    assert [camp["name"] for camp in data["vaccination_camps"]] == ["A", "B"]
+    assert data["vaccination_camps"][0]["date"] == "Nov 15, 2025"
+    assert data["summary"] == {
+        "total_cases": 189,
+        "districts": 2,
+        "diseases": 2,
+        "high_alerts": 1,
+        "upcoming_camps": 2,
+        "scheduled_doses": 2,
+    }
+
+
+def test_feed_is_rebuilt_only_when_a_source_changes(tmp_path):
+    """Unchanged sources should reuse the serialized body; an edit should change the ETag."""
+    _write(tmp_path / "outbreaks.json", {"alerts": [{"disease": "Dengue", "region": "Delhi", "cases_reported": 5}]})
+    _write(tmp_path / "camps.json", {"camps": []})
+    _write(tmp_path / "schedule.json", {"schedule": []})
+    registry = DatasetRegistry(str(tmp_path), check_interval_seconds=0)
+    registry.register("outbreak_alerts", "outbreaks.json")
+    registry.register("vaccination_camps", "camps.json")
+    registry.register("vaccine_schedule", "schedule.json")
+    today = [date(2025, 11, 10)]
+    feed = DashboardFeed(registry.snapshot, today=lambda: today[0])
+
+    first = feed.current()
+    assert feed.current() is first
+    today[0] = date(2025, 11, 11)
+    assert feed.current() is not first
+    first = feed.current()
+    _write(tmp_path / "outbreaks.json", {"alerts": [{"disease": "Dengue", "region": "Delhi", "cases_reported": 9}]})
+    mtime_ns = os.stat(tmp_path / "outbreaks.json").st_mtime_ns
+    os.utime(tmp_path / "outbreaks.json", ns=(mtime_ns, mtime_ns + 1_000_000_000))
+    second = feed.current()
+
+    assert feed.stats()["builds"] == 3
+    assert second.etag != first.etag
+    assert json.loads(second.body)["outbreak_alerts"][0]["cases"] == 9
+
+
+def test_dashboard_endpoint_answers_revalidation_with_304(app):
+    """A poll carrying the current ETag should get an empty 304."""
+    client = app.test_client()
+
+    response = client.get("/api/dashboard-data")
+    data = response.get_json()
+    etag = response.headers["ETag"]
+    revalidated = client.get("/api/dashboard-data", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert "max-age=60" in response.headers["Cache-Control"]
+    assert {"district", "disease", "cases"} <= set(data["outbreak_alerts"][0])
+    assert data["summary"]["upcoming_camps"] == len(data["vaccination_camps"])
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+    assert client.get("/api/dashboard-data", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_bundled_camps_are_upcoming_on_the_real_clock(app):
+    """The shipped simulated camps must still be listed today, not filtered out as past."""
+    data = app.test_client().get("/api/dashboard-data").get_json()
+
+    camp_dates = [datetime.strptime(camp["date"], "%b %d, %Y").date() for camp in data["vaccination_camps"]]
+    assert data["summary"]["upcoming_camps"] == len(camp_dates) > 0
+    assert all(camp_date >= date.today() for camp_date in camp_dates)
+    assert camp_dates == sorted(camp_dates)
@@ -0,0 +1,62 @@
+"""Tests for the indexed local dataset registry."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.services.datasets import DatasetError, DatasetRegistry, group_by
+from app.services.health_data import get_local_hospital_fallback, get_outbreak_alerts_for_region
+
+
+def _write(path, payload, mtime_ns):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _registry(tmp_path):
+    registry = DatasetRegistry(str(tmp_path), check_interval_seconds=0)
+    registry.register("alerts", "alerts.json", lambda payload: {"disease": group_by(payload["alerts"], "disease")})
+    return registry
+
+
+def test_reloads_only_when_contents_change(tmp_path):
+    """A touched file with identical bytes must not be re-parsed or re-indexed."""
+    path = tmp_path / "alerts.json"
+    _write(path, {"alerts": [{"disease": "Dengue", "region": "Delhi"}]}, 1_000_000_000)
+    registry = _registry(tmp_path)
+
+    first = registry.snapshot("alerts")
+    assert first.lookup("disease", " dengue ")[0]["region"] == "Delhi"
+
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert registry.snapshot("alerts").indexes is first.indexes
+    assert registry.stats()["alerts"]["reloads"] == 0
+
+    _write(path, {"alerts": [{"disease": "Dengue", "region": "Pune"}]}, 3_000_000_000)
+    assert registry.snapshot("alerts").lookup("disease", "Dengue")[0]["region"] == "Pune"
+    assert registry.stats()["alerts"]["reloads"] == 1
+
+
+def test_broken_reload_keeps_previous_snapshot(tmp_path):
+    """A partially written file should not replace the last good version."""
+    path = tmp_path / "alerts.json"
+    _write(path, {"alerts": [{"disease": "Malaria"}]}, 1_000_000_000)
+    registry = _registry(tmp_path)
+    registry.snapshot("alerts")
+
+    path.write_text("{\"alerts\": [", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert registry.snapshot("alerts").lookup("disease", "malaria") == [{"disease": "Malaria"}]
+    with pytest.raises(DatasetError):
+        _registry(tmp_path).snapshot("alerts")
+
+
+def test_bundled_indexes_answer_lookups():
+    """Region and city indexes over the bundled files resolve case-insensitively."""
+    assert [alert["disease"] for alert in get_outbreak_alerts_for_region("delhi")] == ["Dengue"]
+    assert get_local_hospital_fallback("DELHI")
+    assert get_local_hospital_fallback("atlantis") is None
@@ -0,0 +1,84 @@
+"""Tests for the batched feedback ingestion pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from app.services.feedback import FeedbackIngestor, FeedbackQueueFull, FeedbackStore
+
+
+class _BlockingStore(FeedbackStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.batches = []
+
+    def append(self, entries):
+        self.release.wait(5)
+        self.batches.append(len(entries))
+        super().append(entries)
+
+
+def test_feedback_is_accepted_and_flushed_in_batches_on_shutdown(app):
+    """Valid submissions should get 202 and all be stored once the writer stops."""
+    client = app.test_client()
+    ingestor = app.extensions["feedback"]
+    ingestor.flush_interval = 60
+
+    for rating in range(1, 6):
+        response = client.post("/api/feedback", json={"rating": rating, "message": f"note {rating}", "extra": "x"})
+        assert response.status_code == 202
+    ingestor.stop()
+
+    stored = ingestor.store.recent()
+    assert ingestor.store.count() == 5
+    assert stored[0]["rating"] == 5
+    assert "extra" not in stored[0]
+    assert ingestor.stats()["batches"] == 1
+
+
+def test_invalid_feedback_is_rejected(app):
+    """Payloads without content or with bad types should get 400."""
+    client = app.test_client()
+
+    assert client.post("/api/feedback", json={}).status_code == 400
+    assert client.post("/api/feedback", json={"rating": 9}).status_code == 400
+    assert client.post("/api/feedback", json={"message": "ok", "page": ["x"]}).status_code == 400
+    assert client.post("/api/feedback", data="not json").status_code == 400
+
+
+def test_full_queue_pushes_back_instead_of_blocking():
+    """When the writer falls behind, submit should fail fast and nothing queued is lost."""
+    store = _BlockingStore()
+    ingestor = FeedbackIngestor(store, max_queue=2, batch_size=1, flush_interval=0)
+
+    ingestor.submit({"message": "first"})
+    # Wait until the writer holds the first entry inside the blocked append.
+    while ingestor.stats()["queued"]:
+        time.sleep(0.005)
+    ingestor.submit({"message": "second"})
+    ingestor.submit({"message": "third"})
+    with pytest.raises(FeedbackQueueFull) as excinfo:
+        ingestor.submit({"message": "fourth"})
+
+    store.release.set()
+    ingestor.stop()
+
+    assert excinfo.value.retry_after >= 1
+    assert store.count() == 3
+    assert ingestor.stats()["rejected"] == 1
+
+
+def test_feedback_survives_an_app_restart(monkeypatch, tmp_path):
+    """Without explicit configuration feedback should land in a file, not in memory."""
+    path = tmp_path / "instance" / "feedback.sqlite3"
+    monkeypatch.setenv("FEEDBACK_STORE_PATH", str(path))
+    first = create_app()
+    assert first.test_client().post("/api/feedback", json={"rating": 4}).status_code == 202
+    first.extensions["feedback"].stop()
+
+    assert create_app().extensions["feedback"].store.count() == 1
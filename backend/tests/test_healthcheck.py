@@ -4,16 +4,6 @@ from __future__ import annotations
 
 import pytest
 
-from app import create_app
-
-
-@pytest.fixture()
-def app():
-    """Create a Flask test instance."""
-    app = create_app()
-    app.config.update({"TESTING": True})
-    return app
-
 
 @pytest.fixture()
 def client(app):
@@ -0,0 +1,59 @@
+"""Tests for the local hospital store."""
+
+from __future__ import annotations
+
+from app.services.health_data import HealthDataService, load_hospital_fallbacks
+from app.services.hospital_store import HospitalStore
+
+
+def _node(identifier, lat, lon, name):
+    return {"type": "node", "id": identifier, "lat": lat, "lon": lon, "tags": {"name": name}}
+
+
+def test_nearest_returns_closest_hospitals_in_order():
+    """Nearest-K should rank by great-circle distance across cities."""
+    store = HospitalStore()
+    store.seed_fallbacks(load_hospital_fallbacks())
+    store.upsert_city(
+        "pune",
+        [
+            _node(10, 18.5314, 73.8446, "Sassoon Hospital"),
+            {"type": "way", "id": 11, "center": {"lat": 18.5204, "lon": 73.8567}, "tags": {"name": "Ruby Hall"}},
+        ],
+    )
+
+    nearest = store.nearest(28.6139, 77.2090, limit=2)
+
+    assert [item["tags"]["name"] for item in nearest] == ["Safdarjung Hospital", "Lok Nayak Hospital"]
+    assert nearest[0]["distance_km"] == 0.0
+    assert store.nearest(18.52, 73.85, limit=1)[0]["tags"]["name"] == "Ruby Hall"
+
+
+def test_stale_city_is_served_locally_and_refreshed_in_background(monkeypatch):
+    """Seeded fallback cities should answer instantly and schedule one refresh."""
+    store = HospitalStore()
+    store.seed_fallbacks(load_hospital_fallbacks())
+    service = HealthDataService(hospital_store=store)
+    refreshed = []
+    monkeypatch.setattr(service, "_refresh_city", refreshed.append)
+
+    first = service.get_nearby_hospitals("Delhi")
+    service.get_nearby_hospitals("delhi")
+
+    assert [item["tags"]["name"] for item in first][0] == "AIIMS Delhi"
+    assert store.get_city("delhi").is_stale(store.max_age_seconds)
+    assert service.refresh_city_in_background("Delhi") is False
+
+
+def test_coordinate_lookups_are_stored_as_areas_not_cities(monkeypatch):
+    """Hospitals fetched around a point should be findable by distance but never listed as a city."""
+    store = HospitalStore()
+    service = HealthDataService(hospital_store=store)
+    monkeypatch.setattr(service, "_query_overpass", lambda query: [_node(1, 12.9716, 77.5946, "Bowring Hospital")])
+
+    nearest = service.get_hospitals_near(12.97, 77.59)
+
+    assert nearest[0]["tags"]["name"] == "Bowring Hospital"
+    assert store.get_city("@13.0,77.6") is None
+    assert store.stats()["cities"] == 0
+    assert store.stats()["areas"] == 1
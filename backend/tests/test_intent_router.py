@@ -0,0 +1,76 @@
+"""Tests for the local intent router."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.routes import chat_with_bot
+from app.services.intent_router import DISEASE_OUTBREAK, HOSPITALS, VACCINE_SCHEDULE, IntentRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    """Train the router once for the module."""
+    return IntentRouter()
+
+
+@pytest.mark.parametrize(
+    ("message", "intent"),
+    [
+        ("Find nearby hospitals", HOSPITALS),
+        ("पास के अस्पताल दिखाओ", HOSPITALS),
+        ("What are the latest outbreak alerts?", DISEASE_OUTBREAK),
+        ("Show me the vaccine schedule", VACCINE_SCHEDULE),
+    ],
+)
+def test_trigger_phrases_dispatch_directly(router, message, intent):
+    """Known trigger phrases in English and Hindi should be routed with full confidence."""
+    decision = router.route(message)
+
+    assert decision.intent == intent
+    assert decision.method == "phrase"
+
+
+@pytest.mark.parametrize("message", ["What are the symptoms of dengue?", "Share preventive health tips", "mujhe bukhar hai"])
+def test_general_health_questions_fall_back_to_the_llm(router, message):
+    """Ordinary health questions must still be answered by Gemini."""
+    assert router.route(message).intent is None
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "how to avoid dengue cases at home",
+        "how can I prevent malaria outbreak at home",
+        "tell me about baby vaccines side effects",
+        "how many live cases of malaria are in bihar",
+    ],
+)
+def test_trigger_phrases_inside_other_questions_are_not_trusted(router, message):
+    """A trigger phrase inside a prevention or general question must not take the message away from Gemini."""
+    decision = router.route(message)
+
+    assert decision.intent is None
+    assert decision.method == "model"
+
+
+def test_trigger_phrase_with_extra_words_is_left_to_the_model(router):
+    """Extra words beyond request filler send the message through the model and its threshold."""
+    decision = router.route("any dengue cases in pune")
+
+    assert decision.method == "model"
+    assert decision.intent == DISEASE_OUTBREAK
+    assert decision.confidence >= router.threshold
+
+
+def test_routed_messages_skip_the_llm(router):
+    """A routed tool request should never reach the LLM client."""
+
+    class _NoLLM:
+        def get_response(self, prompt, system_prompt=None):
+            raise AssertionError("LLM should not be called")
+
+    result = chat_with_bot("Find nearby hospitals", "en", None, None, _NoLLM(), intent_router=router)
+
+    assert result["metadata"]["context"] == "awaiting_city_for_hospitals"
+    assert router.stats()["hits"][HOSPITALS] >= 1
@@ -0,0 +1,34 @@
+"""Tests for script-based language detection."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.utils import language
+from app.utils.language import detect_language, detect_language_with_confidence
+
+
+@pytest.mark.parametrize(
+    ("text", "expected", "method"),
+    [
+        ("डेंगू के लक्षण क्या हैं?", "hi", "script"),
+        ("COVID के आज के मामले", "hi", "script"),
+        ("mujhe bukhar hai", "hi", "romanized"),
+        ("bacche ko teeka kab lagwana chahiye", "hi", "romanized"),
+        ("What should I eat during fever?", "en", "lexicon"),
+    ],
+)
+def test_clear_messages_skip_langdetect(monkeypatch, text, expected, method):
+    """Script ratio and the romanized lexicon should decide without langdetect."""
+    monkeypatch.setattr(language, "_langdetect_guess", lambda text: pytest.fail("langdetect should not run"))
+
+    guess = detect_language_with_confidence(text)
+
+    assert (guess.language, guess.method) == (expected, method)
+    assert 0.5 <= guess.confidence <= 1.0
+
+
+def test_ambiguous_messages_fall_back_to_langdetect():
+    """Messages without known words are left to langdetect and default to English."""
+    assert detect_language_with_confidence("Paracetamol").method in ("langdetect", "default")
+    assert detect_language("12345") == "en"
@@ -0,0 +1,68 @@
+"""Tests for the Gemini client wrapper."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import llm
+from app.services.admission import AdmissionController, AdmissionRejected
+from app.services.llm import NIROGI_SYSTEM_PROMPT, GeminiClient
+
+
+class _FakeModel:
+    def __init__(self, model_name, system_instruction=None):
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.prompts = []
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return SimpleNamespace(text="ok")
+
+
+def test_model_handle_is_built_once_and_reused(monkeypatch):
+    """Repeated calls should reuse one handle carrying the system instruction."""
+    built = []
+
+    def _build(model_name, system_instruction=None):
+        model = _FakeModel(model_name, system_instruction)
+        built.append(model)
+        return model
+
+    configure_calls = []
+    fake_genai = SimpleNamespace(configure=lambda api_key: configure_calls.append(api_key), GenerativeModel=_build)
+    monkeypatch.setattr(llm, "genai", fake_genai)
+
+    client = GeminiClient("test-key", "gemini-test")
+    client.get_response("What is ORS?")
+    client.get_response("How do I prevent dengue?")
+
+    assert len(built) == 1
+    assert configure_calls == ["test-key"]
+    assert built[0].system_instruction == NIROGI_SYSTEM_PROMPT.strip()
+    assert built[0].prompts == ["What is ORS?", "How do I prevent dengue?"]
+
+
+def test_streaming_releases_the_admission_slot_before_the_reader_finishes(monkeypatch):
+    """A slow consumer must not keep a Gemini slot once the upstream stream has ended."""
+    monkeypatch.setattr(llm, "stream_response", lambda message, **kwargs: iter(["Drink ", "ORS."]))
+    admission = AdmissionController(max_in_flight=1, max_wait_seconds=2)
+    client = GeminiClient("test-key", "gemini-test", admission=admission)
+
+    chunks = client.stream_response("What is ORS?")
+    assert next(chunks) == "Drink "
+    with admission.slot():
+        pass
+    assert list(chunks) == ["ORS."]
+
+
+def test_streaming_surfaces_admission_rejections(monkeypatch):
+    """Errors raised on the reader thread should reach the caller."""
+    monkeypatch.setattr(llm, "stream_response", lambda message, **kwargs: iter(["unused"]))
+    admission = AdmissionController(max_in_flight=1, max_queue=0)
+    client = GeminiClient("test-key", "gemini-test", admission=admission)
+
+    with admission.slot(), pytest.raises(AdmissionRejected):
+        list(client.stream_response("What is ORS?"))
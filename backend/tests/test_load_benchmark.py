@@ -0,0 +1,52 @@
+"""Tests for the offline load benchmark and its upstream fakes."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.fakes import parse_profiles
+from benchmarks.load import SCENARIOS, compare, compare_pipeline_modes, run_suite
+
+_NO_LATENCY = "gemini=0,translate=0,overpass=0,disease=0"
+
+
+def _scenarios(*names):
+    return [scenario for scenario in SCENARIOS if scenario.name in names]
+
+
+def test_suite_reports_percentiles_per_level_without_network():
+    """Every scenario and level should report throughput and latency percentiles."""
+    report = run_suite([1, 4], 8, scenarios=_scenarios("chat_hi", "tool_covid", "tool_hospitals"), latency_spec=_NO_LATENCY)
+
+    for name in ("chat_hi", "tool_covid", "tool_hospitals"):
+        for level in ("1", "4"):
+            result = report["scenarios"][name][level]
+            assert result["errors"] == 0
+            assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+    assert report["fakes"]["disease"]["calls"] >= 1
+    assert report["fakes"]["overpass"]["calls"] >= 1
+    assert compare(report, report)["chat_hi"]["1"]["throughput_ratio"] == 1.0
+
+
+def test_injected_gemini_failures_surface_as_errors():
+    """A Gemini error rate of 1 should fail every uncached chat request."""
+    report = run_suite([2], 6, scenarios=_scenarios("chat_en"), latency_spec=_NO_LATENCY, error_spec="gemini=1")
+
+    assert report["scenarios"]["chat_en"]["2"]["errors"] == 6
+
+
+def test_profiles_reject_unknown_fakes():
+    """Typos in the fake specs should fail loudly rather than be ignored."""
+    with pytest.raises(ValueError, match="gemeni"):
+        parse_profiles("gemeni=10", None)
+
+
+def test_pipeline_modes_are_reported_side_by_side():
+    """The native Hindi pipeline should skip both translation round trips."""
+    report = compare_pipeline_modes([2], 4, latency_spec="gemini=0,translate=40,overpass=0,disease=0", unique=True)
+
+    result = report["scenarios"]["chat_hi"]["2"]
+    assert result["translate"]["errors"] == result["native"]["errors"] == 0
+    assert result["native"]["p95_ms"] < result["translate"]["p50_ms"]
+    assert report["upstream_calls"]["native"]["translate"] == 0
+    assert report["upstream_calls"]["translate"]["translate"] > 0
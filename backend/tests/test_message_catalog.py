@@ -0,0 +1,89 @@
+"""Tests for the compiled message catalog and its frontend bundles."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.routes import chat_with_bot
+from app.services.intent_router import HOSPITALS
+from app.services.llm import GeminiResponse
+from app.services.message_catalog import CATALOG_PATH, MessageCatalog, MessageCatalogError, get_catalog
+
+
+class _FailingTranslation:
+    def translate(self, text, target_language, source_language=None):
+        raise AssertionError("canned replies must not be translated")
+
+
+class _SentinelLLM:
+    provider_name = "fake"
+
+    def get_response(self, prompt, system_prompt=None, priority=None):
+        return GeminiResponse(text=HOSPITALS, metadata={"provider": "fake"})
+
+
+def test_render_interpolates_and_falls_back_to_english():
+    catalog = MessageCatalog(
+        {
+            "en": {"greet": "Hello {name}, {{literal}}", "bye": "Bye"},
+            "hi": {"greet": "नमस्ते {name}"},
+        }
+    )
+
+    assert catalog.render("greet", "en", name="Asha") == "Hello Asha, {literal}"
+    assert catalog.render("greet", "hi", name="Asha") == "नमस्ते Asha"
+    assert catalog.render("bye", "hi") == "Bye"
+    assert catalog.render("bye", "ta") == "Bye"
+    assert json.loads(catalog.bundle("hi").body)["messages"]["bye"] == "Bye"
+
+
+def test_mismatched_placeholders_are_rejected():
+    with pytest.raises(MessageCatalogError):
+        MessageCatalog({"en": {"found": "No results in {city}"}, "hi": {"found": "{town} में कुछ नहीं"}})
+    with pytest.raises(MessageCatalogError):
+        MessageCatalog({"en": {"count": "{total:d} results"}})
+
+
+def test_bundled_catalog_defines_every_message_in_each_language():
+    with open(CATALOG_PATH, encoding="utf-8") as handle:
+        messages = json.load(handle)
+    for language, entries in messages.items():
+        assert set(entries) == set(messages["en"]), language
+
+
+def test_canned_reply_is_served_in_hindi_without_translation():
+    result = chat_with_bot(
+        message="अस्पताल",
+        language="hi",
+        translation_service=_FailingTranslation(),
+        health_service=None,
+        llm_service=_SentinelLLM(),
+        pipeline_modes={"hi": "native"},
+    )
+
+    assert result["message"] == get_catalog().render("chat.hospitals.ask_city", "hi")
+    assert result["metadata"]["message_id"] == "chat.hospitals.ask_city"
+    assert result["metadata"]["reply_language"] == "hi"
+
+
+def test_bundle_endpoint_is_versioned_and_cacheable(app):
+    client = app.test_client()
+    manifest = client.get("/api/messages").get_json()
+    version = manifest["version"]
+    assert manifest["bundles"]["hi"] == f"/api/messages/hi?v={version}"
+
+    response = client.get(manifest["bundles"]["hi"])
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.get_json()["messages"]["chat.hospitals.ask_city"] == get_catalog().render(
+        "chat.hospitals.ask_city", "hi"
+    )
+
+    stale = client.get("/api/messages/hi?v=outdated")
+    assert stale.headers["Cache-Control"] == "no-cache"
+
+    revalidated = client.get("/api/messages/hi", headers={"If-None-Match": response.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert client.get("/api/messages/xx").status_code == 404
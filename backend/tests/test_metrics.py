@@ -0,0 +1,53 @@
+"""Tests for latency histograms, counters and the Prometheus endpoint."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.utils.metrics import ERRORS, Histogram, collect_timings, stage_span
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Bucket counts should be cumulative and end with a ``+Inf`` bucket equal to the count."""
+    histogram = Histogram("demo_seconds", "Demo.", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5.0, "a")
+
+    lines = histogram.render()
+
+    assert 'demo_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{stage="a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{stage="a"} 3' in lines
+
+
+def test_span_records_errors_and_request_breakdown():
+    """A failing span should count the exception and still report its duration."""
+    before = ERRORS.value("stage", "test_failure", "RuntimeError")
+
+    with collect_timings() as timings:
+        with pytest.raises(RuntimeError):
+            with stage_span("test_failure"):
+                raise RuntimeError("boom")
+
+    assert ERRORS.value("stage", "test_failure", "RuntimeError") == before + 1
+    assert "test_failure" in timings
+
+
+def test_chat_timings_and_metrics_endpoint(app):
+    """Opted-in chats should return a breakdown, and the stages should appear in ``/api/metrics``."""
+    client = app.test_client()
+
+    payload = client.post(
+        "/api/chat", json={"message": "show me the vaccine schedule", "language": "en", "timings": True}
+    ).get_json()
+    plain = client.post("/api/chat", json={"message": "show me the vaccine schedule", "language": "en"}).get_json()
+    response = client.get("/api/metrics")
+    body = response.get_data(as_text=True)
+
+    assert {"chat", "intent_router", "health_fetch", "tool:fetch_vaccine_schedule"} <= set(payload["metadata"]["timings_ms"])
+    assert "timings_ms" not in plain["metadata"]
+    assert response.mimetype == "text/plain"
+    assert 'nirogi_tool_seconds_count{tool="fetch_vaccine_schedule"}' in body
+    assert "# TYPE nirogi_stage_seconds histogram" in body
@@ -0,0 +1,114 @@
+"""Tests for the per-language translate/native chat pipelines."""
+
+from __future__ import annotations
+
+from app.routes import chat_with_bot
+from app.services.answer_cache import AnswerCache
+from app.services.intent_router import HOSPITALS
+from app.services.llm import NATIVE, GeminiResponse, parse_pipeline_modes
+from app.services.renderers import parse_render_modes
+from app.services.translation import TranslationResult
+
+_NATIVE_HINDI = {"hi": NATIVE}
+
+
+class _FakeTranslation:
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, text, target_language, source_language=None):
+        self.calls.append((text, target_language))
+        return TranslationResult(text=f"[{target_language}] {text}", detected_language="hi", target_language=target_language)
+
+
+class _FakeLLM:
+    provider_name = "fake"
+
+    def __init__(self, reply="नमस्ते"):
+        self.reply = reply
+        self.calls = []
+
+    def get_response(self, prompt, system_prompt=None, priority=None):
+        self.calls.append((prompt, system_prompt))
+        return GeminiResponse(text=self.reply, metadata={"provider": "fake"})
+
+
+class _FakeHealth:
+    def __init__(self):
+        self.cities = []
+
+    def get_nearby_hospitals(self, city):
+        self.cities.append(city)
+        return [{"tags": {"name": "City Hospital"}}]
+
+
+def _chat(message, translation, llm, health=None, **kwargs):
+    return chat_with_bot(
+        message=message,
+        language="hi",
+        translation_service=translation,
+        health_service=health or _FakeHealth(),
+        llm_service=llm,
+        pipeline_modes=_NATIVE_HINDI,
+        **kwargs,
+    )
+
+
+def test_native_mode_sends_hindi_to_gemini_without_translation():
+    """Gemini should see the original Hindi with a Hindi instruction, and its answer is returned as is."""
+    translation, llm = _FakeTranslation(), _FakeLLM()
+
+    result = _chat("बुखार में क्या खाना चाहिए?", translation, llm)
+
+    assert translation.calls == []
+    assert llm.calls[0][0] == "बुखार में क्या खाना चाहिए?"
+    assert "answer in Hindi" in llm.calls[0][1]
+    assert result["message"] == "नमस्ते"
+    assert result["metadata"]["pipeline"] == NATIVE
+    assert result["metadata"]["reply_language"] == "hi"
+
+
+def test_native_mode_still_translates_tool_arguments():
+    """City names must reach the hospital lookup in English; fixed prompts come from the catalog."""
+    translation, llm, health = _FakeTranslation(), _FakeLLM(reply=HOSPITALS), _FakeHealth()
+
+    question = _chat("मेरे पास अस्पताल", translation, llm)
+    assert question["metadata"]["context"] == "awaiting_city_for_hospitals"
+    assert question["metadata"]["message_id"] == "chat.hospitals.ask_city"
+    assert translation.calls == []
+
+    llm.reply = "अस्पतालों की सूची"
+    follow_up = _chat(
+        "पुणे",
+        translation,
+        llm,
+        health=health,
+        context="awaiting_city_for_hospitals",
+        render_modes=parse_render_modes("hospitals=llm"),
+    )
+
+    assert health.cities == ["[en] पुणे"]
+    assert translation.calls == [("पुणे", "en")]
+    assert "answer in Hindi" in llm.calls[-1][1]
+    assert follow_up["message"] == "अस्पतालों की सूची"
+
+
+def test_unknown_pipeline_modes_are_ignored():
+    """Typos should fall back to the translate pipeline rather than break chats."""
+    assert parse_pipeline_modes("hi=native, ta=nativ") == {"hi": NATIVE}
+
+
+def test_native_answers_are_not_shared_with_other_languages():
+    """A Hindi answer cached in native mode must not be served to an English chat for the same prompt."""
+    cache, translation = AnswerCache(), _FakeTranslation()
+    hindi_llm, english_llm = _FakeLLM(reply="डेंगू एक वायरल बुखार है।"), _FakeLLM(reply="Dengue is a viral fever.")
+
+    hindi = _chat("what is dengue", translation, hindi_llm, answer_cache=cache)
+    english = chat_with_bot("what is dengue", "en", translation, _FakeHealth(), english_llm, answer_cache=cache)
+    hindi_again = _chat("what is dengue", translation, hindi_llm, answer_cache=cache)
+
+    assert hindi["message"] == "डेंगू एक वायरल बुखार है।"
+    assert english["message"] == "Dengue is a viral fever."
+    assert len(english_llm.calls) == 1
+    assert hindi_again["message"] == hindi["message"]
+    assert hindi_again["metadata"]["llm"]["cache"] == "hit"
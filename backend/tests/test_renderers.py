@@ -0,0 +1,67 @@
+"""Tests for the deterministic tool renderers."""
+
+from __future__ import annotations
+
+from app.routes import chat_with_bot
+from app.services.health_data import get_local_outbreak_alert, get_vaccine_schedule
+from app.services.message_catalog import get_catalog
+from app.services.renderers import LLM, TEMPLATE, parse_render_modes, render_hospitals, render_vaccine_schedule
+
+
+def test_vaccine_schedule_is_grouped_by_age_in_hindi():
+    """Hindi rendering should localize age labels and keep vaccine names intact."""
+    text = render_vaccine_schedule(get_vaccine_schedule(), language="hi")
+
+    assert "**जन्म के समय**" in text
+    assert "**6 सप्ताह पर**" in text
+    assert "- BCG" in text
+
+
+def test_hospitals_render_top_named_results():
+    """Only the first ``limit`` named facilities should be listed with addresses."""
+    hospitals = [
+        {"tags": {"amenity": "clinic"}},
+        {"tags": {"name": "AIIMS Delhi", "addr:full": "Ansari Nagar, New Delhi"}},
+        {"tags": {"name": "Safdarjung Hospital", "addr:street": "Ring Road", "addr:city": "New Delhi"}},
+    ]
+
+    text = render_hospitals(hospitals, "delhi", limit=2)
+
+    assert "- **AIIMS Delhi** — Ansari Nagar, New Delhi" in text
+    assert "- **Safdarjung Hospital** — Ring Road, New Delhi" in text
+    assert text.endswith("Source: OpenStreetMap API")
+
+
+def test_render_modes_parse_overrides():
+    """Unknown tools or modes should be ignored while known overrides apply."""
+    modes = parse_render_modes("hospitals=llm, covid=template, vaccine_schedule=bogus")
+
+    assert modes == {"vaccine_schedule": TEMPLATE, "hospitals": LLM, "disease_outbreak": TEMPLATE}
+
+
+def test_alert_follow_up_is_rendered_without_the_llm():
+    """Template mode should answer disease follow-ups without a second LLM call."""
+
+    class _Health:
+        def get_local_outbreak_alert(self, disease_name):
+            return get_local_outbreak_alert(disease_name)
+
+    class _NoLLM:
+        def get_response(self, prompt, system_prompt=None):
+            raise AssertionError("LLM should not be called")
+
+    result = chat_with_bot("Dengue", "en", None, _Health(), _NoLLM(), context="awaiting_disease_for_alert")
+
+    assert result["message"].startswith("**Dengue alert for Delhi**")
+    assert result["metadata"]["renderer"] == TEMPLATE
+
+
+def test_template_labels_come_from_the_message_catalog():
+    """Renderer labels are catalog messages, so translators edit one file for every bot string."""
+    catalog = get_catalog()
+
+    text = render_hospitals([{"tags": {"name": "AIIMS Delhi"}}], "delhi", language="hi")
+
+    assert text.startswith(catalog.render("render.hospitals.title", "hi", city="Delhi"))
+    assert f"— {catalog.render('render.hospitals.no_address', 'hi')}" in text
+    assert text.endswith(catalog.render("render.hospitals.source", "hi"))
@@ -0,0 +1,62 @@
+"""Tests for the server-side conversation store."""
+
+from __future__ import annotations
+
+
+from app.services.compaction import estimate_tokens
+from app.services.intent_router import HOSPITALS
+from app.services.sessions import SessionStore
+from app.utils.cache import LRUCache, TieredCache
+
+
+def _store(**kwargs):
+    return SessionStore(TieredCache(LRUCache(max_entries=16, ttl_seconds=60)), **kwargs)
+
+
+def test_history_stays_within_budget_however_long_the_conversation():
+    """Old turns should be folded into the summary and the summary itself capped."""
+    store = _store(token_budget=120, max_turns=2, summary_token_budget=60)
+    conversation = store.open(None)
+
+    for index in range(50):
+        conversation = store.open(conversation.session_id)
+        conversation.record(f"question number {index} about fever " * 3, "answer " * 40, None)
+
+    state = store.open(conversation.session_id).state
+    assert len(state.turns) <= 4
+    assert sum(estimate_tokens(text) for _, text in state.turns) <= 120
+    assert sum(estimate_tokens(line) for line in state.summary) <= 60
+    prompt = store.open(conversation.session_id).prompt_for("and for children?")
+    assert "question number 49" in prompt
+    assert prompt.endswith("Current message: and for children?")
+
+
+def test_unknown_session_ids_are_replaced():
+    """Clients must not be able to adopt a session id the server never issued."""
+    store = _store()
+
+    conversation = store.open("attacker-chosen-session-id")
+
+    assert conversation.session_id != "attacker-chosen-session-id"
+    assert not conversation.has_history
+
+
+def test_chat_keeps_tool_context_in_the_session(app):
+    """The hospital follow-up should work with only the session id echoed back."""
+    client = app.test_client()
+
+    first = client.post("/api/chat", json={"message": "find nearby hospitals", "language": "en"}).get_json()
+    store = app.extensions["session_store"]
+
+    assert first["metadata"]["router"]["intent"] == HOSPITALS
+    assert first["metadata"]["context"] == "awaiting_city_for_hospitals"
+    assert store.open(first["session_id"]).context == "awaiting_city_for_hospitals"
+
+    follow_up = client.post(
+        "/api/chat", json={"message": "Delhi", "language": "en", "session_id": first["session_id"]}
+    ).get_json()
+
+    assert follow_up["session_id"] == first["session_id"]
+    assert follow_up["metadata"]["supplemental_data"]["hospitals"]
+    assert store.open(first["session_id"]).context is None
+    assert [role for role, _ in store.open(first["session_id"]).state.turns] == ["user", "assistant"] * 2
@@ -0,0 +1,90 @@
+"""Tests for single-flight coalescing of identical upstream calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.health_data import HealthDataService
+from app.utils.singleflight import SingleFlight
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for collapsed callers"
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    """Callers arriving while a fetch is running should reuse its result."""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        started.set()
+        release.wait(timeout=2)
+        return {"states": 36}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(flights.do, "covid", fetch)
+        started.wait(timeout=2)
+        followers = [executor.submit(flights.do, "covid", fetch) for _ in range(4)]
+        _wait_for(lambda: flights.stats()["collapsed"] == 4)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert executions == [1]
+    assert all(result is results[0] for result in results)
+    assert flights.stats() == {"executions": 1, "collapsed": 4, "in_flight": 0}
+    assert flights.do("covid", lambda: "fresh") == "fresh"
+
+
+def test_waiters_receive_the_same_error():
+    """A failed upstream call should fail every collapsed caller."""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(timeout=2)
+        raise RuntimeError("overpass timeout")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, "pune", fetch)
+        started.wait(timeout=2)
+        follower = executor.submit(flights.do, "pune", fetch)
+        _wait_for(lambda: flights.stats()["collapsed"] == 1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="overpass timeout"):
+                future.result()
+
+
+def test_overpass_queries_for_one_city_are_coalesced(monkeypatch):
+    """A surge of lookups for the same city should send one Overpass request."""
+    service = HealthDataService()
+    release = threading.Event()
+    posts = []
+
+    def fake_post(query_string, timeout):
+        posts.append(query_string)
+        release.wait(timeout=2)
+        return [{"type": "node", "id": 1, "tags": {"name": "City Hospital"}}]
+
+    monkeypatch.setattr(service, "_post_overpass", fake_post)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(service.get_nearby_hospitals, "Nagpur") for _ in range(8)]
+        _wait_for(lambda: service.coalescing_stats()["collapsed"] == 7)
+        release.set()
+        names = {future.result()[0]["tags"]["name"] for future in futures}
+
+    assert names == {"City Hospital"}
+    assert len(posts) == 1
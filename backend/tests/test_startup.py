@@ -0,0 +1,32 @@
+"""Tests for lazy provider imports and the optional warm-up phase."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from app import create_app
+from app.warmup import warm_up
+
+
+def test_importing_app_does_not_load_provider_sdks():
+    """Gemini, googletrans and langdetect should load on first use, not at import."""
+    script = (
+        "import sys, app; "
+        "print(','.join(name for name in ('google.generativeai', 'googletrans', 'langdetect') if name in sys.modules))"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert completed.stdout.strip() == ""
+
+
+def test_warm_up_records_each_step():
+    """Warm-up should preload every step and report its duration."""
+    app = create_app(warm_up=False)
+    assert app.test_client().get("/api/healthcheck").get_json()["warm_up"] == "off"
+
+    state = warm_up(app)
+
+    assert state["status"] == "done"
+    assert set(state["steps"]) == {"datasets", "translator", "gemini", "langdetect"}
+    assert all("ms" in step for step in state["steps"].values())
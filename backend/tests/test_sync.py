@@ -0,0 +1,73 @@
+"""Tests for the background dataset sync scheduler."""
+
+from __future__ import annotations
+
+import threading
+
+from app import create_app, start_background_tasks, stop_background_tasks
+from app.services.sync import SyncScheduler, parse_sync_intervals
+
+
+def test_stale_dataset_is_served_while_refreshing():
+    """A stale read should return the cached value and reload it off the request path."""
+    calls = []
+    release = threading.Event()
+    refreshed = threading.Event()
+
+    def loader():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            release.wait(timeout=2)
+            refreshed.set()
+        return len(calls)
+
+    scheduler = SyncScheduler()
+    scheduler.register("stats", loader, interval_seconds=0)
+
+    assert scheduler.get("stats") == 1
+    assert scheduler.get("stats") == 1
+    release.set()
+    assert refreshed.wait(timeout=2)
+    assert len(calls) == 2
+    assert scheduler.status()["stats"]["age_seconds"] is not None
+
+
+def test_failed_refresh_keeps_previous_value():
+    """Upstream errors should be recorded without dropping the last good copy."""
+    results = iter([{"cases": 5}, RuntimeError("upstream down")])
+
+    def loader():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    scheduler = SyncScheduler()
+    scheduler.register("stats", loader, interval_seconds=3600)
+
+    assert scheduler.get("stats") == {"cases": 5}
+    assert scheduler.refresh("stats") is False
+    assert scheduler.get("stats") == {"cases": 5}
+    assert scheduler.status()["stats"]["last_error"] == "upstream down"
+
+
+def test_parse_sync_intervals():
+    """Intervals accept an optional jitter and ignore malformed entries."""
+    assert parse_sync_intervals("covid_india=60:5, outbreak_alerts=30,bad=x") == {
+        "covid_india": (60.0, 5.0),
+        "outbreak_alerts": (30.0, 0.0),
+    }
+
+
+def test_refresh_loop_runs_only_when_started(monkeypatch):
+    """Creating an app must not spawn the refresh thread; the entry point starts and stops it."""
+    monkeypatch.setenv("SYNC_ENABLED", "1")
+    app = create_app()
+    scheduler = app.extensions["sync_scheduler"]
+    assert scheduler._thread is None
+
+    monkeypatch.setattr(scheduler, "_run", lambda: None)
+    start_background_tasks(app)
+    assert scheduler._thread is not None
+    stop_background_tasks(app)
+    assert scheduler._thread is None
@@ -0,0 +1,111 @@
+"""Tests for the translation cache tiers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from app.services import translation
+from app.services.translation import TranslationService
+from app.utils.cache import LRUCache, SQLiteCache, TieredCache
+
+
+class _CountingTranslator:
+    """Stand-in for googletrans that records every upstream call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def translate(self, text, dest, src=None):
+        self.calls += 1
+        return SimpleNamespace(text=f"{dest}:{text}", src=src or "en")
+
+
+def test_repeated_translations_hit_the_memory_cache(monkeypatch):
+    """Whitespace variants of the same prompt should share one upstream call."""
+    fake = _CountingTranslator()
+    monkeypatch.setattr(translation, "_translator", fake)
+    service = TranslationService("google_translate", cache=TieredCache(LRUCache(max_entries=8)))
+
+    first = service.translate("Find nearby hospitals", target_language="hi")
+    second = service.translate("  Find   nearby hospitals ", target_language="hi")
+
+    assert fake.calls == 1
+    assert first.text == second.text
+    assert service.cache_stats()["memory"]["hits"] == 1
+
+
+def test_lru_cache_evicts_and_expires():
+    """The LRU tier should honour both its size and TTL limits."""
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.set("d", 4, ttl_seconds=-1)
+
+    assert cache.get("a") is None
+    assert cache.get("d") is None
+    stats = cache.stats()
+    assert stats.evictions == 2
+    assert stats.expirations == 1
+
+
+def test_sqlite_tier_survives_a_new_memory_tier(tmp_path):
+    """Entries written through should be readable after a simulated restart."""
+    path = str(tmp_path / "cache.sqlite3")
+    TieredCache(LRUCache(), SQLiteCache(path, namespace="translations")).set("key", {"text": "नमस्ते"})
+
+    restarted = TieredCache(LRUCache(), SQLiteCache(path, namespace="translations"))
+
+    assert restarted.get("key") == {"text": "नमस्ते"}
+    assert restarted.memory.get("key") == {"text": "नमस्ते"}
+
+
+def test_translate_many_dedupes_and_preserves_order(monkeypatch):
+    """Batch translation should send each distinct string upstream exactly once."""
+    sent = []
+
+    class _BatchTranslator:
+        def translate(self, texts, dest, src=None):
+            sent.extend(texts)
+            return [SimpleNamespace(text=f"{dest}:{text}", src="en") for text in texts]
+
+    monkeypatch.setattr(translation, "_translator", _BatchTranslator())
+    service = TranslationService("google_translate", cache=TieredCache(LRUCache()), batch_size=2, max_concurrency=2)
+
+    results = service.translate_many(["Home", "About", "Home ", "Chat", ""], target_language="hi")
+
+    assert [result.text for result in results] == ["hi:Home", "hi:About", "hi:Home", "hi:Chat", ""]
+    assert sorted(sent) == ["About", "Chat", "Home"]
+
+
+def test_translate_many_sends_original_text_and_joins_in_flight_calls(monkeypatch):
+    """Batches should keep newlines and spacing, and reuse a translation already in flight."""
+    sent = []
+    release = threading.Event()
+
+    class _SlowTranslator:
+        def translate(self, texts, dest, src=None):
+            if isinstance(texts, str):
+                release.wait(5)
+                sent.append(texts)
+                return SimpleNamespace(text=f"{dest}:{texts}", src="en")
+            sent.extend(texts)
+            return [SimpleNamespace(text=f"{dest}:{text}", src="en") for text in texts]
+
+    monkeypatch.setattr(translation, "_translator", _SlowTranslator())
+    service = TranslationService("google_translate", cache=TieredCache(LRUCache()))
+
+    single = threading.Thread(target=service.translate, args=("Home", "hi"))
+    single.start()
+    while service.coalescing_stats()["in_flight"] < 1:
+        time.sleep(0.005)
+    releaser = threading.Timer(0.05, release.set)
+    releaser.start()
+    results = service.translate_many(["Home", "Step 1\n  Step 2"], target_language="hi")
+    single.join(5)
+
+    assert [result.text for result in results] == ["hi:Home", "hi:Step 1\n  Step 2"]
+    assert sorted(sent) == ["Home", "Step 1\n  Step 2"]
+    assert service.coalescing_stats()["collapsed"] == 1
@@ -0,0 +1,107 @@
+"""Tests for the pooled upstream client against a local stub server."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app.services.health_data import HealthDataService
+from app.services.upstream import OPEN, CircuitOpenError, UpstreamClient
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    status = 200
+    hits = 0
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        type(self).hits += 1
+        body = json.dumps({"states": [{"state": "Kerala", "active": 42}]}).encode("utf-8")
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+@pytest.fixture()
+def stub_server():
+    handler = type("Handler", (_StubHandler,), {"status": 200, "hits": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, handler
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_pooled_connection(stub_server):
+    """Repeated calls to one host should share a single keep-alive connection."""
+    server, handler = stub_server
+    client = UpstreamClient(host_overrides={"disease.sh": f"http://127.0.0.1:{server.server_port}"})
+    service = HealthDataService(upstream=client)
+
+    for _ in range(3):
+        assert service.get_statewise_covid_data()[0]["state"] == "Kerala"
+
+    pool = client.stats()["pools"]["disease.sh"]
+    assert handler.hits == 3
+    assert pool["requests"] == 3
+    assert pool["connections_opened"] == 1
+
+
+def test_breaker_opens_and_skips_upstream(stub_server):
+    """Once the failure threshold is reached calls fail fast without hitting the host."""
+    server, handler = stub_server
+    handler.status = 500
+    client = UpstreamClient(
+        max_retries=0,
+        failure_threshold=2,
+        reset_timeout=60,
+        host_overrides={"disease.sh": f"http://127.0.0.1:{server.server_port}"},
+    )
+    url = "https://disease.sh/v3/covid-19/gov/India"
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get(url, timeout=2)
+    with pytest.raises(CircuitOpenError):
+        client.get(url, timeout=2)
+
+    assert handler.hits == 2
+    assert client.stats()["breakers"]["disease.sh/v3/covid-19/gov/India"]["state"] == OPEN
+
+
+def test_unexpected_error_in_half_open_trial_reopens_the_breaker(stub_server, monkeypatch):
+    """A trial call failing with a non-requests exception must not leave the endpoint blocked for good."""
+    server, handler = stub_server
+    client = UpstreamClient(
+        max_retries=0,
+        failure_threshold=1,
+        reset_timeout=0,
+        host_overrides={"disease.sh": f"http://127.0.0.1:{server.server_port}"},
+    )
+    url = "https://disease.sh/v3/covid-19/gov/India"
+    handler.status = 500
+    with pytest.raises(requests.HTTPError):
+        client.get(url, timeout=2)
+
+    def _undecodable(*args, **kwargs):
+        raise ValueError("bad payload")
+
+    session = client._session("disease.sh")
+    original = session.request
+    monkeypatch.setattr(session, "request", _undecodable)
+    with pytest.raises(ValueError):
+        client.get(url, timeout=2)
+
+    monkeypatch.setattr(session, "request", original)
+    handler.status = 200
+    assert client.get(url, timeout=2).status_code == 200
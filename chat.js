@@ -7,10 +7,12 @@ document.addEventListener("DOMContentLoaded", () => {
     const sendButton = document.getElementById("send-button");
 
     const API_URL = "http://127.0.0.1:5000/api/chat";
+    const STREAM_URL = `${API_URL}/stream`;
 
     // This is the "Context Awareness" (Checklist VI)
-    // It remembers what the bot just asked the user.
-    let chatContext = null;
+    // The server keeps the conversation (and what the bot just asked) under this id.
+    const SESSION_KEY = "nirogi-session-id";
+    let sessionId = sessionStorage.getItem(SESSION_KEY);
 
     // Handle form submission
     chatForm.addEventListener("submit", (event) => {
@@ -42,45 +44,160 @@ document.addEventListener("DOMContentLoaded", () => {
 
         showTypingIndicator();
 
+        const payload = {
+            message: message,
+            language: language,
+            session_id: sessionId // Lets the server continue the conversation
+        };
+
+        let retryAfter = 0;
         try {
-            // This fetch is now sending the context
-            const response = await fetch(API_URL, {
-                method: "POST",
-                headers: { "Content-Type": "application/json" },
-                body: JSON.stringify({
-                    message: message,
-                    language: language,
-                    context: chatContext // Send the current context
-                }),
+            const data = await streamReply(payload).catch((error) => {
+                // Re-post to /api/chat only when the stream could not be opened at all;
+                // once the server has answered (even with an error) the turn has run.
+                if (!error.transport) throw error;
+                console.warn("Streaming unavailable, falling back:", error);
+                return fetchReply(payload);
             });
 
-            if (!response.ok) {
-                throw new Error("Network response was not ok.");
+            // CRITICAL: Keep the session id for the *next* message
+            if (data.session_id) {
+                sessionId = data.session_id;
+                sessionStorage.setItem(SESSION_KEY, sessionId);
             }
 
-            const data = await response.json();
-
+        } catch (error) {
+            console.error("Error:", error);
             hideTypingIndicator();
-            addMessageToChat(data.message, "bot-message");
-
-            // CRITICAL: Update the context for the *next* message
-            if (data.metadata && data.metadata.context) {
-                chatContext = data.metadata.context;
+            if (error.serverMessage) {
+                // The server is shedding load or the turn failed upstream: say so, and wait
+                // out any Retry-After before letting the user send again.
+                retryAfter = error.retryAfter || 0;
+                const wait = retryAfter ? ` Please try again in ${Math.ceil(retryAfter)} seconds.` : "";
+                addMessageToChat(`${error.serverMessage}${wait}`, "bot-message");
             } else {
-                // If no context is returned, clear it.
-                chatContext = null;
+                addMessageToChat("Sorry, I'm having trouble connecting. Please try again.", "bot-message");
             }
+        } finally {
+            if (retryAfter) {
+                setTimeout(() => {
+                    sendButton.disabled = false;
+                }, retryAfter * 1000);
+            } else {
+                sendButton.disabled = false;
+            }
+            messageInput.focus();
+        }
+    }
+
+    // Errors the server reported itself (an SSE "error" event or a 429) rather than transport failures.
+    function serverError(message, retryAfter) {
+        const error = new Error(message);
+        error.serverMessage = message;
+        error.retryAfter = Number(retryAfter) || 0;
+        return error;
+    }
+
+    function transportError(message) {
+        const error = new Error(message);
+        error.transport = true;
+        return error;
+    }
 
+    // Read the Server-Sent Events stream and render tokens as they arrive.
+    // Resolves with the final "done" payload (metadata, context, language).
+    // Rejects with `error.transport` set only when the stream could not be opened.
+    async function streamReply(payload) {
+        let response;
+        try {
+            response = await fetch(STREAM_URL, {
+                method: "POST",
+                headers: { "Content-Type": "application/json", "Accept": "text/event-stream" },
+                body: JSON.stringify(payload),
+            });
         } catch (error) {
-            console.error("Error:", error);
-            hideTypingIndicator();
-            addMessageToChat("Sorry, I'm having trouble connecting. Please try again.", "bot-message");
+            throw transportError(`Streaming request failed: ${error.message}`);
+        }
+
+        if (response.status === 429) {
+            const data = await response.json().catch(() => ({}));
+            throw serverError(data.error || "Too many requests.", data.retry_after || response.headers.get("Retry-After"));
+        }
+        const contentType = response.headers.get("Content-Type") || "";
+        if (!response.ok || !response.body || !contentType.includes("text/event-stream")) {
+            throw transportError(`Streaming response was not usable (status ${response.status}).`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        let replyText = "";
+        let messageCopy = null;
+
+        try {
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+
+                let boundary;
+                while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+                    const frame = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    const { event, data } = parseEvent(frame);
+
+                    if (event === "token") {
+                        if (!messageCopy) {
+                            hideTypingIndicator();
+                            messageCopy = addMessageToChat("", "bot-message");
+                        }
+                        replyText += data.text;
+                        messageCopy.innerText = replyText;
+                        messageCopy.scrollIntoView({ behavior: "smooth", block: "end" });
+                    } else if (event === "error") {
+                        throw serverError(data.error || "Something went wrong.", data.retry_after);
+                    } else if (event === "done") {
+                        return data;
+                    }
+                }
+            }
+            throw new Error("Stream ended before completion.");
         } finally {
-            sendButton.disabled = false;
-            messageInput.focus();
+            reader.releaseLock();
         }
     }
 
+    async function fetchReply(payload) {
+        const response = await fetch(API_URL, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(payload),
+        });
+
+        if (!response.ok) {
+            throw new Error("Network response was not ok.");
+        }
+
+        const data = await response.json();
+
+        hideTypingIndicator();
+        addMessageToChat(data.message, "bot-message");
+        return data;
+    }
+
+    function parseEvent(frame) {
+        let event = "message";
+        let data = "";
+        frame.split("\n").forEach((line) => {
+            if (line.startsWith("event:")) {
+                event = line.slice(6).trim();
+            } else if (line.startsWith("data:")) {
+                data += line.slice(5).trim();
+            }
+        });
+        return { event, data: data ? JSON.parse(data) : {} };
+    }
+
     function addMessageToChat(message, className) {
         const messageElement = document.createElement("div");
         messageElement.classList.add("message", className, "animate-slide-in");
@@ -100,6 +217,7 @@ document.addEventListener("DOMContentLoaded", () => {
 
         chatWindow.appendChild(messageElement);
         messageElement.scrollIntoView({ behavior: "smooth", block: "end" });
+        return messageCopy;
     }
 
     function showTypingIndicator() {
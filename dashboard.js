@@ -48,7 +48,7 @@ function createOutbreakChart(alerts) {
         data: {
             labels: labels,
             datasets: [{
-                label: 'Active Cases (Sample Data)',
+                label: 'Reported Cases (Simulated Data)',
                 data: data,
                 backgroundColor: [
                     'rgba(255, 99, 132, 0.6)',
@@ -0,0 +1,9 @@
+const rawApiBase = import.meta.env.VITE_API_BASE_URL || "";
+
+// Empty when the API is served from the same origin as the frontend.
+export const API_BASE_URL = rawApiBase.replace(/\/$/, "");
+
+// Prefix a root-relative backend path such as "/api/chat" with the configured API origin.
+export function apiUrl(path) {
+    return `${API_BASE_URL}${path}`;
+}
@@ -1,4 +1,5 @@
-import { createContext, useContext, useMemo, useState } from "react";
+import { createContext, useContext, useEffect, useMemo, useState } from "react";
+import { formatMessage, loadCatalog } from "../i18n/catalog.js";
 import { messages } from "../i18n/messages.js";
 
 const LanguageContext = createContext({
@@ -6,7 +7,8 @@ const LanguageContext = createContext({
     setLanguage: () => { },
     languages: [],
     dictionary: messages.en,
-    t: () => ""
+    t: () => "",
+    formatBotMessage: (_id, _params, fallback = "") => fallback
 });
 
 const messageEntries = Object.entries(messages);
@@ -22,6 +24,21 @@ function getFromDictionary(dictionary, path) {
 
 export function LanguageProvider({ children }) {
     const [language, setLanguage] = useState("en");
+    const [botMessages, setBotMessages] = useState({});
+
+    useEffect(() => {
+        let cancelled = false;
+        loadCatalog(language)
+            .then((catalog) => {
+                if (!cancelled) {
+                    setBotMessages(catalog);
+                }
+            })
+            .catch((error) => console.error(error));
+        return () => {
+            cancelled = true;
+        };
+    }, [language]);
 
     const languages = useMemo(
         () =>
@@ -40,10 +57,12 @@ export function LanguageProvider({ children }) {
                 setLanguage,
                 languages,
                 dictionary,
-                t: (path) => getFromDictionary(dictionary, path)
+                t: (path) => getFromDictionary(dictionary, path),
+                formatBotMessage: (id, params, fallback = "") =>
+                    id && botMessages[id] ? formatMessage(botMessages[id], params) : fallback
             };
         },
-        [language, languages]
+        [language, languages, botMessages]
     );
 
     return <LanguageContext.Provider value={value}>{children}</LanguageContext.Provider>;
@@ -0,0 +1,45 @@
+// Bot messages shared with the backend. The backend serves one bundle per
+// language from /api/messages; bundle URLs carry the catalog version, so the
+// browser caches them until the catalog changes.
+
+import { apiUrl } from "../api.js";
+
+let manifestPromise = null;
+
+function loadManifest() {
+    if (!manifestPromise) {
+        manifestPromise = fetch(apiUrl("/api/messages"))
+            .then((response) => {
+                if (!response.ok) {
+                    throw new Error(`Failed to load message catalog (${response.status})`);
+                }
+                return response.json();
+            })
+            .catch((error) => {
+                manifestPromise = null;
+                throw error;
+            });
+    }
+    return manifestPromise;
+}
+
+export async function loadCatalog(language) {
+    const manifest = await loadManifest();
+    const url = manifest.bundles[language] ?? manifest.bundles.en;
+    // Bundle URLs are root-relative to the API, which may live on another origin.
+    const response = await fetch(apiUrl(url));
+    if (!response.ok) {
+        throw new Error(`Failed to load ${language} messages (${response.status})`);
+    }
+    const bundle = await response.json();
+    return bundle.messages;
+}
+
+// Same "{name}" interpolation as the backend catalog; "{{" and "}}" are literal braces.
+export function formatMessage(template, params = {}) {
+    return template.replace(/\{\{|\}\}|\{(\w+)\}/g, (match, name) => {
+        if (match === "{{") return "{";
+        if (match === "}}") return "}";
+        return name in params ? String(params[name]) : match;
+    });
+}
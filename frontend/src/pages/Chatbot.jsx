@@ -3,42 +3,32 @@ import clsx from "clsx";
 import { Send, Loader2, MessageCircle } from "lucide-react";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
+import { apiUrl } from "../api.js";
 import { useLanguage } from "../context/LanguageContext.jsx";
 
-const rawApiBase = import.meta.env.VITE_API_BASE_URL || "";
-const API_BASE_URL = rawApiBase.replace(/\/$/, "");
+// Bot messages with a catalog id are rendered in the current language; `text` is the fallback
+// shown when the catalog has not loaded (or failed to), so the greeting keeps a local copy.
+const createWelcomeMessage = (text) => ({ id: "welcome", role: "bot", messageId: "chat.greeting", text });
 
 function Chatbot() {
-    const { language, dictionary } = useLanguage();
+    const { language, dictionary, formatBotMessage } = useLanguage();
     const chatContent = dictionary.chat;
 
-    const [messages, setMessages] = useState(() => [
-        {
-            id: "welcome",
-            role: "bot",
-            text: chatContent.initialMessage
-        }
-    ]);
+    const [messages, setMessages] = useState(() => [createWelcomeMessage(chatContent.initialMessage)]);
     const [inputValue, setInputValue] = useState("");
     const [isSending, setIsSending] = useState(false);
-    const [chatContext, setChatContext] = useState(null);
+    const [sessionId, setSessionId] = useState(null);
     const [showQuickSuggestions, setShowQuickSuggestions] = useState(true);
     const scrollAnchorRef = useRef(null);
 
-    const chatEndpoint = API_BASE_URL ? `${API_BASE_URL}/api/chat` : "/api/chat";
+    const chatEndpoint = apiUrl("/api/chat");
 
     useEffect(() => {
-        setMessages([
-            {
-                id: "welcome",
-                role: "bot",
-                text: dictionary.chat.initialMessage
-            }
-        ]);
-        setChatContext(null);
+        setMessages([createWelcomeMessage(chatContent.initialMessage)]);
+        setSessionId(null);
         setInputValue("");
         setShowQuickSuggestions(true);
-    }, [dictionary.chat.initialMessage]);
+    }, [language, chatContent.initialMessage]);
 
     const sendMessage = useCallback(
         async (messageText) => {
@@ -64,7 +54,7 @@ function Chatbot() {
                     headers: { "Content-Type": "application/json" },
                     body: JSON.stringify({
                         message: trimmed,
-                        context: chatContext,
+                        session_id: sessionId,
                         language
                     })
                 });
@@ -77,11 +67,13 @@ function Chatbot() {
                 const botMessage = {
                     id: crypto.randomUUID(),
                     role: "bot",
+                    messageId: data.metadata?.message_id,
+                    params: data.metadata?.message_params,
                     text: data.message
                 };
 
                 setMessages((prev) => [...prev, botMessage]);
-                setChatContext(data.metadata?.context ?? null);
+                setSessionId(data.session_id ?? null);
             } catch (error) {
                 console.error("Error sending message", error);
                 setMessages((prev) => [
@@ -99,7 +91,7 @@ function Chatbot() {
                 });
             }
         },
-        [chatEndpoint, chatContext, dictionary.chat.errorMessage, isSending, language]
+        [chatEndpoint, sessionId, dictionary.chat.errorMessage, isSending, language]
     );
 
     const handleSend = useCallback(
@@ -142,9 +134,10 @@ function Chatbot() {
                             </div>
                         ) : null}
 
-                        {messages.map((message) => (
-                            <MessageBubble key={message.id} role={message.role} text={message.text} />
-                        ))}
+                        {messages.map((message) => {
+                            const text = formatBotMessage(message.messageId, message.params, message.text);
+                            return text ? <MessageBubble key={message.id} role={message.role} text={text} /> : null;
+                        })}
 
                         {isSending ? (
                             <div
@@ -153,7 +146,7 @@ function Chatbot() {
                                 aria-busy="true"
                             >
                                 <Loader2 className="h-4 w-4 animate-spin" />
-                                <span>{chatContent.sendingIndicator}</span>
+                                <span>{formatBotMessage("chat.thinking", undefined, chatContent.sendingIndicator)}</span>
                             </div>
                         ) : null}
                         <span ref={scrollAnchorRef} aria-hidden="true" />